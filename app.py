@@ -4,24 +4,31 @@ Mundialista AI — Streamlit Web Interface v2.1
 Fixed: cloud-safe paths, merged H2H, knockout mode, improved card simulation
 """
 
-import matplotlib
-matplotlib.use("Agg")
-
-import math
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 import streamlit as st
 
-from prediction_engine import predict, get_all_teams, get_team_ranking, clean_match_type
+import memory_report
+import metrics
+from prediction_engine import (
+    predict, get_all_teams, get_team_ranking, clean_match_type,
+    simulate_knockout, data_fingerprint, _data,
+)
 from content_automation import WC2026_GROUPS, resolve_team_name, display_name
-from chart_generator import generate_all_charts
+from prediction_cube import load_cube
+from tournament import price_group, run_tournament
+from warmup import start_warmup
 
 BASE_DIR = Path(__file__).parent
 DATA_DIR = BASE_DIR / "data"
 
+MC_PRECISION_OPTIONS = [0.25, 0.5, 1.0, 2.0]
+DEFAULT_MC_PRECISION = 0.5
+
 st.set_page_config(
     page_title="Mundialista AI",
     page_icon="⚽",
@@ -391,85 +398,110 @@ border-radius: 0 10px 10px 0;
 </style>
 """, unsafe_allow_html=True)
 
-@st.cache_data(ttl=300)
-def get_team_list():
-    try:
-        rankings = pd.read_csv(DATA_DIR / "rankings.csv")
-        if "country_full" in rankings.columns:
-            return sorted(rankings["country_full"].dropna().unique().tolist())
-    except FileNotFoundError:
-        pass
+@st.cache_resource
+def get_data_store(data_version):
+    """
+    The engine's DataStore, loaded once and shared by every session.
+    A new data_version (data files touched) drops the old frames.
+    """
+    warm = get_warmup()
+    warm.wait("data")
+    if data_version != warm.data_version:
+        _data.clear_cache()
+        _ = _data.results, _data.rankings
+    return _data
+
+def data_version():
+    """Fingerprint of the data files (mtime + size) and engine config."""
+    return data_fingerprint()
+
+@st.cache_data(show_spinner=False)
+def get_team_list(version):
+    rankings = get_data_store(version).rankings
+    if "country_full" in rankings.columns:
+        return sorted(rankings["country_full"].dropna().unique().tolist())
     return get_all_teams()
 
+@st.cache_data(show_spinner="Running the model...", max_entries=2048)
+def cached_predict(team_a, team_b, home, mc_tolerance, version):
+    get_data_store(version)
+    warm = get_warmup()
+    if version == warm.data_version:
+        result = warm.prediction(team_a, team_b, home, mc_tolerance)
+        if result is not None:
+            return result
+    return predict(team_a, team_b, home=home, mc_tolerance=mc_tolerance)
+
+def render_charts(result, team_a, team_b):
+    """Charts are the only matplotlib user; import it on the first render."""
+    import matplotlib
+    matplotlib.use("Agg")
+    from chart_generator import generate_all_charts
+    return generate_all_charts(result, team_a, team_b)
+
+@st.cache_data(show_spinner=False, max_entries=2048)
+def cached_h2h(team_a, team_b, version):
+    get_data_store(version)
+    return compute_h2h(team_a, team_b)
+
+@st.cache_resource(max_entries=1)
+def get_prediction_cube(version):
+    """
+    Pairwise cube shared by every session (memory-mapped, built if stale).
+    Keyed by data version like get_data_store, so new data means a new cube.
+    """
+    get_data_store(version)
+    return load_cube()
+
+@st.cache_resource
+def get_sim_executor():
+    """Thread pool shared by every session for group/tournament pricing."""
+    return ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+
+@st.cache_resource
+def get_warmup():
+    """Background warm-up (data + 72 group fixtures), started once per process."""
+    # Own small pool so user-triggered group/tournament runs never queue behind it
+    return start_warmup(mc_tolerance=DEFAULT_MC_PRECISION / 100.0)
+
+# Start loading now; the page renders while the pool works
+get_warmup()
+# Optional /metrics endpoint or JSON snapshots (MUNDIALISTA_METRICS_*; once per process)
+metrics.start_from_env()
+metrics.gauge("mundialista_streamlit_cache_bytes", "Streamlit cache and session_state memory",
+              ("cache",), fn=memory_report.streamlit_usage)
+
 def load_results_merged():
-    frames = []
-    for path in [DATA_DIR / "results.csv", DATA_DIR / "recent_results.csv"]:
-        if path.exists():
-            try:
-                df = pd.read_csv(path)
-                if not df.empty:
-                    frames.append(df)
-            except Exception:
-                pass
-    if not frames:
+    """Merged results (results.csv + recent_results.csv), newest first."""
+    df = get_data_store(data_version()).results
+    if df.empty:
         return pd.DataFrame(columns=["date","home_team","away_team","home_score","away_score","tournament","neutral"])
-    df = pd.concat(frames, ignore_index=True, sort=False)
-    df["date"] = pd.to_datetime(df["date"], errors="coerce")
-    return df.sort_values("date", ascending=False)
+    # DataStore keeps the frame sorted oldest-first; a reversed view is free
+    return df.iloc[::-1]
 
 def compute_h2h(team_a, team_b, max_matches=20):
-    df = load_results_merged()
-    if df.empty:
-        return {"matches": 0}
-    mask = (
-        ((df["home_team"] == team_a) & (df["away_team"] == team_b)) |
-        ((df["home_team"] == team_b) & (df["away_team"] == team_a))
-    )
-    h2h = df[mask].head(max_matches)
-    if h2h.empty:
+    store = get_data_store(data_version())
+    rec = store.h2h.lookup(team_a, team_b, last_n=max_matches)
+    if rec["matches"] == 0:
         return {"matches": 0}
 
-    wins_a = wins_b = draws = 0
     recent = []
-
-    for _, row in h2h.iterrows():
-        hs_raw = row.get("home_score", 0)
-        aws_raw = row.get("away_score", 0)
-
-        hs = 0 if pd.isna(hs_raw) else int(hs_raw)
-        aws = 0 if pd.isna(aws_raw) else int(aws_raw)
-
-        ht = row.get("home_team", "")
-        at = row.get("away_team", "")
-
-        if hs > aws:
-            winner = ht
-        elif aws > hs:
-            winner = at
-        else:
-            winner = None
-
-        if winner == team_a:
-            wins_a += 1
-        elif winner == team_b:
-            wins_b += 1
-        else:
-            draws += 1
-
-        if len(recent) < 5:
-            recent.append({
-                "date": str(row.get("date", ""))[:10],
-                "home": ht,
-                "away": at,
-                "score": f"{hs}-{aws}",
-                "tournament": row.get("tournament", ""),
-            })
+    for _, row in store.results.iloc[rec["rows"][::-1][:5]].iterrows():
+        hs = int(row["home_score"])
+        aws = int(row["away_score"])
+        recent.append({
+            "date": str(row.get("date", ""))[:10],
+            "home": row.get("home_team", ""),
+            "away": row.get("away_team", ""),
+            "score": f"{hs}-{aws}",
+            "tournament": row.get("tournament", ""),
+        })
 
     return {
-        "matches": len(h2h),
-        "wins_a": wins_a,
-        "wins_b": wins_b,
-        "draws": draws,
+        "matches": rec["matches"],
+        "wins_a": rec["wins_a"],
+        "wins_b": rec["wins_b"],
+        "draws": rec["draws"],
         "recent": recent,
     }
 
@@ -486,83 +518,6 @@ def safe_json(result):
             clean[k] = v
     return clean
 
-def poisson_pmf(k, lam):
-    if lam < 0:
-        lam = 0.0
-    return math.exp(-lam) * (lam ** k) / math.factorial(k)
-
-def et_outcome_probs(lambda_a, lambda_b, max_goals=10, et_scale=0.28):
-    la = max(0.0, lambda_a * et_scale)
-    lb = max(0.0, lambda_b * et_scale)
-    a_win = draw = b_win = 0.0
-    for ga in range(max_goals + 1):
-        pga = poisson_pmf(ga, la)
-        for gb in range(max_goals + 1):
-            p = pga * poisson_pmf(gb, lb)
-            if ga > gb:
-                a_win += p
-            elif ga < gb:
-                b_win += p
-            else:
-                draw += p
-    total = a_win + draw + b_win
-    if total > 0:
-        a_win /= total
-        draw /= total
-        b_win /= total
-    return {
-        "a_win_et_cond": a_win,
-        "draw_et_cond": draw,
-        "b_win_et_cond": b_win,
-        "lambda_a_et": la,
-        "lambda_b_et": lb,
-    }
-
-def penalty_shootout_probs(team_a, team_b, result):
-    rank_a = float(result.get("team_a_rank", 100))
-    rank_b = float(result.get("team_b_rank", 100))
-    rank_edge = (rank_b - rank_a) / 100.0
-    boost_a = float(result.get("team_a_star_boost", 1.0))
-    boost_b = float(result.get("team_b_star_boost", 1.0))
-    def_a = float(result.get("team_a_def_boost", 1.0))
-    def_b = float(result.get("team_b_def_boost", 1.0))
-    star_edge = (boost_a - boost_b) * 0.25
-    keeper_edge = (def_a - def_b) * 0.20
-    p_a = 0.50 + 0.12 * rank_edge + star_edge + keeper_edge
-    p_a = float(np.clip(p_a, 0.40, 0.60))
-    return {"a_pen_win_cond": p_a, "b_pen_win_cond": 1.0 - p_a}
-
-def simulate_knockout(team_a, team_b, result):
-    a90 = float(result.get("team_a_win", 0.0)) / 100.0
-    d90 = float(result.get("draw", 0.0)) / 100.0
-    b90 = float(result.get("team_b_win", 0.0)) / 100.0
-    la = float(result.get("team_a_lambda", 0.0))
-    lb = float(result.get("team_b_lambda", 0.0))
-
-    et = et_outcome_probs(la, lb)
-    pens = penalty_shootout_probs(team_a, team_b, result)
-
-    a_win_90 = a90
-    b_win_90 = b90
-    a_win_et = d90 * et["a_win_et_cond"]
-    b_win_et = d90 * et["b_win_et_cond"]
-    a_win_pens = d90 * et["draw_et_cond"] * pens["a_pen_win_cond"]
-    b_win_pens = d90 * et["draw_et_cond"] * pens["b_pen_win_cond"]
-
-    return {
-        "team_a_advance": round((a_win_90 + a_win_et + a_win_pens) * 100, 1),
-        "team_b_advance": round((b_win_90 + b_win_et + b_win_pens) * 100, 1),
-        "team_a_win_90": round(a_win_90 * 100, 1),
-        "team_b_win_90": round(b_win_90 * 100, 1),
-        "team_a_win_et": round(a_win_et * 100, 1),
-        "team_b_win_et": round(b_win_et * 100, 1),
-        "team_a_win_pens": round(a_win_pens * 100, 1),
-        "team_b_win_pens": round(b_win_pens * 100, 1),
-        "draw_after_90": round(d90 * 100, 1),
-        "team_a_et_lambda": round(et["lambda_a_et"], 3),
-        "team_b_et_lambda": round(et["lambda_b_et"], 3),
-    }
-
 def compute_card_risk(team_a, team_b, result, knockout=False):
     a_win = float(result.get("team_a_win", 33.3))
     b_win = float(result.get("team_b_win", 33.3))
@@ -766,12 +721,12 @@ def build_simple_insight(result, team_a, team_b, knockout=False, ko_data=None):
     return " ".join(lines)
 
 
-@st.cache_data(ttl=300)
-def get_underdog_candidates():
+@st.cache_data(show_spinner=False)
+def get_underdog_candidates(version):
     fallback = ["Panama", "Jamaica", "Georgia", "Cape Verde", "Uzbekistan"]
 
     try:
-        rankings = pd.read_csv(DATA_DIR / "rankings.csv")
+        rankings = get_data_store(version).rankings
         if rankings.empty or "country_full" not in rankings.columns:
             return fallback
 
@@ -845,7 +800,7 @@ If the bracket bends, if momentum catches fire, and if one big night changes the
 def render_underdog_spotlight():
     st.markdown("### 🌟 UNDERDOG OF THE WEEK — VHS SPOTLIGHT")
 
-    underdogs = get_underdog_candidates()
+    underdogs = get_underdog_candidates(data_version())
     if not underdogs:
         st.info("No underdog candidates available.")
         return
@@ -899,7 +854,7 @@ def render_underdog_spotlight():
 st.title("⚽ Mundialista MI")
 st.caption("World Cup 2026 Match Intelligence")
 
-teams = get_team_list()
+teams = get_team_list(data_version())
 if not teams:
     st.error("No team data found. Run python get_data.py first.")
     st.stop()
@@ -914,6 +869,12 @@ with col2:
 with col3:
     neutral = st.checkbox("Neutral venue", value=True)
     knockout = st.checkbox("Knockout match", value=False)
+    mc_precision = st.selectbox(
+        "Simulation precision",
+        MC_PRECISION_OPTIONS,
+        index=MC_PRECISION_OPTIONS.index(DEFAULT_MC_PRECISION),
+        format_func=lambda v: f"±{v}% (95% CI)",
+    )
 
 run_prediction = st.button("⚽ Generate Prediction")
 
@@ -922,10 +883,13 @@ if run_prediction:
         st.warning("Choose two different teams.")
     else:
         home = None if neutral else team_a
-        result = predict(team_a, team_b, home=home)
-        charts = generate_all_charts(result, team_a, team_b)
-        h2h = compute_h2h(team_a, team_b)
-        ko_data = simulate_knockout(team_a, team_b, result) if knockout else None
+        mc_tol = mc_precision / 100.0
+        version = data_version()
+        result = cached_predict(team_a, team_b, home, mc_tol, version)
+        get_warmup().record_first_prediction()
+        charts = render_charts(result, team_a, team_b)
+        h2h = cached_h2h(team_a, team_b, version)
+        ko_data = simulate_knockout(team_a, team_b, result, mc_tolerance=mc_tol) if knockout else None
         card_data = compute_card_risk(team_a, team_b, result, knockout=knockout)
 
         st.session_state["result"] = result
@@ -975,6 +939,12 @@ if "result" in st.session_state:
         st.metric("Draw", f"{dr:.1f}%")
     with c3:
         st.metric(f"{db} Win", f"{wb:.1f}%")
+    if "sim_precision" in result:
+        st.caption(
+            f"Monte Carlo check: {result.get('sim_team_a_win', 0):.1f}% / "
+            f"{result.get('sim_draw', 0):.1f}% / {result.get('sim_team_b_win', 0):.1f}% "
+            f"(±{result['sim_precision']:.2f} pts, {result.get('n_simulations', 0):,} sims)"
+        )
 
     st.markdown("### ⚽ Expected Goals")
     gx1, gx2 = st.columns(2)
@@ -1083,6 +1053,12 @@ if "result" in st.session_state:
             st.metric(f"{db} Win in 90", f"{ko_data.get('team_b_win_90', 0):.1f}%")
             st.metric(f"{db} Win in ET", f"{ko_data.get('team_b_win_et', 0):.1f}%")
             st.metric(f"{db} Win on Pens", f"{ko_data.get('team_b_win_pens', 0):.1f}%")
+        if "sim_precision" in ko_data:
+            st.caption(
+                f"Monte Carlo check: {da} {ko_data['sim_team_a_advance']:.1f}% / "
+                f"{db} {ko_data['sim_team_b_advance']:.1f}% "
+                f"(±{ko_data['sim_precision']:.2f} pts, {ko_data['sim_n']:,} sims)"
+            )
 
     st.markdown("### ⚔️ Head-to-Head")
     if h2h.get("matches", 0) == 0:
@@ -1148,7 +1124,7 @@ st.markdown("---")
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 st.markdown("## 🏆 World Cup 2026 — Group Stage Simulator")
-st.caption("48 teams • 12 groups • Dixon-Coles Poisson engine • 10,200 simulations per match")
+st.caption("48 teams • 12 groups • Dixon-Coles Poisson engine • precomputed pairwise cube")
 
 group_tab_labels = [f"Group {g}" for g in sorted(WC2026_GROUPS.keys())]
 group_tabs = st.tabs(group_tab_labels)
@@ -1166,95 +1142,10 @@ for tab, group_letter in zip(group_tabs, sorted(WC2026_GROUPS.keys())):
         session_key = f"group_result_{group_letter}"
 
         if run_group:
-            points = {t: 0.0 for t in display_teams}
-            gd = {t: 0.0 for t in display_teams}
-            gf_tot = {t: 0.0 for t in display_teams}
-            ga_tot = {t: 0.0 for t in display_teams}
-            match_results = []
-
-            progress = st.progress(0)
-            total_matches = len(display_teams) * (len(display_teams) - 1) // 2
-            match_count = 0
-
-            for i in range(len(display_teams)):
-                for j in range(i + 1, len(display_teams)):
-                    h_display = display_teams[i]
-                    a_display = display_teams[j]
-                    h_data = data_teams[i]
-                    a_data = data_teams[j]
-
-                    try:
-                        result_match = predict(h_data, a_data, home=None)
-                    except Exception as e:
-                        st.warning(f"Could not predict {h_display} vs {a_display}: {e}")
-                        match_count += 1
-                        progress.progress(match_count / total_matches)
-                        continue
-
-                    hw = float(result_match.get("team_a_win", 33.3))
-                    dr = float(result_match.get("draw", 33.4))
-                    aw = float(result_match.get("team_b_win", 33.3))
-                    hxg = float(result_match.get("team_a_lambda", 1.0))
-                    axg = float(result_match.get("team_b_lambda", 1.0))
-
-                    # Coaches data
-                    h_coach = result_match.get("team_a_coach", "Unknown")
-                    a_coach = result_match.get("team_b_coach", "Unknown")
-                    h_coach_tier = result_match.get("team_a_coach_tier", "N/A")
-                    a_coach_tier = result_match.get("team_b_coach_tier", "N/A")
-
-                    top_scores = result_match.get("top_scores", [])
-                    top_score_str = str(top_scores[0][0]) if top_scores else "N/A"
-                    top_score_pct = top_scores[0][1] if top_scores else 0
-
-                    hw_frac = hw / 100
-                    dr_frac = dr / 100
-                    aw_frac = aw / 100
-
-                    points[h_display] += hw_frac * 3 + dr_frac * 1
-                    points[a_display] += aw_frac * 3 + dr_frac * 1
-                    gd[h_display] += hxg - axg
-                    gd[a_display] += axg - hxg
-                    gf_tot[h_display] += hxg
-                    gf_tot[a_display] += axg
-                    ga_tot[h_display] += axg
-                    ga_tot[a_display] += hxg
-
-                    match_results.append({
-                        "home": h_display,
-                        "away": a_display,
-                        "home_win": hw,
-                        "draw": dr,
-                        "away_win": aw,
-                        "home_xg": hxg,
-                        "away_xg": axg,
-                        "top_score": top_score_str,
-                        "top_score_pct": top_score_pct,
-                        "home_coach": h_coach,
-                        "away_coach": a_coach,
-                        "home_coach_tier": h_coach_tier,
-                        "away_coach_tier": a_coach_tier,
-                    })
-
-                    match_count += 1
-                    progress.progress(match_count / total_matches)
-
-            progress.empty()
-
-            standings = sorted(
-                display_teams,
-                key=lambda t: (points[t], gd[t], gf_tot[t]),
-                reverse=True,
-            )
-
-            st.session_state[session_key] = {
-                "standings": standings,
-                "points": points,
-                "gd": gd,
-                "gf": gf_tot,
-                "ga": ga_tot,
-                "matches": match_results,
-            }
+            try:
+                st.session_state[session_key] = price_group(get_prediction_cube(data_version()), group_letter)
+            except Exception as e:
+                st.warning(f"Could not simulate Group {group_letter}: {e}")
 
         if session_key in st.session_state:
             data = st.session_state[session_key]
@@ -1319,5 +1210,45 @@ for tab, group_letter in zip(group_tabs, sorted(WC2026_GROUPS.keys())):
             st.warning(f"**Best 3rd chance:** {standings[2]} ({pts[standings[2]]:.1f} pts)")
             st.error(f"**Eliminated:** {standings[3]} ({pts[standings[3]]:.1f} pts)")
 
+st.markdown("### 🌍 Full Tournament")
+run_tournament_btn = st.button("🏆 Simulate full tournament", key="full_tournament")
+
+if run_tournament_btn:
+    groups_box = st.container()
+    knockout_box = st.container()
+    progress = st.progress(0)
+    n_steps = len(WC2026_GROUPS) + 5
+    done = 0
+    champion = None
+
+    for stage, name, payload in run_tournament(get_prediction_cube(data_version()), get_sim_executor()):
+        done += 1
+        progress.progress(done / n_steps)
+        if stage == "group":
+            # Also fills the group tabs above on the next rerun
+            st.session_state[f"group_result_{name}"] = payload
+            s1, s2 = payload["standings"][:2]
+            groups_box.markdown(f"**Group {name}:** {s1} • {s2}")
+            continue
+
+        knockout_box.markdown(f"#### {name}")
+        knockout_box.dataframe(
+            pd.DataFrame([{
+                "Tie": f"{t['team_a']} vs {t['team_b']}",
+                "Advance A": f"{t['team_a_advance']:.1f}%",
+                "Advance B": f"{t['team_b_advance']:.1f}%",
+                "Pens": f"{t['penalties']:.1f}%",
+                "Likely score": t["top_score"],
+                "Through": t["winner"],
+            } for t in payload]),
+            use_container_width=True,
+            hide_index=True,
+        )
+        champion = payload[-1]["winner"]
+
+    progress.empty()
+    if champion:
+        st.success(f"🏆 Predicted champion: **{champion}**")
+
 st.markdown("---")
 render_underdog_spotlight()
\ No newline at end of file
@@ -0,0 +1,199 @@
+"""
+Mundialista AI - Batch Report Generator
+Predicts a list of fixtures and writes the full chart + HTML report for each,
+plus an index.html linking them all.
+
+Each worker process imports matplotlib once, builds the five chart figures
+once (chart_generator.FigureTemplates) and only updates bars, image data and
+text per fixture, so a batch never re-creates figures. With --svg the reports
+carry inline vector charts instead (html_report) and matplotlib is never
+loaded.
+
+Memory stays bounded: at most 2 x workers fixtures are in flight, workers
+send back one summary row (not the prediction), and are recycled every
+MAX_TASKS_PER_CHILD fixtures.
+
+Fixture CSV columns: team_a, team_b[, home]  (dataset team names)
+
+Usage:
+    python batch_report.py --fixtures fixtures.csv
+    python batch_report.py --groups --out predictions_output/groups --workers 2
+    python batch_report.py --groups --svg
+"""
+
+import argparse
+import csv
+import html
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+DEFAULT_OUT = Path("predictions_output") / "batch"
+MAX_TASKS_PER_CHILD = 200
+
+_TEMPLATES = None
+
+
+def read_fixtures(path) -> list:
+    """[(team_a, team_b, home)] from a CSV with team_a, team_b[, home] columns."""
+    fixtures = []
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        for row in csv.DictReader(f):
+            team_a = (row.get("team_a") or "").strip()
+            team_b = (row.get("team_b") or "").strip()
+            if team_a and team_b:
+                fixtures.append((team_a, team_b, (row.get("home") or "").strip() or None))
+    return fixtures
+
+
+def render_fixture(team_a: str, team_b: str, home: str, out_dir: str,
+                   mc_tolerance: float = None, svg: bool = False) -> dict:
+    """Predict one fixture, render its charts and report; return an index row."""
+    global _TEMPLATES
+    from html_report import generate_html_report
+    from prediction_engine import predict
+
+    result = predict(team_a, team_b, home=home, mc_tolerance=mc_tolerance)
+    chart_paths = None
+    if not svg:
+        from chart_generator import FigureTemplates, chart_payload
+
+        if _TEMPLATES is None:
+            _TEMPLATES = FigureTemplates()
+        chart_paths = _TEMPLATES.render(chart_payload(result), team_a, team_b, out_dir)
+    report = generate_html_report(result, team_a, team_b, chart_paths, out_dir)
+    top = result.get("top_scores") or [("-", 0)]
+    return {
+        "team_a": team_a,
+        "team_b": team_b,
+        "home": home,
+        "team_a_win": result["team_a_win"],
+        "draw": result["draw"],
+        "team_b_win": result["team_b_win"],
+        "top_score": str(top[0][0]),
+        "report": os.path.basename(report),
+    }
+
+
+def run_batch(fixtures: list, out_dir=DEFAULT_OUT, workers: int = None,
+              mc_tolerance: float = None, svg: bool = False):
+    """
+    Render every fixture on a process pool, yielding index rows as they finish.
+
+    A failing fixture yields a row with an "error" key instead of stopping the batch.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    workers = workers or max(1, (os.cpu_count() or 1) - 1)
+    window = 2 * workers
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        max_tasks_per_child=MAX_TASKS_PER_CHILD,
+    ) as pool:
+        pending = {}
+        queue = iter(fixtures)
+        while True:
+            for team_a, team_b, home in queue:
+                fut = pool.submit(render_fixture, team_a, team_b, home, str(out_dir), mc_tolerance, svg)
+                pending[fut] = (team_a, team_b, home)
+                if len(pending) >= window:
+                    break
+            if not pending:
+                return
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                team_a, team_b, home = pending.pop(fut)
+                try:
+                    yield fut.result()
+                except Exception as e:
+                    yield {"team_a": team_a, "team_b": team_b, "home": home, "error": str(e)}
+
+
+def write_index(rows: list, out_dir=DEFAULT_OUT) -> str:
+    """index.html: one line per fixture, linking its report."""
+    body = []
+    for r in rows:
+        match = f"{html.escape(r['team_a'])} vs {html.escape(r['team_b'])}"
+        if "error" in r:
+            body.append(f'<tr class="err"><td>{match}</td><td colspan="4">{html.escape(r["error"])}</td></tr>')
+            continue
+        body.append(
+            f'<tr><td><a href="{html.escape(r["report"])}">{match}</a></td>'
+            f'<td>{r["team_a_win"]:.1f}%</td><td>{r["draw"]:.1f}%</td><td>{r["team_b_win"]:.1f}%</td>'
+            f'<td>{html.escape(r["top_score"])}</td></tr>'
+        )
+    page = f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<title>Mundialista AI - Batch Reports</title>
+<style>
+body {{ font-family: Inter, Segoe UI, Arial, sans-serif; background: #FAF8F2; color: #222; margin: 32px; }}
+h1 {{ color: #0F5C4D; }}
+table {{ border-collapse: collapse; background: #fff; }}
+th, td {{ padding: 8px 14px; border-bottom: 1px solid #E7E3D8; text-align: left; }}
+th {{ color: #0F5C4D; }}
+a {{ color: #0B6B57; text-decoration: none; font-weight: 600; }}
+tr.err td {{ color: #A33; }}
+</style>
+</head>
+<body>
+<h1>Mundialista AI - Batch Reports</h1>
+<p>{len(rows)} fixtures</p>
+<table>
+<tr><th>Match</th><th>Team A win</th><th>Draw</th><th>Team B win</th><th>Top score</th></tr>
+{chr(10).join(body)}
+</table>
+</body>
+</html>
+'''
+    path = Path(out_dir) / "index.html"
+    path.write_text(page, encoding="utf-8")
+    return str(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render reports for a list of fixtures")
+    src = parser.add_mutually_exclusive_group(required=True)
+    src.add_argument("--fixtures", help="CSV with team_a, team_b[, home] columns")
+    src.add_argument("--groups", action="store_true", help="All 72 World Cup 2026 group fixtures")
+    parser.add_argument("--out", default=str(DEFAULT_OUT), help="Output directory")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPUs - 1)")
+    parser.add_argument("--mc-tolerance", type=float, default=None, help="Monte Carlo CI half-width")
+    parser.add_argument("--svg", action="store_true", help="Inline SVG charts instead of PNGs (no matplotlib)")
+    args = parser.parse_args()
+
+    if args.groups:
+        from warmup import group_fixtures
+        fixtures = [(a, b, None) for a, b in group_fixtures()]
+    else:
+        fixtures = read_fixtures(args.fixtures)
+    if not fixtures:
+        print("[ERROR] No fixtures to render.")
+        sys.exit(1)
+
+    from metrics import start_from_env
+
+    start_from_env()
+    t0 = time.perf_counter()
+    order = {(a, b, h): i for i, (a, b, h) in enumerate(fixtures)}
+    rows = []
+    for row in run_batch(fixtures, args.out, args.workers, args.mc_tolerance, args.svg):
+        rows.append(row)
+        status = f"ERROR {row['error']}" if "error" in row else row["report"]
+        print(f"  [{len(rows):>3}/{len(fixtures)}] {row['team_a']} vs {row['team_b']}: {status}")
+    rows.sort(key=lambda r: order[(r["team_a"], r["team_b"], r["home"])])
+
+    index = write_index(rows, args.out)
+    failed = sum("error" in r for r in rows)
+    print(f"\n[INFO] {len(rows) - failed}/{len(rows)} reports in {time.perf_counter() - t0:.1f}s -> {index}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
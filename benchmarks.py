@@ -0,0 +1,371 @@
+"""
+Mundialista AI - Benchmark Suite
+Times the engine hot paths on fixed fixtures and a fixed seed, writes the
+results as JSON and flags regressions against a stored baseline.
+
+Benchmarks (select with positional name filters):
+
+    datastore_cold_load      fresh DataStore: results, rankings, stars, global average
+    get_team_stats           form stats for one team
+    compute_lambdas          expected goals from precomputed team inputs
+    build_score_matrix       Dixon-Coles grid for fixed lambdas
+    simulate_matches         10,200 draws from a fixed matrix
+    predict                  full predict() for one fixture
+    predict_wc2026_group     one group, six fixtures
+    build_elo_rankings       ELO over the full results history
+    compute_team_ratings     opponent-strength ratings over one calendar year
+    build_star_players       star ratings from goalscorers.csv
+    generate_all_charts      five PNG charts + HTML report (serial, no cache)
+
+Fixtures never change between runs (FIXTURE, LAMBDAS, GROUP, RATINGS_WINDOW)
+and the RNG root seed is pinned to BENCH_SEED, so two runs on the same data
+do the same work. Timings are per call; the median is what gets compared.
+
+Usage:
+    python benchmarks.py                               # run all, print a table
+    python benchmarks.py predict simulate --repeat 10  # name filters
+    python benchmarks.py --json bench.json
+    python benchmarks.py --save-baseline               # store benchmarks_baseline.json
+    python benchmarks.py --compare                     # exit 1 on a regression
+    python benchmarks.py --compare --save-baseline     # compare, then roll the baseline
+
+--compare refuses (exit 2) a baseline recorded on a different data version:
+timings over a different results history are not comparable.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+BASELINE_PATH = ROOT / "benchmarks_baseline.json"
+
+BENCH_SEED = 20260611
+FIXTURE = ("Argentina", "France")
+LAMBDAS = (1.62, 1.08)
+GROUP = "C"
+RATINGS_WINDOW = ("2024-01-01", "2024-12-31")
+
+# Median slower than baseline by more than this share -> regression
+DEFAULT_THRESHOLD = 0.10
+# Differences below this are timer noise, whatever the ratio
+NOISE_FLOOR_MS = 0.005
+
+BENCHMARKS = {}
+
+
+def benchmark(name: str, repeat: int = 5, number: int = 1):
+    """
+    Register a benchmark. The decorated function does the setup (untimed)
+    and returns the zero-argument callable that is timed.
+    """
+    def register(setup):
+        BENCHMARKS[name] = {"setup": setup, "repeat": repeat, "number": number}
+        return setup
+    return register
+
+
+@contextlib.contextmanager
+def quiet():
+    """Swallow the progress prints and warnings of builders and loaders."""
+    with contextlib.redirect_stdout(io.StringIO()), warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        yield
+
+
+# ──────────────────────────────────────────────
+#  BENCHMARKS
+# ──────────────────────────────────────────────
+
+@benchmark("datastore_cold_load", repeat=5)
+def bench_datastore_cold_load():
+    from prediction_engine import DataStore
+
+    def run():
+        store = DataStore()
+        return store.results, store.rankings, store.stars, store.global_avg
+    return run
+
+
+@benchmark("get_team_stats", repeat=5, number=5)
+def bench_get_team_stats():
+    from prediction_engine import get_team_stats
+
+    return lambda: get_team_stats(FIXTURE[0])
+
+
+@benchmark("compute_lambdas", repeat=5, number=1000)
+def bench_compute_lambdas():
+    from prediction_engine import compute_lambdas, team_inputs
+
+    a, b = team_inputs(FIXTURE[0]), team_inputs(FIXTURE[1])
+    args = (FIXTURE[0], FIXTURE[1], a["stats"], b["stats"], a["rank"], b["rank"],
+            a["star"], b["star"], a["coach"], b["coach"])
+    return lambda: compute_lambdas(*args)
+
+
+@benchmark("build_score_matrix", repeat=5, number=1000)
+def bench_build_score_matrix():
+    from prediction_engine import build_score_matrix, choose_grid_size
+
+    max_g, _ = choose_grid_size(*LAMBDAS)
+    return lambda: build_score_matrix(*LAMBDAS, max_g)
+
+
+@benchmark("simulate_matches", repeat=5, number=20)
+def bench_simulate_matches():
+    from prediction_engine import CONFIG, ScorelineSampler, build_score_matrix, simulate_matches
+    from rng_streams import get_generator
+
+    matrix = build_score_matrix(*LAMBDAS)
+    sampler = ScorelineSampler(matrix)
+    n_sims = CONFIG["N_SIMULATIONS"]
+    return lambda: simulate_matches(matrix, n_sims, rng=get_generator("bench"), sampler=sampler)
+
+
+@benchmark("predict", repeat=5, number=3)
+def bench_predict():
+    from prediction_engine import predict
+
+    return lambda: predict(*FIXTURE)
+
+
+@benchmark("predict_wc2026_group", repeat=3)
+def bench_predict_wc2026_group():
+    from content_automation import predict_wc2026_group
+
+    return lambda: predict_wc2026_group(GROUP, verbose=False)
+
+
+@benchmark("build_elo_rankings", repeat=3)
+def bench_build_elo_rankings():
+    from update_rankings import build_elo_rankings
+
+    def run():
+        with quiet():
+            return build_elo_rankings()
+    return run
+
+
+@benchmark("compute_team_ratings", repeat=3)
+def bench_compute_team_ratings():
+    from prediction_engine import _data
+    from strength_adjust import compute_team_ratings
+
+    df = _data.results
+    start, end = RATINGS_WINDOW
+    window = df[(df["date"] >= start) & (df["date"] <= end)].dropna(subset=["home_score", "away_score"])
+    return lambda: compute_team_ratings(window)
+
+
+@benchmark("build_star_players", repeat=3)
+def bench_build_star_players():
+    from star_player_builder import build_star_players
+
+    def run():
+        # The builder reads data/ relative to the working directory
+        cwd = os.getcwd()
+        os.chdir(ROOT)
+        try:
+            return build_star_players(verbose=False)
+        finally:
+            os.chdir(cwd)
+    return run
+
+
+@benchmark("generate_all_charts", repeat=3)
+def bench_generate_all_charts():
+    import chart_generator
+    import html_report
+    from prediction_engine import predict
+
+    result = predict(*FIXTURE)
+    out_dir = Path(tempfile.mkdtemp(prefix="mundialista_bench_"))
+
+    def run():
+        # Render into a scratch directory, not the tracked predictions_output/
+        saved = chart_generator.OUTPUT_DIR, html_report.OUTPUT_DIR
+        chart_generator.OUTPUT_DIR = html_report.OUTPUT_DIR = out_dir
+        try:
+            return chart_generator.generate_all_charts(result, *FIXTURE, parallel=False, use_cache=False)
+        finally:
+            chart_generator.OUTPUT_DIR, html_report.OUTPUT_DIR = saved
+    return run
+
+
+# ──────────────────────────────────────────────
+#  RUNNER
+# ──────────────────────────────────────────────
+
+def time_benchmark(name: str, repeat: int = None, number: int = None) -> dict:
+    """Per-call timings (ms) for one benchmark: one untimed warm-up, then repeat x number."""
+    spec = BENCHMARKS[name]
+    repeat = repeat or spec["repeat"]
+    number = number or spec["number"]
+    with quiet():
+        fn = spec["setup"]()
+        fn()
+        samples = []
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            for _ in range(number):
+                fn()
+            samples.append((time.perf_counter() - t0) * 1000 / number)
+    return {
+        "repeat": repeat,
+        "number": number,
+        "min_ms": round(min(samples), 4),
+        "median_ms": round(statistics.median(samples), 4),
+        "mean_ms": round(statistics.fmean(samples), 4),
+        "stdev_ms": round(statistics.stdev(samples), 4) if len(samples) > 1 else 0.0,
+    }
+
+
+def _git_rev() -> str:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                             capture_output=True, text=True, timeout=10)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def environment() -> dict:
+    import numpy as np
+    import pandas as pd
+    from prediction_engine import data_fingerprint
+
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "git_rev": _git_rev(),
+        "data_version": data_fingerprint(),
+        "seed": BENCH_SEED,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def run_suite(names: list, repeat: int = None, number: int = None) -> dict:
+    from rng_streams import set_seed
+
+    set_seed(BENCH_SEED)
+    results = {}
+    for name in names:
+        try:
+            results[name] = time_benchmark(name, repeat, number)
+            print(f"  {name:<24}{results[name]['median_ms']:>12.3f} ms")
+        except Exception as e:
+            results[name] = {"error": f"{type(e).__name__}: {e}"}
+            print(f"  {name:<24}  ERROR {results[name]['error']}")
+    return {"environment": environment(), "benchmarks": results}
+
+
+def compare(report: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> list:
+    """[(name, baseline_ms, current_ms, ratio, status)]; status is ok/REGRESSION/faster/new/error."""
+    rows = []
+    base = baseline.get("benchmarks", {})
+    for name, cur in report["benchmarks"].items():
+        old = base.get(name)
+        if "error" in cur:
+            rows.append((name, None, None, None, "error"))
+            continue
+        if not old or "median_ms" not in old:
+            rows.append((name, None, cur["median_ms"], None, "new"))
+            continue
+        old_ms, cur_ms = old["median_ms"], cur["median_ms"]
+        ratio = cur_ms / old_ms if old_ms > 0 else float("inf")
+        status = "ok"
+        if abs(cur_ms - old_ms) >= NOISE_FLOOR_MS:
+            if ratio > 1 + threshold:
+                status = "REGRESSION"
+            elif ratio < 1 - threshold:
+                status = "faster"
+        rows.append((name, old_ms, cur_ms, ratio, status))
+    return rows
+
+
+def print_comparison(rows: list, baseline: dict):
+    env = baseline.get("environment", {})
+    print(f"\n  vs baseline {env.get('git_rev') or '?'} ({env.get('timestamp', '?')})")
+    print(f"  {'benchmark':<24}{'baseline':>12}{'current':>12}{'ratio':>8}  status")
+    for name, old_ms, cur_ms, ratio, status in rows:
+        old = f"{old_ms:.3f}" if old_ms is not None else "-"
+        cur = f"{cur_ms:.3f}" if cur_ms is not None else "-"
+        rat = f"{ratio:.2f}x" if ratio is not None else "-"
+        print(f"  {name:<24}{old:>12}{cur:>12}{rat:>8}  {status}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the engine hot paths")
+    parser.add_argument("names", nargs="*", help="Run benchmarks whose name contains any of these")
+    parser.add_argument("--list", action="store_true", help="List benchmarks and exit")
+    parser.add_argument("--repeat", type=int, default=None, help="Override timed rounds per benchmark")
+    parser.add_argument("--number", type=int, default=None, help="Override calls per round")
+    parser.add_argument("--json", dest="json_path", help="Write results as JSON")
+    parser.add_argument("--save-baseline", nargs="?", const=str(BASELINE_PATH), default=None,
+                        metavar="PATH", help=f"Store results as the baseline (default {BASELINE_PATH.name})")
+    parser.add_argument("--compare", nargs="?", const=str(BASELINE_PATH), default=None,
+                        metavar="PATH", help="Compare against a baseline; exit 1 on a regression")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown of the median before flagging (default 0.10)")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, spec in BENCHMARKS.items():
+            print(f"  {name:<24} repeat={spec['repeat']} number={spec['number']}")
+        return
+
+    names = [n for n in BENCHMARKS if not args.names or any(p in n for p in args.names)]
+    if not names:
+        print(f"[ERROR] No benchmark matches {args.names}. Use --list.")
+        sys.exit(2)
+
+    # Read the baseline before anything runs or is saved: --save-baseline may
+    # point at the same file, and a data mismatch should fail before the suite
+    baseline = None
+    if args.compare:
+        from prediction_engine import data_fingerprint
+
+        try:
+            baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"[ERROR] Cannot read baseline {args.compare}: {e}")
+            sys.exit(2)
+        base_version = baseline.get("environment", {}).get("data_version")
+        if base_version != data_fingerprint():
+            print(f"[ERROR] Baseline {args.compare} was recorded on data version {base_version}, "
+                  f"current data is {data_fingerprint()}. Re-record it with --save-baseline.")
+            sys.exit(2)
+
+    print(f"[INFO] {len(names)} benchmark(s), seed {BENCH_SEED}, median ms per call")
+    report = run_suite(names, args.repeat, args.number)
+    failed = any("error" in r for r in report["benchmarks"].values())
+
+    if baseline is not None:
+        rows = compare(report, baseline, args.threshold)
+        print_comparison(rows, baseline)
+        failed = failed or any(r[4] == "REGRESSION" for r in rows)
+
+    for path in filter(None, (args.json_path, args.save_baseline)):
+        Path(path).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"[INFO] Saved {path}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -24,97 +24,236 @@ def _winner_name(home, away, a):
     return "Draw"
 
 
-def generate_winner_meter(home, away, a):
-    hw = a["home_win_pct"]
-    dr = a["draw_pct"]
-    aw = a["away_win_pct"]
-    def bar(pct, width=20):
-        filled = int(round((pct / 100.0) * width))
-        return "#" * filled + "." * (width - filled)
-    lines = []
-    lines.append("WINNER METER | " + home + " vs " + away)
-    lines.append(home.ljust(18) + " [" + bar(hw) + "] " + str(round(hw, 1)) + "%")
-    lines.append("Draw".ljust(18) + " [" + bar(dr) + "] " + str(round(dr, 1)) + "%")
-    lines.append(away.ljust(18) + " [" + bar(aw) + "] " + str(round(aw, 1)) + "%")
-    return "\n".join(lines)
-
-
-def generate_commentator_intro(home, away, a):
-    fav = a["favourite"]
-    dog = a["underdog"]
-    up = a["upset_prob"]
-    if fav == home:
-        fav_pct = a["home_win_pct"]
-    else:
-        fav_pct = a["away_win_pct"]
-    text = "COMMENTATOR INTRO\n\n"
-    text += "Welcome in to " + home + " against " + away + ". "
-    text += "According to Mundialista AI, " + fav + " comes in as the favorite at " + str(round(fav_pct, 1)) + "%, "
-    text += "but " + dog + " still holds an upset chance of " + str(round(up, 1)) + "%. "
-    text += "Expect a match with plenty to watch from the opening whistle."
-    return text
+def _bar(pct, width=20):
+    filled = int(round((pct / 100.0) * width))
+    return "#" * filled + "." * (width - filled)
 
 
-def generate_lower_third(home, away, a):
-    if a["top5_scorelines"]:
-        likely = _format_scoreline_entry(a["top5_scorelines"][0])
-    else:
-        likely = "N/A"
-    text = "LOWER THIRD\n"
-    text += "AI PREDICTION: " + home + " " + str(round(a["home_win_pct"], 1)) + "% | "
-    text += "DRAW " + str(round(a["draw_pct"], 1)) + "% | "
-    text += away + " " + str(round(a["away_win_pct"], 1)) + "%\n"
-    text += "MOST LIKELY SCORE: " + likely
-    return text
-
+# ---- MATCH CONTEXT ----
+# Every derived value the segments share (winner, bars, chaos meter, upset
+# scale, formatted numbers), computed once per match. Segments are plain
+# str.format templates over this dict.
 
-def generate_chaos_meter(home, away, a):
+def match_context(home, away, a):
+    hw, dr, aw = a["home_win_pct"], a["draw_pct"], a["away_win_pct"]
     up = a["upset_prob"]
-    draw = a["draw_pct"]
+    fav, dog = a["favourite"], a["underdog"]
     rank_gap = abs(a["home_rank"] - a["away_rank"])
-    score = min(up, 40) * 0.9 + min(draw, 35) * 0.5 + max(0, 25 - min(rank_gap, 25)) * 1.2
-    chaos = min(score, 100.0)
+    scorelines = [_format_scoreline_entry(sc) for sc in a["top5_scorelines"][:5]]
+    likely = scorelines[0] if scorelines else "N/A"
+    winner = _winner_name(home, away, a)
+    loser = away if winner == home else home
+
+    chaos = min(min(up, 40) * 0.9 + min(dr, 35) * 0.5 + max(0, 25 - min(rank_gap, 25)) * 1.2, 100.0)
     if chaos >= 75:
-        label = "CHAOS WATCH"
+        chaos_label = "CHAOS WATCH"
     elif chaos >= 55:
-        label = "VOLATILE"
+        chaos_label = "VOLATILE"
     elif chaos >= 35:
-        label = "TENSE"
+        chaos_label = "TENSE"
     else:
-        label = "ROUTINE"
-    text = "CHAOS METER | " + home + " vs " + away + "\n"
-    text += label + " - " + str(round(chaos, 1)) + "/100\n"
-    text += "Upset: " + str(round(up, 1)) + "% | Draw: " + str(round(draw, 1)) + "% | Gap: " + str(rank_gap)
-    return text
+        chaos_label = "ROUTINE"
 
+    if up >= 40:
+        upset_label = "RED ALERT"
+    elif up >= 30:
+        upset_label = "HIGH ALERT"
+    elif up >= 20:
+        upset_label = "WATCHABLE"
+    else:
+        upset_label = "STABLE"
 
-def generate_key_battle(home, away, a):
     xg_edge = a["home_exp"] - a["away_exp"]
     if abs(xg_edge) < 0.15:
-        edge = "Neither team owns a major xG edge."
+        edge_line = "Neither team owns a major xG edge."
     elif xg_edge > 0:
-        edge = home + " carries the attacking edge at +" + str(round(xg_edge, 2)) + " xG."
+        edge_line = home + " carries the attacking edge at +" + str(round(xg_edge, 2)) + " xG."
     else:
-        edge = away + " carries the attacking edge at +" + str(round(abs(xg_edge), 2)) + " xG."
-    text = "KEY BATTLE\n"
-    text += "Rankings: #" + str(a["home_rank"]) + " vs #" + str(a["away_rank"]) + "\n"
-    text += edge + "\n"
-    text += "Upset threat: " + str(round(a["upset_prob"], 1)) + "% for " + a["underdog"] + "."
-    return text
+        edge_line = away + " carries the attacking edge at +" + str(round(abs(xg_edge), 2)) + " xG."
 
+    if a["home_exp"] > a["away_exp"]:
+        key1 = "1. " + home + " must convert its xG edge early."
+    elif a["away_exp"] > a["home_exp"]:
+        key1 = "1. " + away + " must convert its xG edge."
+    else:
+        key1 = "1. Finishing efficiency decides this even match."
+    key2 = "2. Slow pace increases draw threat." if dr >= 25 else "2. An early goal reshapes the tactical flow."
+    if up >= 30:
+        key3 = "3. " + dog + " is live - dangerous upset spot."
+    else:
+        key3 = "3. " + fav + " should control if it avoids mistakes."
 
-def generate_storylines(home, away, a):
-    lines = []
-    lines.append("TOP 5 STORYLINES | " + home + " vs " + away)
-    lines.append("1. " + a["favourite"] + " enters as the AI favorite.")
-    lines.append("2. " + a["underdog"] + " has a live upset chance at " + str(round(a["upset_prob"], 1)) + "%.")
-    lines.append("3. Expected goals: " + str(round(a["home_exp"], 2)) + " - " + str(round(a["away_exp"], 2)) + ".")
-    lines.append("4. Rankings: #" + str(a["home_rank"]) + " vs #" + str(a["away_rank"]) + ".")
-    if a["top5_scorelines"]:
-        lines.append("5. Most likely: " + _format_scoreline_entry(a["top5_scorelines"][0]) + ".")
+    if winner == "Draw":
+        verdict = "Too close to call; the draw is alive."
+        headlines = (home + " vs " + away + ": AI sees a coin-flip",
+                     "No clear favorite as " + home + " and " + away + " collide",
+                     "Draw danger high in " + home + " vs " + away)
     else:
-        lines.append("5. No dominant scoreline.")
-    return "\n".join(lines)
+        verdict = "The AI leans toward " + winner + "."
+        headlines = (winner + " favored against " + loser,
+                     winner + " gets AI edge in projection",
+                     "Can " + dog + " flip the script against " + winner + "?")
+
+    return {
+        "home": home,
+        "away": away,
+        "home_pad": home.ljust(18),
+        "away_pad": away.ljust(18),
+        "hw": str(round(hw, 1)),
+        "dr": str(round(dr, 1)),
+        "aw": str(round(aw, 1)),
+        "hx": str(round(a["home_exp"], 2)),
+        "ax": str(round(a["away_exp"], 2)),
+        "bar_hw": _bar(hw),
+        "bar_dr": _bar(dr),
+        "bar_aw": _bar(aw),
+        "home_rank": str(a["home_rank"]),
+        "away_rank": str(a["away_rank"]),
+        "rank_gap": str(rank_gap),
+        "favourite": fav,
+        "underdog": dog,
+        "fav_pct": str(round(a["home_win_pct"] if fav == home else a["away_win_pct"], 1)),
+        "up": str(round(up, 1)),
+        "upset_bar": _bar(up),
+        "upset_label": upset_label,
+        "chaos": str(round(chaos, 1)),
+        "chaos_label": chaos_label,
+        "winner": winner,
+        "likely": likely,
+        "story5": "5. Most likely: " + likely + "." if scorelines else "5. No dominant scoreline.",
+        "panel": "\n".join(str(i) + ". " + s for i, s in enumerate(scorelines, 1)) if scorelines else "No data.",
+        "edge_line": edge_line,
+        "key1": key1,
+        "key2": key2,
+        "key3": key3,
+        "verdict": verdict,
+        "h1": headlines[0],
+        "h2": headlines[1],
+        "h3": headlines[2],
+        "match_type": a.get("match_type", "Competitive"),
+    }
+
+
+# ---- SEGMENT TEMPLATES ----
+TEMPLATES = {
+    "winner_meter": (
+        "WINNER METER | {home} vs {away}\n"
+        "{home_pad} [{bar_hw}] {hw}%\n"
+        + "Draw".ljust(18) + " [{bar_dr}] {dr}%\n"
+        "{away_pad} [{bar_aw}] {aw}%"
+    ),
+    "commentator_intro": (
+        "COMMENTATOR INTRO\n\n"
+        "Welcome in to {home} against {away}. "
+        "According to Mundialista AI, {favourite} comes in as the favorite at {fav_pct}%, "
+        "but {underdog} still holds an upset chance of {up}%. "
+        "Expect a match with plenty to watch from the opening whistle."
+    ),
+    "lower_third": (
+        "LOWER THIRD\n"
+        "AI PREDICTION: {home} {hw}% | DRAW {dr}% | {away} {aw}%\n"
+        "MOST LIKELY SCORE: {likely}"
+    ),
+    "chaos_meter": (
+        "CHAOS METER | {home} vs {away}\n"
+        "{chaos_label} - {chaos}/100\n"
+        "Upset: {up}% | Draw: {dr}% | Gap: {rank_gap}"
+    ),
+    "key_battle": (
+        "KEY BATTLE\n"
+        "Rankings: #{home_rank} vs #{away_rank}\n"
+        "{edge_line}\n"
+        "Upset threat: {up}% for {underdog}."
+    ),
+    "storylines": (
+        "TOP 5 STORYLINES | {home} vs {away}\n"
+        "1. {favourite} enters as the AI favorite.\n"
+        "2. {underdog} has a live upset chance at {up}%.\n"
+        "3. Expected goals: {hx} - {ax}.\n"
+        "4. Rankings: #{home_rank} vs #{away_rank}.\n"
+        "{story5}"
+    ),
+    "prediction_verdict": (
+        "AI VERDICT\n"
+        "{verdict}\n"
+        "{home} {hw}% | Draw {dr}% | {away} {aw}%"
+    ),
+    "producer_notes": (
+        "PRODUCER NOTES | {home} vs {away}\n"
+        "- Favorite: {favourite}\n"
+        "- Underdog: {underdog}\n"
+        "- Upset: {up}%\n"
+        "- xG: {home} {hx} / {away} {ax}\n"
+        "- Top score: {likely}\n"
+        "- Match type: {match_type}"
+    ),
+    "headline_pack": "HEADLINE PACK\n1. {h1}\n2. {h2}\n3. {h3}",
+    "on_air_tease": (
+        "ON-AIR TEASE\n"
+        "Coming up: {home} vs {away}. "
+        "Will {winner} justify the AI projection, "
+        "or can {underdog} deliver the surprise?"
+    ),
+    "match_card": (
+        "MATCH CARD | {home} vs {away}\n"
+        "Rankings: #{home_rank} vs #{away_rank}\n"
+        "Win: {home} {hw} | Draw {dr} | {away} {aw}\n"
+        "xG: {hx} - {ax}\n"
+        "Top score: {likely}\n"
+        "Upset: {up}% for {underdog}"
+    ),
+    "three_keys": "THREE KEYS\n{key1}\n{key2}\n{key3}",
+    "upset_scale": (
+        "UPSET SCALE\n"
+        "{underdog} vs {favourite}\n"
+        "[{upset_bar}] {up}%\n"
+        "Status: {upset_label}"
+    ),
+    "scoreline_panel": "SCORELINE PANEL | {home} vs {away}\n{panel}",
+}
+
+PACK_SEGMENTS = (
+    "match_card", "winner_meter", "commentator_intro", "lower_third",
+    "chaos_meter", "key_battle", "three_keys", "scoreline_panel",
+)
+
+# The whole pack as one template: one format call per match
+PACK_TEMPLATE = "\n\n".join(TEMPLATES[name] for name in PACK_SEGMENTS)
+
+
+def render_segment(name, ctx):
+    return TEMPLATES[name].format_map(ctx)
+
+
+def render_pack(ctx, segments=None):
+    if segments is None:
+        return PACK_TEMPLATE.format_map(ctx)
+    return "\n\n".join(TEMPLATES[name].format_map(ctx) for name in segments)
+
+
+# ---- SEGMENTS (one match) ----
+def generate_winner_meter(home, away, a):
+    return render_segment("winner_meter", match_context(home, away, a))
+
+
+def generate_commentator_intro(home, away, a):
+    return render_segment("commentator_intro", match_context(home, away, a))
+
+
+def generate_lower_third(home, away, a):
+    return render_segment("lower_third", match_context(home, away, a))
+
+
+def generate_chaos_meter(home, away, a):
+    return render_segment("chaos_meter", match_context(home, away, a))
+
+
+def generate_key_battle(home, away, a):
+    return render_segment("key_battle", match_context(home, away, a))
+
+
+def generate_storylines(home, away, a):
+    return render_segment("storylines", match_context(home, away, a))
 
 
 def generate_star_impact_card(home, away, resolve_team_name, get_team_star_impact):
@@ -132,136 +271,50 @@ def generate_star_impact_card(home, away, resolve_team_name, get_team_star_impac
 
 
 def generate_prediction_verdict(home, away, a):
-    winner = _winner_name(home, away, a)
-    if winner == "Draw":
-        verdict = "Too close to call; the draw is alive."
-    else:
-        verdict = "The AI leans toward " + winner + "."
-    text = "AI VERDICT\n" + verdict + "\n"
-    text += home + " " + str(round(a["home_win_pct"], 1)) + "% | "
-    text += "Draw " + str(round(a["draw_pct"], 1)) + "% | "
-    text += away + " " + str(round(a["away_win_pct"], 1)) + "%"
-    return text
+    return render_segment("prediction_verdict", match_context(home, away, a))
 
 
 def generate_producer_notes(home, away, a):
-    if a["top5_scorelines"]:
-        likely = _format_scoreline_entry(a["top5_scorelines"][0])
-    else:
-        likely = "N/A"
-    lines = []
-    lines.append("PRODUCER NOTES | " + home + " vs " + away)
-    lines.append("- Favorite: " + a["favourite"])
-    lines.append("- Underdog: " + a["underdog"])
-    lines.append("- Upset: " + str(round(a["upset_prob"], 1)) + "%")
-    lines.append("- xG: " + home + " " + str(round(a["home_exp"], 2)) + " / " + away + " " + str(round(a["away_exp"], 2)))
-    lines.append("- Top score: " + likely)
-    lines.append("- Match type: " + a.get("match_type", "Competitive"))
-    return "\n".join(lines)
+    return render_segment("producer_notes", match_context(home, away, a))
 
 
 def generate_headline_pack(home, away, a):
-    winner = _winner_name(home, away, a)
-    loser = away if winner == home else home
-    if winner == "Draw":
-        h1 = home + " vs " + away + ": AI sees a coin-flip"
-        h2 = "No clear favorite as " + home + " and " + away + " collide"
-        h3 = "Draw danger high in " + home + " vs " + away
-    else:
-        h1 = winner + " favored against " + loser
-        h2 = winner + " gets AI edge in projection"
-        h3 = "Can " + a["underdog"] + " flip the script against " + winner + "?"
-    return "\n".join(["HEADLINE PACK", "1. " + h1, "2. " + h2, "3. " + h3])
+    return render_segment("headline_pack", match_context(home, away, a))
 
 
 def generate_on_air_tease(home, away, a):
-    likely = _winner_name(home, away, a)
-    text = "ON-AIR TEASE\n"
-    text += "Coming up: " + home + " vs " + away + ". "
-    text += "Will " + likely + " justify the AI projection, "
-    text += "or can " + a["underdog"] + " deliver the surprise?"
-    return text
+    return render_segment("on_air_tease", match_context(home, away, a))
 
 
 def generate_match_card(home, away, a):
-    if a["top5_scorelines"]:
-        likely = _format_scoreline_entry(a["top5_scorelines"][0])
-    else:
-        likely = "N/A"
-    lines = []
-    lines.append("MATCH CARD | " + home + " vs " + away)
-    lines.append("Rankings: #" + str(a["home_rank"]) + " vs #" + str(a["away_rank"]))
-    lines.append("Win: " + home + " " + str(round(a["home_win_pct"], 1)) + " | Draw " + str(round(a["draw_pct"], 1)) + " | " + away + " " + str(round(a["away_win_pct"], 1)))
-    lines.append("xG: " + str(round(a["home_exp"], 2)) + " - " + str(round(a["away_exp"], 2)))
-    lines.append("Top score: " + likely)
-    lines.append("Upset: " + str(round(a["upset_prob"], 1)) + "% for " + a["underdog"])
-    return "\n".join(lines)
+    return render_segment("match_card", match_context(home, away, a))
 
 
 def generate_three_keys(home, away, a):
-    keys = []
-    if a["home_exp"] > a["away_exp"]:
-        keys.append("1. " + home + " must convert its xG edge early.")
-    elif a["away_exp"] > a["home_exp"]:
-        keys.append("1. " + away + " must convert its xG edge.")
-    else:
-        keys.append("1. Finishing efficiency decides this even match.")
-    if a["draw_pct"] >= 25:
-        keys.append("2. Slow pace increases draw threat.")
-    else:
-        keys.append("2. An early goal reshapes the tactical flow.")
-    if a["upset_prob"] >= 30:
-        keys.append("3. " + a["underdog"] + " is live - dangerous upset spot.")
-    else:
-        keys.append("3. " + a["favourite"] + " should control if it avoids mistakes.")
-    return "THREE KEYS\n" + "\n".join(keys)
+    return render_segment("three_keys", match_context(home, away, a))
 
 
 def generate_upset_scale(home, away, a):
-    up = a["upset_prob"]
-    if up >= 40:
-        label = "RED ALERT"
-    elif up >= 30:
-        label = "HIGH ALERT"
-    elif up >= 20:
-        label = "WATCHABLE"
-    else:
-        label = "STABLE"
-    filled = int(round((up / 100.0) * 20))
-    bar = "#" * filled + "." * (20 - filled)
-    text = "UPSET SCALE\n"
-    text += a["underdog"] + " vs " + a["favourite"] + "\n"
-    text += "[" + bar + "] " + str(round(up, 1)) + "%\n"
-    text += "Status: " + label
-    return text
+    return render_segment("upset_scale", match_context(home, away, a))
 
 
 def generate_scoreline_panel(home, away, a):
-    lines = ["SCORELINE PANEL | " + home + " vs " + away]
-    if not a["top5_scorelines"]:
-        lines.append("No data.")
-        return "\n".join(lines)
-    for i, sc in enumerate(a["top5_scorelines"][:5], 1):
-        lines.append(str(i) + ". " + _format_scoreline_entry(sc))
-    return "\n".join(lines)
+    return render_segment("scoreline_panel", match_context(home, away, a))
 
 
 def generate_full_broadcast_pack(home, away, a):
-    parts = [
-        generate_match_card(home, away, a),
-        "",
-        generate_winner_meter(home, away, a),
-        "",
-        generate_commentator_intro(home, away, a),
-        "",
-        generate_lower_third(home, away, a),
-        "",
-        generate_chaos_meter(home, away, a),
-        "",
-        generate_key_battle(home, away, a),
-        "",
-        generate_three_keys(home, away, a),
-        "",
-        generate_scoreline_panel(home, away, a),
-    ]
-    return "\n".join(parts)
+    return render_pack(match_context(home, away, a))
+
+
+# ---- TOURNAMENT ----
+def generate_tournament_packs(fixtures=None, segments=None):
+    # Yields (home, away, pack) for every fixture (default: all WC 2026 group
+    # matches) from one batched prediction pass
+    from itertools import combinations
+
+    from content_automation import WC2026_GROUPS, analyze_matches
+
+    if fixtures is None:
+        fixtures = [pair for g in sorted(WC2026_GROUPS) for pair in combinations(WC2026_GROUPS[g], 2)]
+    for fx, a in zip(fixtures, analyze_matches(fixtures)):
+        yield fx[0], fx[1], render_pack(match_context(fx[0], fx[1], a), segments)
@@ -2,10 +2,16 @@
 Task 19: Complete Match Simulation Function
 ============================================
 """
+import sys
+from pathlib import Path
+
 import numpy as np
 from typing import Dict
 from collections import Counter
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from rng_streams import get_generator
+
 TOTAL_MINUTES = 90
 HALF_TIME = 45
 
@@ -85,8 +91,9 @@ def simulate_match(
 
 def run_simulations(home_attack, home_defense, away_attack, away_defense,
                     n_sims=10200, seed=42):
-    """Run n_sims match simulations."""
-    rng = np.random.default_rng(seed)
+    """Run n_sims match simulations on a stream keyed by the match inputs."""
+    rng = get_generator("ch1_task19", home_attack, home_defense,
+                        away_attack, away_defense, seed=seed)
     results = []
     for _ in range(n_sims):
         results.append(simulate_match(
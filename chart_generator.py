@@ -1,32 +1,36 @@
-﻿import os
+﻿import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import math
+import multiprocessing
+import sys
 
+import matplotlib
+matplotlib.use("Agg")  # headless everywhere, including pool workers
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 import numpy as np
 
-from prediction_engine import build_score_matrix
+from html_report import OUTPUT_DIR, THEME, base_filename, build_insight, generate_html_report
+from metrics import cache_lookup
+from stage_timer import stage, timed_call
 
-# -----------------------------
-# Theme
-# -----------------------------
-THEME = {
-    "green": "#0F5C4D",
-    "green_2": "#0B6B57",
-    "green_3": "#16806A",
-    "gold": "#C9A227",
-    "gold_2": "#E1C15B",
-    "ivory": "#F8F7F2",
-    "white": "#FFFFFF",
-    "charcoal": "#1E1E1E",
-    "muted": "#6B7280",
-    "light_gray": "#E8E6DE",
-    "grid": "#D9D7CF"
+CHART_CONFIG = {
+    "DPI": 160,
+    "PARALLEL": (os.cpu_count() or 1) > 1,  # render the five PNGs in a process pool
+    "WORKERS": min(5, os.cpu_count() or 1),
+    "CACHE": True,                    # reuse files when result + theme are unchanged
+    "VERSION": 1,                     # bump when a chart's drawing code changes
 }
 
-OUTPUT_DIR = Path("predictions_output")
-OUTPUT_DIR.mkdir(exist_ok=True)
+# Result keys the charts read; everything else (simulation arrays, coach
+# notes, ...) stays out of the worker payload and the cache key
+CHART_KEYS = (
+    "team_a_win", "draw", "team_b_win", "team_a_lambda", "team_b_lambda",
+    "team_a_rank", "team_b_rank", "match_type", "top_scores", "score_matrix",
+)
 
 plt.rcParams.update({
     "figure.facecolor": THEME["ivory"],
@@ -50,20 +54,9 @@ plt.rcParams.update({
 # -----------------------------
 # Helpers
 # -----------------------------
-def slugify(text):
-    return (
-        str(text).strip().lower()
-        .replace(" ", "_")
-        .replace("/", "_")
-        .replace("\\", "_")
-    )
-
-def base_filename(team_a, team_b):
-    return f"{slugify(team_a)}_vs_{slugify(team_b)}"
-
 def save_fig(fig, filename):
     path = OUTPUT_DIR / filename
-    fig.savefig(path, dpi=160, bbox_inches="tight")
+    fig.savefig(path, dpi=CHART_CONFIG["DPI"], bbox_inches="tight")
     plt.close(fig)
     return str(path)
 
@@ -90,38 +83,6 @@ def make_title(ax, title, subtitle=None):
             va="bottom"
         )
 
-def build_insight(result, team_a, team_b):
-    a = result.get("team_a_win", 0)
-    d = result.get("draw", 0)
-    b = result.get("team_b_win", 0)
-    la = result.get("team_a_lambda", 0)
-    lb = result.get("team_b_lambda", 0)
-    match_type = result.get("match_type", "Competitive")
-
-    if abs(a - b) <= 6:
-        edge = f"{team_a} and {team_b} project as closely matched."
-    elif a > b:
-        edge = f"{team_a} hold the model edge."
-    else:
-        edge = f"{team_b} hold the model edge."
-
-    if d >= 27:
-        draw_note = "Draw probability is elevated, suggesting limited separation."
-    elif d <= 20:
-        draw_note = "A decisive result is more likely than usual."
-    else:
-        draw_note = "The draw remains a meaningful live outcome."
-
-    total_lambda = la + lb
-    if total_lambda >= 2.9:
-        goals_note = "Expected goals suggest a more open scoring environment."
-    elif total_lambda <= 2.3:
-        goals_note = "Expected goals point to a tighter, lower-scoring match."
-    else:
-        goals_note = "Expected goals sit in a moderate range."
-
-    return f"{match_type}. {edge} {draw_note} {goals_note}"
-
 # -----------------------------
 # Chart 1: Summary card
 # -----------------------------
@@ -223,8 +184,11 @@ def generate_probability_chart(result, team_a, team_b):
 # Chart 3: Score matrix heatmap
 # -----------------------------
 def generate_score_matrix_chart(result, team_a, team_b, max_goals=5):
-    matrix = build_score_matrix(result.get("team_a_lambda", 0), result.get("team_b_lambda", 0))
-    matrix = matrix[:max_goals+1, :max_goals+1]
+    matrix = result.get("score_matrix")
+    if matrix is None:
+        from prediction_engine import build_score_matrix
+        matrix = build_score_matrix(result.get("team_a_lambda", 0), result.get("team_b_lambda", 0))
+    matrix = np.asarray(matrix)[:max_goals+1, :max_goals+1]
     fig, ax = plt.subplots(figsize=(8.5, 6.2))
     soft_card(ax)
 
@@ -331,294 +295,344 @@ def generate_goal_distribution_chart(result, team_a, team_b, max_goals=6):
     return save_fig(fig, f"{base_filename(team_a, team_b)}_goals.png")
 
 # -----------------------------
-# HTML report
+# Main public API
 # -----------------------------
-def generate_html_report(result, team_a, team_b, chart_paths):
-    html_path = OUTPUT_DIR / f"{base_filename(team_a, team_b)}.html"
+CHARTS = {
+    "summary": generate_summary_chart,
+    "probability": generate_probability_chart,
+    "matrix": generate_score_matrix_chart,
+    "top_scores": generate_top_scores_chart,
+    "goals": generate_goal_distribution_chart,
+}
 
-    insight = build_insight(result, team_a, team_b)
+_POOL = None
 
-    score_items = ""
-    for item in result.get("top_scores", [])[:6]:
-        if isinstance(item, (list, tuple)) and len(item) >= 2:
-            score_items += f'<span class="score-pill">{item[0]}  -  {item[1]}</span>'
-        else:
-            score_items += f'<span class="score-pill">{item}</span>'
-
-    html = f'''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="UTF-8">
-<meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>Mundialista AI Report — {team_a} vs {team_b}</title>
-<style>
-:root {{
-    --green: #0F5C4D;
-    --green2: #0B6B57;
-    --gold: #C9A227;
-    --ivory: #F8F7F2;
-    --white: #FFFFFF;
-    --text: #1E1E1E;
-    --muted: #6B7280;
-    --border: rgba(15, 92, 77, 0.12);
-    --shadow: 0 8px 24px rgba(0,0,0,0.05);
-    --radius: 20px;
-}}
-* {{
-    box-sizing: border-box;
-}}
-body {{
-    margin: 0;
-    background: var(--ivory);
-    color: var(--text);
-    font-family: "Segoe UI", Arial, sans-serif;
-}}
-.container {{
-    max-width: 1180px;
-    margin: 0 auto;
-    padding: 32px 20px 48px;
-}}
-.hero {{
-    background: linear-gradient(135deg, var(--green), var(--green2));
-    color: white;
-    border-radius: 28px;
-    padding: 32px;
-    box-shadow: var(--shadow);
-    margin-bottom: 24px;
-}}
-.hero h1 {{
-    margin: 0 0 6px 0;
-    font-size: 2.25rem;
-}}
-.hero p {{
-    margin: 6px 0;
-    color: rgba(255,255,255,0.88);
-}}
-.hero .tag {{
-    display: inline-block;
-    margin-top: 12px;
-    padding: 8px 12px;
-    border-radius: 999px;
-    background: rgba(201,162,39,0.18);
-    border: 1px solid rgba(201,162,39,0.3);
-    color: #F7E7B0;
-    font-weight: 700;
-    font-size: 0.85rem;
-}}
-.card {{
-    background: var(--white);
-    border: 1px solid var(--border);
-    border-radius: var(--radius);
-    padding: 22px;
-    box-shadow: var(--shadow);
-    margin-bottom: 18px;
-}}
-.section-title {{
-    color: var(--green);
-    margin: 0 0 14px 0;
-    font-size: 1.1rem;
-}}
-.vs {{
-    display: flex;
-    justify-content: space-between;
-    align-items: center;
-    gap: 14px;
-}}
-.team {{
-    font-size: 1.45rem;
-    font-weight: 800;
-    color: var(--green);
-}}
-.rank {{
-    color: var(--muted);
-    margin-top: 4px;
-}}
-.vs-badge {{
-    padding: 10px 14px;
-    border-radius: 999px;
-    background: rgba(201,162,39,0.12);
-    border: 1px solid rgba(201,162,39,0.25);
-    color: #8A6B00;
-    font-weight: 800;
-}}
-.metrics {{
-    display: grid;
-    grid-template-columns: repeat(6, 1fr);
-    gap: 12px;
-    margin-top: 18px;
-}}
-.metric {{
-    background: #FCFCFA;
-    border: 1px solid var(--border);
-    border-radius: 16px;
-    padding: 14px;
-}}
-.metric .label {{
-    color: var(--muted);
-    font-size: 0.82rem;
-    margin-bottom: 6px;
-}}
-.metric .value {{
-    color: var(--green);
-    font-size: 1.45rem;
-    font-weight: 800;
-}}
-.badges {{
-    margin-top: 14px;
-}}
-.badge {{
-    display: inline-block;
-    padding: 7px 10px;
-    border-radius: 999px;
-    margin-right: 8px;
-    font-size: 0.8rem;
-    font-weight: 700;
-}}
-.badge-green {{
-    background: rgba(15,92,77,0.10);
-    color: var(--green);
-    border: 1px solid rgba(15,92,77,0.18);
-}}
-.badge-gold {{
-    background: rgba(201,162,39,0.14);
-    color: #8A6B00;
-    border: 1px solid rgba(201,162,39,0.25);
-}}
-.insight {{
-    border-left: 4px solid var(--gold);
-    background: #FFFDF6;
-    padding: 14px 16px;
-    border-radius: 12px;
-    line-height: 1.55;
-}}
-.grid {{
-    display: grid;
-    grid-template-columns: 1fr 1fr;
-    gap: 18px;
-}}
-.chart-card img {{
-    width: 100%;
-    border-radius: 14px;
-    border: 1px solid var(--border);
-}}
-.score-pill {{
-    display: inline-block;
-    padding: 9px 12px;
-    border-radius: 12px;
-    background: #FAFAF7;
-    border: 1px solid var(--border);
-    margin: 6px 8px 0 0;
-    color: var(--green);
-    font-weight: 700;
-}}
-.footer {{
-    text-align: center;
-    color: var(--muted);
-    margin-top: 24px;
-    font-size: 0.9rem;
-}}
-@media (max-width: 900px) {{
-    .metrics {{
-        grid-template-columns: repeat(2, 1fr);
-    }}
-    .grid {{
-        grid-template-columns: 1fr;
-    }}
-    .vs {{
-        flex-direction: column;
-        align-items: flex-start;
-    }}
-}}
-</style>
-</head>
-<body>
-<div class="container">
-    <div class="hero">
-        <h1>Mundialista AI</h1>
-        <p>International Match Intelligence</p>
-        <p>{team_a} vs {team_b}</p>
-        <span class="tag">Refined match forecast report</span>
-    </div>
-
-    <div class="card">
-        <div class="vs">
-            <div>
-                <div class="team">{team_a}</div>
-                <div class="rank">FIFA Rank: {result.get("team_a_rank", "N/A")}</div>
-            </div>
-            <div class="vs-badge">VS</div>
-            <div style="text-align:right;">
-                <div class="team">{team_b}</div>
-                <div class="rank">FIFA Rank: {result.get("team_b_rank", "N/A")}</div>
-            </div>
-        </div>
-
-        <div class="badges">
-            <span class="badge badge-gold">{result.get("match_type", "Competitive")}</span>
-            <span class="badge badge-green">Monte Carlo Forecast</span>
-        </div>
-
-        <div class="metrics">
-            <div class="metric"><div class="label">{team_a} Win</div><div class="value">{result.get("team_a_win", 0):.1f}%</div></div>
-            <div class="metric"><div class="label">Draw</div><div class="value" style="color:#8A6B00;">{result.get("draw", 0):.1f}%</div></div>
-            <div class="metric"><div class="label">{team_b} Win</div><div class="value">{result.get("team_b_win", 0):.1f}%</div></div>
-            <div class="metric"><div class="label">{team_a} ?</div><div class="value">{result.get("team_a_lambda", 0):.2f}</div></div>
-            <div class="metric"><div class="label">{team_b} ?</div><div class="value">{result.get("team_b_lambda", 0):.2f}</div></div>
-            <div class="metric"><div class="label">Model</div><div class="value" style="font-size:1.1rem;">Poisson + Form</div></div>
-        </div>
-    </div>
-
-    <div class="card">
-        <h3 class="section-title">Model Insight</h3>
-        <div class="insight">{insight}</div>
-    </div>
-
-    <div class="card">
-        <h3 class="section-title">Most Likely Scorelines</h3>
-        <div>{score_items}</div>
-    </div>
-
-    <div class="grid">
-        <div class="card chart-card">
-            <h3 class="section-title">Probability Profile</h3>
-            <img src="{os.path.basename(chart_paths['probability'])}" alt="Probability chart">
-        </div>
-        <div class="card chart-card">
-            <h3 class="section-title">Score Matrix</h3>
-            <img src="{os.path.basename(chart_paths['matrix'])}" alt="Score matrix chart">
-        </div>
-        <div class="card chart-card">
-            <h3 class="section-title">Top Scorelines</h3>
-            <img src="{os.path.basename(chart_paths['top_scores'])}" alt="Top scores chart">
-        </div>
-        <div class="card chart-card">
-            <h3 class="section-title">Goal Distribution</h3>
-            <img src="{os.path.basename(chart_paths['goals'])}" alt="Goal distribution chart">
-        </div>
-    </div>
-
-    <div class="footer">
-        Mundialista AI • International football prediction system
-    </div>
-</div>
-</body>
-</html>
-'''
-    html_path.write_text(html, encoding="utf-8")
-    return str(html_path)
+def get_pool():
+    """Shared spawn-based pool; workers import this module once and stay warm."""
+    global _POOL
+    if _POOL is None:
+        _POOL = ProcessPoolExecutor(
+            max_workers=CHART_CONFIG["WORKERS"],
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _POOL
+
+def shutdown_pool():
+    global _POOL
+    if _POOL is not None:
+        _POOL.shutdown(wait=False, cancel_futures=True)
+        _POOL = None
+
+def chart_payload(result):
+    """The part of a predict() result the charts use (small and picklable)."""
+    payload = {k: result[k] for k in CHART_KEYS if k in result}
+    if payload.get("score_matrix") is not None:
+        payload["score_matrix"] = np.asarray(payload["score_matrix"], dtype=np.float64)
+    return payload
+
+def chart_cache_key(payload, team_a, team_b):
+    """Hash of the chart inputs, theme and renderer settings."""
+    h = hashlib.sha1()
+    data = {k: v for k, v in payload.items() if k != "score_matrix"}
+    h.update(json.dumps([team_a, team_b, data, THEME, CHART_CONFIG["DPI"], CHART_CONFIG["VERSION"]],
+                        sort_keys=True, default=str).encode("utf-8"))
+    if payload.get("score_matrix") is not None:
+        h.update(np.round(payload["score_matrix"], 10).tobytes())
+    return h.hexdigest()[:20]
+
+def _manifest_path(team_a, team_b):
+    return OUTPUT_DIR / f".{base_filename(team_a, team_b)}.charts.json"
+
+def _cached_charts(key, team_a, team_b):
+    try:
+        manifest = json.loads(_manifest_path(team_a, team_b).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    paths = manifest.get("paths", {})
+    if manifest.get("key") != key or not all(os.path.exists(p) for p in paths.values()):
+        return None
+    return paths
+
+def _render_chart(name, payload, team_a, team_b):
+    with stage(f"charts.{name}"):
+        return CHARTS[name](payload, team_a, team_b)
+
+def generate_all_charts(result, team_a, team_b, parallel=None, use_cache=None):
+    parallel = CHART_CONFIG["PARALLEL"] if parallel is None else parallel
+    use_cache = CHART_CONFIG["CACHE"] if use_cache is None else use_cache
+
+    with timed_call("charts"):
+        payload = chart_payload(result)
+        key = chart_cache_key(payload, team_a, team_b)
+        if use_cache:
+            with stage("charts.cache_lookup"):
+                cached = _cached_charts(key, team_a, team_b)
+            cache_lookup("charts", bool(cached))
+            if cached:
+                return cached
+
+        chart_paths = {}
+        if parallel:
+            try:
+                with stage("charts.parallel_render"):
+                    pool = get_pool()
+                    futures = {name: pool.submit(_render_chart, name, payload, team_a, team_b) for name in CHARTS}
+                    chart_paths = {name: fut.result() for name, fut in futures.items()}
+            except Exception as e:  # broken pool / no subprocesses allowed
+                print(f"[WARN] Parallel chart rendering failed ({e}); rendering serially.", file=sys.stderr)
+                shutdown_pool()
+                chart_paths = {}
+        if not chart_paths:
+            chart_paths = {name: _render_chart(name, payload, team_a, team_b) for name in CHARTS}
+
+        with stage("charts.html"):
+            chart_paths["html"] = generate_html_report(result, team_a, team_b, chart_paths)
+        if use_cache:
+            _manifest_path(team_a, team_b).write_text(
+                json.dumps({"key": key, "paths": chart_paths}, indent=2), encoding="utf-8")
+        return chart_paths
 
 # -----------------------------
-# Main public API
+# Figure templates (batch rendering)
 # -----------------------------
-def generate_all_charts(result, team_a, team_b):
-    chart_paths = {}
-    chart_paths["summary"] = generate_summary_chart(result, team_a, team_b)
-    chart_paths["probability"] = generate_probability_chart(result, team_a, team_b)
-    chart_paths["matrix"] = generate_score_matrix_chart(result, team_a, team_b)
-    chart_paths["top_scores"] = generate_top_scores_chart(result, team_a, team_b)
-    chart_paths["goals"] = generate_goal_distribution_chart(result, team_a, team_b)
-    chart_paths["html"] = generate_html_report(result, team_a, team_b, chart_paths)
-    return chart_paths
-
-
+class FigureTemplates:
+    """
+    The five report charts built once and refilled per fixture.
+
+    Figures, axes and artists are created on first use; render() only
+    updates bar heights, image data and text, then saves. Output matches
+    the generate_*_chart functions. One instance per process: a batch
+    worker keeps five figures alive however many fixtures it renders.
+    """
+
+    MATRIX_GOALS = 5
+    TOP_N = 8
+    MAX_GOALS_DIST = 6
+
+    def __init__(self):
+        self._figs = {}
+
+    # -- summary --
+    def _build_summary(self):
+        fig = plt.figure(figsize=(12, 5), facecolor=THEME["ivory"])
+        ax = fig.add_axes([0.04, 0.08, 0.92, 0.84])
+        ax.axis("off")
+        ax.add_patch(patches.FancyBboxPatch(
+            (0, 0), 1, 1,
+            boxstyle="round,pad=0.02,rounding_size=0.03",
+            linewidth=1.2,
+            edgecolor=THEME["light_gray"],
+            facecolor=THEME["white"]
+        ))
+        ax.text(0.04, 0.88, "Mundialista AI", fontsize=20, fontweight="bold", color=THEME["green"])
+        ax.text(0.04, 0.82, "International Match Intelligence", fontsize=10.5, color=THEME["muted"])
+        ax.text(0.50, 0.64, "VS", fontsize=14, fontweight="bold", color=THEME["gold"], ha="center",
+                bbox=dict(boxstyle="round,pad=0.35", fc="#FFF8E1", ec="#E7D7A3"))
+        t = {
+            "team_a": ax.text(0.04, 0.64, "", fontsize=20, fontweight="bold", color=THEME["green"]),
+            "rank_a": ax.text(0.04, 0.57, "", fontsize=10.5, color=THEME["muted"]),
+            "team_b": ax.text(0.96, 0.64, "", fontsize=20, fontweight="bold", color=THEME["green"], ha="right"),
+            "rank_b": ax.text(0.96, 0.57, "", fontsize=10.5, color=THEME["muted"], ha="right"),
+            "stats": [],
+        }
+        colors = [THEME["green"], "#8A6B00", THEME["green"], THEME["green"], THEME["green"], THEME["gold"]]
+        x_positions = [0.05, 0.215, 0.38, 0.545, 0.71, 0.83]
+        widths = [0.14, 0.14, 0.14, 0.14, 0.14, 0.12]
+        for color, x, w in zip(colors, x_positions, widths):
+            ax.add_patch(patches.FancyBboxPatch(
+                (x, 0.18), w, 0.20,
+                boxstyle="round,pad=0.01,rounding_size=0.02",
+                linewidth=1,
+                edgecolor=THEME["light_gray"],
+                facecolor=THEME["ivory"]
+            ))
+            t["stats"].append((
+                ax.text(x + 0.015, 0.31, "", fontsize=9, color=THEME["muted"]),
+                ax.text(x + 0.015, 0.22, "", fontsize=16, fontweight="bold", color=color),
+            ))
+        t["insight"] = ax.text(0.04, 0.08, "", fontsize=10, color=THEME["charcoal"],
+                               bbox=dict(boxstyle="round,pad=0.5", fc="#FFFDF6", ec="#EADCA8"))
+        return fig, t
+
+    def _fill_summary(self, t, result, team_a, team_b):
+        t["team_a"].set_text(team_a)
+        t["team_b"].set_text(team_b)
+        t["rank_a"].set_text(f"FIFA Rank: {result.get('team_a_rank', 'N/A')}")
+        t["rank_b"].set_text(f"FIFA Rank: {result.get('team_b_rank', 'N/A')}")
+        stats = [
+            (f"{team_a} Win", f"{result.get('team_a_win', 0):.1f}%"),
+            ("Draw", f"{result.get('draw', 0):.1f}%"),
+            (f"{team_b} Win", f"{result.get('team_b_win', 0):.1f}%"),
+            (f"{team_a} ?", f"{result.get('team_a_lambda', 0):.2f}"),
+            (f"{team_b} ?", f"{result.get('team_b_lambda', 0):.2f}"),
+            ("Match Type", f"{result.get('match_type', 'Competitive')}"),
+        ]
+        for (label_artist, value_artist), (label, value) in zip(t["stats"], stats):
+            label_artist.set_text(label)
+            value_artist.set_text(value)
+        t["insight"].set_text(build_insight(result, team_a, team_b))
+
+    # -- probability --
+    def _build_probability(self):
+        fig, ax = plt.subplots(figsize=(9, 5))
+        soft_card(ax)
+        bars = ax.bar(range(3), [1, 1, 1], color=[THEME["green"], THEME["gold"], "#7B8391"], width=0.58)
+        ax.set_xticks(range(3))
+        make_title(ax, "Win / Draw / Loss Probability", "Model-estimated outcome distribution")
+        ax.set_ylabel("Probability (%)")
+        ax.grid(axis="y", linestyle="-", alpha=0.18)
+        ax.spines["top"].set_visible(False)
+        ax.spines["right"].set_visible(False)
+        labels = [ax.text(bar.get_x() + bar.get_width() / 2, 0, "", ha="center", va="bottom",
+                          fontsize=11, fontweight="bold", color=THEME["charcoal"]) for bar in bars]
+        return fig, {"ax": ax, "bars": bars, "labels": labels}
+
+    def _fill_probability(self, t, result, team_a, team_b):
+        values = [result.get("team_a_win", 0), result.get("draw", 0), result.get("team_b_win", 0)]
+        t["ax"].set_xticklabels([f"{team_a} Win", "Draw", f"{team_b} Win"])
+        t["ax"].set_ylim(0, max(values) + 12)
+        for bar, text, val in zip(t["bars"], t["labels"], values):
+            bar.set_height(val)
+            text.set_y(val + 0.8)
+            text.set_text(f"{val:.1f}%")
+
+    # -- score matrix --
+    def _build_matrix(self):
+        n = self.MATRIX_GOALS + 1
+        fig, ax = plt.subplots(figsize=(8.5, 6.2))
+        soft_card(ax)
+        im = ax.imshow(np.zeros((n, n)), cmap="Greens", origin="upper", vmin=0, vmax=1)
+        make_title(ax, "Exact Score Probability Matrix", "Darker cells indicate more likely scorelines")
+        ax.set_xticks(range(n))
+        ax.set_yticks(range(n))
+        rects = [patches.Rectangle((-0.5, -0.5), 1, 1, fill=False, edgecolor=THEME["gold"], linewidth=2)
+                 for _ in range(3)]
+        for rect in rects:
+            ax.add_patch(rect)
+        cells = [[ax.text(j, i, "", ha="center", va="center", fontsize=8.5) for j in range(n)]
+                 for i in range(n)]
+        cbar = fig.colorbar(im, ax=ax, fraction=0.046, pad=0.04)
+        cbar.set_label("Probability")
+        cbar.outline.set_edgecolor(THEME["light_gray"])
+        return fig, {"ax": ax, "im": im, "rects": rects, "cells": cells}
+
+    def _fill_matrix(self, t, result, team_a, team_b):
+        n = self.MATRIX_GOALS + 1
+        matrix = result.get("score_matrix")
+        if matrix is None:
+            from prediction_engine import build_score_matrix
+            matrix = build_score_matrix(result.get("team_a_lambda", 0), result.get("team_b_lambda", 0))
+        matrix = np.asarray(matrix)[:n, :n]
+        if matrix.shape != (n, n):
+            matrix = np.pad(matrix, ((0, n - matrix.shape[0]), (0, n - matrix.shape[1])))
+
+        t["im"].set_data(matrix)
+        t["im"].set_clim(matrix.min(), matrix.max())
+        t["ax"].set_xlabel(f"{team_b} goals")
+        t["ax"].set_ylabel(f"{team_a} goals")
+        top = np.dstack(np.unravel_index(np.argsort(matrix.ravel())[::-1][:3], matrix.shape))[0]
+        for rect, (i, j) in zip(t["rects"], top):
+            rect.set_xy((j - 0.5, i - 0.5))
+        hi = matrix.max() * 0.55
+        for i in range(n):
+            for j in range(n):
+                cell = t["cells"][i][j]
+                cell.set_text(f"{matrix[i, j]*100:.1f}")
+                cell.set_color("white" if matrix[i, j] > hi else THEME["charcoal"])
+
+    # -- top scores --
+    def _build_top_scores(self):
+        fig, ax = plt.subplots(figsize=(10, 5.4))
+        soft_card(ax)
+        y = np.arange(self.TOP_N)
+        colors = [THEME["green"] if i == 0 else "#9BBCAF" for i in range(self.TOP_N)]
+        bars = ax.barh(y, np.zeros(self.TOP_N), color=colors, height=0.62)
+        ax.set_yticks(y)
+        ax.invert_yaxis()
+        make_title(ax, "Most Likely Exact Scorelines", "Top score outcomes returned by simulation/model output")
+        ax.set_xlabel("Relative likelihood / count")
+        ax.grid(axis="x", linestyle="-", alpha=0.16)
+        ax.spines["top"].set_visible(False)
+        ax.spines["right"].set_visible(False)
+        labels = [ax.text(0, bar.get_y() + bar.get_height() / 2, "", va="center",
+                          fontsize=10, fontweight="bold") for bar in bars]
+        return fig, {"ax": ax, "bars": bars, "labels": labels}
+
+    def _fill_top_scores(self, t, result, team_a, team_b):
+        names, values = [], []
+        for item in result.get("top_scores", [])[:self.TOP_N]:
+            if isinstance(item, (list, tuple)) and len(item) >= 2:
+                names.append(str(item[0]))
+                values.append(float(item[1]))
+            else:
+                names.append(str(item))
+                values.append(0)
+        if not names:
+            names, values = ["1-1", "1-0", "0-1"], [1, 0.8, 0.7]
+        k = len(names)
+        names += [""] * (self.TOP_N - k)
+        values += [0.0] * (self.TOP_N - k)
+        top = max(values) or 1.0
+
+        t["ax"].set_yticklabels(names)
+        t["ax"].set_ylim(k - 0.5, -0.5)
+        t["ax"].set_xlim(0, top * 1.05)
+        for idx, (bar, text, val) in enumerate(zip(t["bars"], t["labels"], values)):
+            bar.set_width(val)
+            bar.set_visible(idx < k)
+            text.set_x(val + top * 0.012)
+            text.set_text(f"{val:.0f}" if idx < k else "")
+
+    # -- goal distribution --
+    def _build_goals(self):
+        goals = np.arange(0, self.MAX_GOALS_DIST + 1)
+        fig, ax = plt.subplots(figsize=(10, 5.2))
+        soft_card(ax)
+        width = 0.38
+        bars_a = ax.bar(goals - width/2, np.zeros(len(goals)), width=width, color=THEME["green"], label="A")
+        bars_b = ax.bar(goals + width/2, np.zeros(len(goals)), width=width, color=THEME["gold"], label="B")
+        make_title(ax, "Goal Distribution", "Independent Poisson goal likelihood by team")
+        ax.set_xlabel("Goals scored")
+        ax.set_ylabel("Probability (%)")
+        ax.set_xticks(goals)
+        legend = ax.legend(frameon=False)
+        ax.grid(axis="y", linestyle="-", alpha=0.16)
+        ax.spines["top"].set_visible(False)
+        ax.spines["right"].set_visible(False)
+        return fig, {"ax": ax, "bars_a": bars_a, "bars_b": bars_b, "legend": legend}
+
+    def _fill_goals(self, t, result, team_a, team_b):
+        goals = range(self.MAX_GOALS_DIST + 1)
+        la = result.get("team_a_lambda", 0)
+        lb = result.get("team_b_lambda", 0)
+        pa = [poisson_pmf(k, la) * 100 for k in goals]
+        pb = [poisson_pmf(k, lb) * 100 for k in goals]
+        for bar, val in zip(t["bars_a"], pa):
+            bar.set_height(val)
+        for bar, val in zip(t["bars_b"], pb):
+            bar.set_height(val)
+        for text, name in zip(t["legend"].get_texts(), (team_a, team_b)):
+            text.set_text(name)
+        t["ax"].set_ylim(0, max(pa + pb) * 1.05)
+
+    # -- driver --
+    def render(self, result, team_a, team_b, out_dir=None):
+        """Fill every template for one fixture and save the PNGs; returns paths."""
+        out_dir = Path(out_dir) if out_dir is not None else OUTPUT_DIR
+        out_dir.mkdir(parents=True, exist_ok=True)
+        base = base_filename(team_a, team_b)
+        paths = {}
+        for name in CHARTS:
+            if name not in self._figs:
+                self._figs[name] = getattr(self, f"_build_{name}")()
+            fig, handles = self._figs[name]
+            getattr(self, f"_fill_{name}")(handles, result, team_a, team_b)
+            path = out_dir / f"{base}_{name}.png"
+            fig.savefig(path, dpi=CHART_CONFIG["DPI"], bbox_inches="tight")
+            paths[name] = str(path)
+        return paths
+
+    def close(self):
+        for fig, _ in self._figs.values():
+            plt.close(fig)
+        self._figs.clear()
@@ -0,0 +1,106 @@
+"""
+Mundialista AI - Import-time budget check
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter and
+fails if an entry point pulls in a heavy module it should only load on first
+use. Going over the time budget is reported as SLOW and fails only with
+--strict, since a cold import swings by 100-150 ms between back-to-back runs.
+
+Budgets (cumulative import time of the module itself, median of --runs):
+
+    prediction_engine     450 ms   numpy + pandas only; no scipy, no matplotlib
+    predict               500 ms   CLI: engine only until charts are drawn
+    content_automation     60 ms   no numpy/pandas/engine until first analysis
+    chart_generator      1500 ms   the one place matplotlib is expected
+    html_report           250 ms   SVG report: numpy only, never matplotlib
+
+Usage:
+    python check_import_time.py                  # check all entry points
+    python check_import_time.py prediction_engine --runs 5 --top 15
+    python check_import_time.py --strict         # over budget fails too (quiet machines)
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+
+BUDGETS = {
+    # module: (budget_ms, modules that must not be imported)
+    "prediction_engine": (450, ("scipy", "matplotlib")),
+    "predict": (500, ("scipy", "matplotlib", "chart_generator")),
+    "content_automation": (60, ("numpy", "pandas", "prediction_engine", "broadcast_funcs")),
+    "chart_generator": (1500, ("scipy",)),
+    "html_report": (250, ("matplotlib", "pandas", "prediction_engine")),
+}
+
+_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure(module: str) -> list:
+    """[(self_us, cumulative_us, depth, name)] for one cold import."""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+    rows = []
+    for line in proc.stderr.splitlines():
+        m = _LINE.match(line)
+        if m:
+            rows.append((int(m.group(1)), int(m.group(2)), len(m.group(3)) // 2, m.group(4)))
+    return rows
+
+
+def check(module: str, runs: int = 5, top: int = 10, strict: bool = False) -> bool:
+    budget_ms, forbidden = BUDGETS.get(module, (None, ()))
+    samples = []
+    for _ in range(runs):
+        rows = measure(module)
+        samples.append((next((cum for _, cum, _, name in rows if name == module), 0), rows))
+    # Median run: one slow or one unusually fast import does not decide the result
+    samples.sort(key=lambda s: s[0])
+    total_us, rows = samples[(len(samples) - 1) // 2]
+    spread = f", runs {samples[0][0] / 1000:.0f}-{samples[-1][0] / 1000:.0f} ms" if runs > 1 else ""
+    loaded = {name.split(".")[0] for _, _, _, name in rows}
+    leaked = sorted(set(forbidden) & loaded)
+
+    over = budget_ms is not None and total_us / 1000 > budget_ms
+    ok = not leaked and not (strict and over)
+    status = "FAIL" if not ok else "SLOW" if over else "OK  "
+    budget = f"{budget_ms} ms" if budget_ms is not None else "no budget"
+    print(f"[{status}] import {module}: {total_us / 1000:.0f} ms median (budget {budget}{spread})")
+    if leaked:
+        print(f"       heavy modules loaded eagerly: {', '.join(leaked)}")
+
+    if top:
+        # Direct imports of the module: the depth-1 rows just above its own row
+        end = next(i for i, r in enumerate(rows) if r[3] == module and r[2] == 0)
+        start = end
+        while start > 0 and rows[start - 1][2] > 0:
+            start -= 1
+        top_level = [r for r in rows[start:end] if r[2] == 1]
+        for self_us, cum_us, _, name in sorted(top_level, key=lambda r: -r[1])[:top]:
+            print(f"       {cum_us / 1000:8.1f} ms  {name}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time regression check")
+    parser.add_argument("modules", nargs="*", default=list(BUDGETS), help="Modules to check")
+    parser.add_argument("--runs", type=int, default=5, help="Cold imports per module (median is kept)")
+    parser.add_argument("--top", type=int, default=5, help="Slowest top-level imports to list")
+    parser.add_argument("--strict", action="store_true", help="Fail when the median is over budget")
+    args = parser.parse_args()
+
+    results = [check(m, args.runs, args.top, args.strict) for m in args.modules]
+    sys.exit(0 if all(results) else 1)
+
+
+if __name__ == "__main__":
+    main()
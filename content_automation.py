@@ -30,30 +30,21 @@ from pathlib import Path
 
 
 
-import numpy as np
-
-import pandas as pd
+from stage_timer import stage, timed_call
 
 
 
 #  Use the ONE prediction engine 
 
-import broadcast_funcs as bf
-from prediction_engine import (
-
-    predict,
-
-    get_all_teams,
-
-    get_team_ranking,
+#  Imported on first use: the engine pulls in numpy/pandas, which callers
 
-    get_team_points,
+#  that only need WC2026_GROUPS or the name maps never touch.
 
-    get_team_star_impact,
+def _engine():
 
-    _data,
+    import prediction_engine
 
-)
+    return prediction_engine
 
 
 
@@ -173,7 +164,7 @@ def validate_team(name: str) -> bool:
 
     resolved = resolve_team_name(name)
 
-    all_teams = get_all_teams()
+    all_teams = _engine().get_all_teams()
 
     return resolved in all_teams
 
@@ -251,7 +242,73 @@ def analyze_match(home_team: str, away_team: str, neutral: bool = True) -> dict:
 
     home_arg = None if neutral else home_resolved
 
-    result = predict(home_resolved, away_resolved, home=home_arg)
+    with timed_call("analyze_match") as timings:
+
+        result = _engine().predict(home_resolved, away_resolved, home=home_arg)
+
+        with stage("analyze_match.enrich"):
+
+            analysis = match_analysis(home_team, away_team, result)
+
+    if timings is not None:
+
+        analysis["timings"] = timings
+
+    return analysis
+
+
+
+
+
+def analyze_matches(fixtures, neutral: bool = True) -> list[dict]:
+
+    """
+
+    analyze_match() for many fixtures with one batched engine pass: each
+
+    team's form, ranking, stars and coach are computed once.
+
+    fixtures: (home, away) or (home, away, venue) tuples, where venue is a
+
+    neutral flag (False puts the first team at home) or the name of the team
+
+    playing at home (None for neutral).
+
+    """
+
+    batch = []
+
+    for fx in fixtures:
+
+        home_resolved, away_resolved = resolve_team_name(fx[0]), resolve_team_name(fx[1])
+
+        venue = fx[2] if len(fx) > 2 else neutral
+
+        if isinstance(venue, bool):
+
+            host = None if venue else home_resolved
+
+        else:
+
+            host = resolve_team_name(venue) if venue else None
+
+            if host not in (None, home_resolved, away_resolved):
+
+                raise ValueError(f"home must be {fx[0]} or {fx[1]}, got {venue}")
+
+        batch.append((home_resolved, away_resolved, host))
+
+    results = _engine().predict_many(batch)
+
+    return [match_analysis(fx[0], fx[1], r) for fx, r in zip(fixtures, results)]
+
+
+
+
+
+def match_analysis(home_team: str, away_team: str, result: dict) -> dict:
+
+    """Content-friendly fields from one engine result."""
 
 
 
@@ -275,12 +332,6 @@ def analyze_match(home_team: str, away_team: str, neutral: bool = True) -> dict:
 
 
 
-    # Simulation stats from the goals arrays
-
-    goals_a = result.get("goals_a", np.array([]))
-
-    goals_b = result.get("goals_b", np.array([]))
-
 
 
     # Top scorelines from engine
@@ -335,6 +386,18 @@ def analyze_match(home_team: str, away_team: str, neutral: bool = True) -> dict:
 
 
 
+        # Head-to-head (from the engine's H2H index)
+
+        "h2h_matches": result.get("h2h_matches", 0),
+
+        "h2h_home_wins": result.get("h2h_wins_a", 0),
+
+        "h2h_draws": result.get("h2h_draws", 0),
+
+        "h2h_away_wins": result.get("h2h_wins_b", 0),
+
+
+
         # Top scorelines
 
         "top5_scorelines": top_scores[:5],
@@ -421,6 +484,18 @@ def generate_match_preview(home: str, away: str, a: dict) -> str:
 
 
 
+    if a.get("h2h_matches"):
+
+        h2h_line = (f" Head-to-head: {home} {a['h2h_home_wins']}W-{a['h2h_draws']}D-"
+
+                    f"{a['h2h_away_wins']}L in {a['h2h_matches']} meetings")
+
+    else:
+
+        h2h_line = " Head-to-head: first ever meeting"
+
+
+
     lines = [
 
         f" MATCH PREDICTION | {home} vs {away}",
@@ -429,6 +504,8 @@ def generate_match_preview(home: str, away: str, a: dict) -> str:
 
         f" FIFA Rankings: #{hr} vs #{ar}",
 
+        h2h_line,
+
         "",
 
         "WIN PROBABILITIES:",
@@ -510,6 +587,18 @@ def generate_spanish_preview(home: str, away: str, a: dict) -> str:
 
 
 
+    if a.get("h2h_matches"):
+
+        h2h_line = (f" Historial: {home} {a['h2h_home_wins']}G-{a['h2h_draws']}E-"
+
+                    f"{a['h2h_away_wins']}P en {a['h2h_matches']} partidos")
+
+    else:
+
+        h2h_line = " Historial: primer enfrentamiento"
+
+
+
     lines = [
 
         f" PREDICCIN | {home} vs {away}",
@@ -518,6 +607,8 @@ def generate_spanish_preview(home: str, away: str, a: dict) -> str:
 
         f" Rankings FIFA: #{hr} vs #{ar}",
 
+        h2h_line,
+
         "",
 
         "PROBABILIDADES:",
@@ -728,7 +819,8 @@ def generate_underdog_alert(home: str, away: str, a: dict) -> str | None:
 
 
 
-def predict_wc2026_group(group_letter: str, verbose: bool = True) -> dict:
+def predict_wc2026_group(group_letter: str, verbose: bool = True,
+                         use_cube: bool = False) -> dict:
 
     """
 
@@ -736,8 +828,29 @@ def predict_wc2026_group(group_letter: str, verbose: bool = True) -> dict:
 
     Returns standings with expected points, GD, GF.
 
+    With use_cube=True, fixtures are read from the precomputed prediction
+    cube (rebuilt if stale) instead of running the engine per match.
+
+    With stage timing on (stage_timer), the whole group is timed as "group".
+
     """
 
+    with timed_call("group") as timings:
+
+        result = _simulate_group(group_letter, verbose, use_cube)
+
+    if timings is not None and result:
+
+        result["timings"] = timings
+
+    return result
+
+
+
+
+
+def _simulate_group(group_letter: str, verbose: bool, use_cube: bool) -> dict:
+
     group_letter = group_letter.upper()
 
     if group_letter not in WC2026_GROUPS:
@@ -756,7 +869,7 @@ def predict_wc2026_group(group_letter: str, verbose: bool = True) -> dict:
 
     # Validate all teams exist
 
-    all_known = get_all_teams()
+    all_known = _engine().get_all_teams()
 
     for dt, rt in zip(display_teams, data_teams):
 
@@ -796,6 +909,18 @@ def predict_wc2026_group(group_letter: str, verbose: bool = True) -> dict:
 
 
 
+    cube = None
+
+    if use_cube:
+
+        from prediction_cube import load_cube
+
+        with stage("group.load_cube"):
+
+            cube = load_cube()
+
+
+
     match_num = 0
 
     for i in range(len(display_teams)):
@@ -812,7 +937,31 @@ def predict_wc2026_group(group_letter: str, verbose: bool = True) -> dict:
 
             # Analyze using the ONE engine (neutral venue for group stage)
 
-            a = analyze_match(h_display, a_display, neutral=True)
+            if cube is not None:
+
+                with stage("group.cube_query"):
+
+                    q = cube.query(data_teams[i], data_teams[j])
+
+                a = {
+
+                    "home_win_pct": q["team_a_win"],
+
+                    "draw_pct": q["draw"],
+
+                    "away_win_pct": q["team_b_win"],
+
+                    "home_exp": q["team_a_lambda"],
+
+                    "away_exp": q["team_b_lambda"],
+
+                    "top5_scorelines": q["top_scores"][:5],
+
+                }
+
+            else:
+
+                a = analyze_match(h_display, a_display, neutral=True)
 
 
 
@@ -888,15 +1037,17 @@ def predict_wc2026_group(group_letter: str, verbose: bool = True) -> dict:
 
     # Sort standings
 
-    standings = sorted(
+    with stage("group.standings"):
 
-        display_teams,
+        standings = sorted(
 
-        key=lambda t: (points[t], gd[t], gf_tot[t]),
+            display_teams,
 
-        reverse=True,
+            key=lambda t: (points[t], gd[t], gf_tot[t]),
 
-    )
+            reverse=True,
+
+        )
 
 
 
@@ -964,7 +1115,7 @@ def predict_wc2026_group(group_letter: str, verbose: bool = True) -> dict:
 
 
 
-def predict_all_wc2026_groups(verbose: bool = True) -> dict:
+def predict_all_wc2026_groups(verbose: bool = True, use_cube: bool = False) -> dict:
 
     """Predict all 12 World Cup 2026 groups."""
 
@@ -980,7 +1131,7 @@ def predict_all_wc2026_groups(verbose: bool = True) -> dict:
 
         print(f"   Powered by Mundialista AI (Dixon-Coles Poisson)")
 
-        print(f"   Based on {len(get_all_teams())} teams in database")
+        print(f"   Based on {len(_engine().get_all_teams())} teams in database")
 
         print(f"{sep}\n")
 
@@ -992,7 +1143,7 @@ def predict_all_wc2026_groups(verbose: bool = True) -> dict:
 
     for group in sorted(WC2026_GROUPS.keys()):
 
-        result = predict_wc2026_group(group, verbose=verbose)
+        result = predict_wc2026_group(group, verbose=verbose, use_cube=use_cube)
 
         all_results[group] = result
 
@@ -1088,7 +1239,7 @@ def show_teams():
 
     """Display all available teams with basic stats."""
 
-    all_teams = get_all_teams()
+    all_teams = _engine().get_all_teams()
 
     print(f"\n   AVAILABLE TEAMS ({len(all_teams)} total)")
 
@@ -1098,7 +1249,7 @@ def show_teams():
 
     for i, team in enumerate(all_teams, 1):
 
-        rank = get_team_ranking(team)
+        rank = _engine().get_team_ranking(team)
 
         rank_str = f"#{rank:<4d}" if rank < 200 else "    "
 
@@ -1128,7 +1279,7 @@ def select_team(prompt: str) -> str:
 
     """Interactive team selector with fuzzy matching."""
 
-    all_teams = get_all_teams()
+    all_teams = _engine().get_all_teams()
 
 
 
@@ -1240,7 +1391,7 @@ def interactive_menu():
     print("")
     print(sep)
     print("  " + I["BALL"] + " MUNDIALISTA AI -- Content Generator v3")
-    print("  " + I["CHART"] + " " + str(len(get_all_teams())) + " Teams | Dixon-Coles Poisson Engine")
+    print("  " + I["CHART"] + " " + str(len(_engine().get_all_teams())) + " Teams | Dixon-Coles Poisson Engine")
     print(sep)
 
     while True:
@@ -1364,6 +1515,7 @@ def interactive_menu():
             away = select_team("  Away team: ")
             print("  " + I["BRAIN"] + " Running prediction: " + home + " vs " + away + "...")
             a = analyze_match(home, away)
+            import broadcast_funcs as bf
             print("")
             print(sep)
             if choice == "8":
@@ -1393,7 +1545,7 @@ def interactive_menu():
             elif choice == "14":
                 print("  STAR IMPACT CARD:")
                 print(sep)
-                print(bf.generate_star_impact_card(home, away, resolve_team_name, get_team_star_impact))
+                print(bf.generate_star_impact_card(home, away, resolve_team_name, _engine().get_team_star_impact))
             elif choice == "15":
                 print("  AI VERDICT:")
                 print(sep)
@@ -1440,5 +1592,13 @@ def interactive_menu():
 
 if __name__ == "__main__":
 
-    interactive_menu()
+    from profiling import profiled, requested_mode
+
+
+
+    # --profile or MUNDIALISTA_PROFILE: profile the whole session
+
+    with profiled("content_automation", requested_mode(), all_threads=True):
+
+        interactive_menu()
 
@@ -0,0 +1,169 @@
+"""
+Mundialista AI - Matchday Content Batch
+Fixture list in, a whole matchday of social content out, in one command.
+
+    1. one batched prediction pass (content_automation.analyze_matches)
+    2. English preview, Spanish preview, Twitter thread and underdog alert
+       rendered per fixture on a worker pool
+    3. records streamed, in fixture order, to <stem>.jsonl and <stem>.md
+
+With --broadcast each record also carries the broadcast pack
+(broadcast_funcs), rendered from the same match context.
+
+Fixture CSV columns: team_a, team_b[, home]  (same format as batch_report.py;
+display or dataset names). A fixture is neutral unless `home` is set.
+
+Usage:
+    python content_batch.py --fixtures matchday1.csv
+    python content_batch.py --group A --group B
+    python content_batch.py --groups --broadcast --out content_output/groups
+"""
+
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from itertools import combinations
+from pathlib import Path
+
+import metrics
+from profiling import profiled, requested_mode
+from content_automation import (
+    OUTPUT_DIR,
+    WC2026_GROUPS,
+    analyze_matches,
+    generate_match_preview,
+    generate_spanish_preview,
+    generate_twitter_thread,
+    generate_underdog_alert,
+    resolve_team_name,
+)
+
+# Analysis fields carried into each JSONL record next to the content
+RECORD_FIELDS = (
+    "home_win_pct", "draw_pct", "away_win_pct", "home_exp", "away_exp",
+    "home_rank", "away_rank", "match_type", "favourite", "underdog", "upset_prob",
+)
+
+
+def read_fixtures(path) -> list:
+    """[(team_a, team_b, home)] from a team_a, team_b[, home] CSV; home is None when neutral."""
+    from batch_report import read_fixtures as read_csv
+
+    fixtures = read_csv(path)
+    for a, b, home in fixtures:
+        if home and resolve_team_name(home) not in (resolve_team_name(a), resolve_team_name(b)):
+            raise ValueError(f"{a} vs {b}: home must be team_a or team_b, got {home}")
+    return fixtures
+
+
+def group_fixtures(letters) -> list:
+    """Neutral (home, away, None) fixtures for the given WC 2026 groups, display names."""
+    return [(h, a, None) for g in letters for h, a in combinations(WC2026_GROUPS[g.upper()], 2)]
+
+
+def render_content(analysis: dict, broadcast: bool = False) -> dict:
+    """Every content type for one analysed fixture, as one JSON-ready record."""
+    home, away = analysis["home_display"], analysis["away_display"]
+    record = {"home": home, "away": away}
+    record.update({k: analysis[k] for k in RECORD_FIELDS})
+    top = analysis["top5_scorelines"]
+    record["top_score"] = list(top[0]) if top else None
+    record["preview_en"] = generate_match_preview(home, away, analysis)
+    record["preview_es"] = generate_spanish_preview(home, away, analysis)
+    record["thread"] = generate_twitter_thread(home, away, analysis)
+    record["underdog_alert"] = generate_underdog_alert(home, away, analysis)
+    if broadcast:
+        import broadcast_funcs as bf
+
+        record["broadcast_pack"] = bf.render_pack(bf.match_context(home, away, analysis))
+    return record
+
+
+def run_content_batch(fixtures: list, workers: int = 4, broadcast: bool = False):
+    """Yield one content record per fixture, in fixture order."""
+    analyses = analyze_matches(fixtures)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(partial(render_content, broadcast=broadcast), analyses)
+
+
+def markdown_section(record: dict) -> str:
+    thread = "\n\n".join(f"**{i}/{len(record['thread'])}**\n\n{tweet}"
+                         for i, tweet in enumerate(record["thread"], 1))
+    parts = [
+        f"## {record['home']} vs {record['away']}",
+        f"{record['home_win_pct']:.1f}% / {record['draw_pct']:.1f}% / {record['away_win_pct']:.1f}%"
+        f" | upset {record['upset_prob']:.1f}% ({record['underdog']})",
+        "### Preview (EN)", f"```\n{record['preview_en']}\n```",
+        "### Preview (ES)", f"```\n{record['preview_es']}\n```",
+        "### Twitter thread", thread,
+    ]
+    if record["underdog_alert"]:
+        parts += ["### Underdog alert", f"```\n{record['underdog_alert']}\n```"]
+    if record.get("broadcast_pack"):
+        parts += ["### Broadcast pack", f"```\n{record['broadcast_pack']}\n```"]
+    return "\n\n".join(parts) + "\n\n"
+
+
+def write_bundle(records, out_dir: Path = OUTPUT_DIR, stem: str = None) -> tuple:
+    """Stream records to <stem>.jsonl and <stem>.md; returns (jsonl, md, count)."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    stem = stem or f"matchday_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    jsonl_path, md_path = out_dir / f"{stem}.jsonl", out_dir / f"{stem}.md"
+
+    count = 0
+    with open(jsonl_path, "w", encoding="utf-8") as jf, open(md_path, "w", encoding="utf-8") as mf:
+        mf.write(f"# Mundialista AI - Matchday content ({datetime.now():%Y-%m-%d %H:%M})\n\n")
+        for record in records:
+            jf.write(json.dumps(record, ensure_ascii=False) + "\n")
+            mf.write(markdown_section(record))
+            count += 1
+    return str(jsonl_path), str(md_path), count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch social content for a list of fixtures")
+    src = parser.add_mutually_exclusive_group(required=True)
+    src.add_argument("--fixtures", help="CSV with team_a, team_b[, home] columns")
+    src.add_argument("--group", action="append", help="WC 2026 group letter (repeatable)")
+    src.add_argument("--groups", action="store_true", help="All 72 WC 2026 group fixtures")
+    parser.add_argument("--out", default=str(OUTPUT_DIR), help="Output directory")
+    parser.add_argument("--name", default=None, help="Output file stem (default: matchday_<timestamp>)")
+    parser.add_argument("--workers", type=int, default=4, help="Content rendering threads")
+    parser.add_argument("--broadcast", action="store_true", help="Include the full broadcast pack")
+    parser.add_argument("--profile", action="store_true", help="Profile the run into profiles/ (profiling.py)")
+    args = parser.parse_args()
+
+    if args.fixtures:
+        try:
+            fixtures = read_fixtures(args.fixtures)
+        except ValueError as e:
+            print(f"[ERROR] {e}")
+            sys.exit(1)
+    else:
+        letters = sorted(WC2026_GROUPS) if args.groups else args.group
+        unknown = [g for g in letters if g.upper() not in WC2026_GROUPS]
+        if unknown:
+            print(f"[ERROR] Unknown group(s): {', '.join(unknown)}")
+            sys.exit(1)
+        fixtures = group_fixtures(letters)
+    if not fixtures:
+        print("[ERROR] No fixtures.")
+        sys.exit(1)
+
+    metrics.start_from_env()
+    t0 = time.perf_counter()
+    with profiled("content_batch", requested_mode(args.profile), all_threads=True):
+        records = run_content_batch(fixtures, args.workers, args.broadcast)
+        jsonl_path, md_path, count = write_bundle(records, args.out, args.name)
+    print(f"[INFO] {count} fixtures in {time.perf_counter() - t0:.1f}s")
+    print(f"  {jsonl_path}")
+    print(f"  {md_path}")
+
+
+if __name__ == "__main__":
+    main()
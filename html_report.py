@@ -0,0 +1,563 @@
+"""
+Mundialista AI - HTML Match Report
+The web report and its vector charts. Nothing here imports matplotlib:
+generate_html_report() either links the PNGs made by chart_generator or,
+given no chart paths, inlines SVG charts filled straight from the result
+(a few milliseconds and a few KB per match).
+
+Usage:
+    from html_report import generate_html_report
+
+    generate_html_report(result, "Argentina", "Brazil")               # SVG
+    generate_html_report(result, "Argentina", "Brazil", chart_paths)  # PNG
+"""
+
+import math
+import os
+from html import escape
+from pathlib import Path
+
+import numpy as np
+
+# -----------------------------
+# Theme
+# -----------------------------
+THEME = {
+    "green": "#0F5C4D",
+    "green_2": "#0B6B57",
+    "green_3": "#16806A",
+    "gold": "#C9A227",
+    "gold_2": "#E1C15B",
+    "ivory": "#F8F7F2",
+    "white": "#FFFFFF",
+    "charcoal": "#1E1E1E",
+    "muted": "#6B7280",
+    "light_gray": "#E8E6DE",
+    "grid": "#D9D7CF"
+}
+
+OUTPUT_DIR = Path("predictions_output")
+OUTPUT_DIR.mkdir(exist_ok=True)
+
+# -----------------------------
+# Helpers
+# -----------------------------
+def slugify(text):
+    return (
+        str(text).strip().lower()
+        .replace(" ", "_")
+        .replace("/", "_")
+        .replace("\\", "_")
+    )
+
+def base_filename(team_a, team_b):
+    return f"{slugify(team_a)}_vs_{slugify(team_b)}"
+
+def build_insight(result, team_a, team_b):
+    a = result.get("team_a_win", 0)
+    d = result.get("draw", 0)
+    b = result.get("team_b_win", 0)
+    la = result.get("team_a_lambda", 0)
+    lb = result.get("team_b_lambda", 0)
+    match_type = result.get("match_type", "Competitive")
+
+    if abs(a - b) <= 6:
+        edge = f"{team_a} and {team_b} project as closely matched."
+    elif a > b:
+        edge = f"{team_a} hold the model edge."
+    else:
+        edge = f"{team_b} hold the model edge."
+
+    if d >= 27:
+        draw_note = "Draw probability is elevated, suggesting limited separation."
+    elif d <= 20:
+        draw_note = "A decisive result is more likely than usual."
+    else:
+        draw_note = "The draw remains a meaningful live outcome."
+
+    total_lambda = la + lb
+    if total_lambda >= 2.9:
+        goals_note = "Expected goals suggest a more open scoring environment."
+    elif total_lambda <= 2.3:
+        goals_note = "Expected goals point to a tighter, lower-scoring match."
+    else:
+        goals_note = "Expected goals sit in a moderate range."
+
+    return f"{match_type}. {edge} {draw_note} {goals_note}"
+
+# -----------------------------
+# SVG charts (vector report, no matplotlib)
+# -----------------------------
+# Templates are assembled once at import: titles, card, axes and colours are
+# baked in, so a chart is one str.format() over the result's numbers.
+
+SVG_COLORS = {
+    "outcomes": (THEME["green"], THEME["gold"], "#7B8391"),
+    "top": THEME["green"],
+    "rest": "#9BBCAF",
+    # ColorBrewer "Greens" (the matplotlib heatmap colormap)
+    "heat": ("#F7FCF5", "#E5F5E0", "#C7E9C0", "#A1D99B", "#74C476",
+             "#41AB5D", "#238B45", "#006D2C", "#00441B"),
+}
+
+_HEAT_RGB = np.array([[int(c[i:i + 2], 16) for i in (1, 3, 5)] for c in SVG_COLORS["heat"]], dtype=float)
+
+def _svg_frame(width, height, title, subtitle):
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
+        f'font-family="Segoe UI, Arial, sans-serif" role="img">'
+        f'<rect x="0.5" y="0.5" width="{width - 1}" height="{height - 1}" rx="14" '
+        f'fill="{THEME["white"]}" stroke="{THEME["light_gray"]}"/>'
+        f'<text x="20" y="30" font-size="16" font-weight="700" fill="{THEME["green"]}">{title}</text>'
+        f'<text x="20" y="48" font-size="11" fill="{THEME["muted"]}">{subtitle}</text>'
+        "{body}</svg>"
+    )
+
+def _heat_color(t):
+    """Greens colormap at t in [0, 1]."""
+    x = min(max(t, 0.0), 1.0) * (len(_HEAT_RGB) - 1)
+    i = min(int(x), len(_HEAT_RGB) - 2)
+    r, g, b = _HEAT_RGB[i] + (_HEAT_RGB[i + 1] - _HEAT_RGB[i]) * (x - i)
+    return f"#{int(round(r)):02X}{int(round(g)):02X}{int(round(b)):02X}"
+
+def _nice_ticks(top, count=5):
+    step = max(1, math.ceil(top / count / 5) * 5) if top > 10 else max(1, math.ceil(top / count))
+    return list(range(0, int(top) + 1, step))
+
+# -- probability bars --
+_PROB_W, _PROB_H = 600, 340
+_PROB_X0, _PROB_Y0, _PROB_PW, _PROB_PH = 60, 70, 510, 220
+_PROB_SVG = _svg_frame(_PROB_W, _PROB_H, "Win / Draw / Loss Probability", "Model-estimated outcome distribution")
+_PROB_GRID = (f'<line x1="{_PROB_X0}" x2="{_PROB_X0 + _PROB_PW}" y1="{{y:.1f}}" y2="{{y:.1f}}" '
+              f'stroke="{THEME["grid"]}" stroke-opacity="0.6"/>'
+              f'<text x="{_PROB_X0 - 8}" y="{{y:.1f}}" dy="4" font-size="10" text-anchor="end" '
+              f'fill="{THEME["charcoal"]}">{{tick}}</text>')
+_PROB_BAR = ('<rect x="{x:.1f}" y="{y:.1f}" width="{w:.1f}" height="{h:.1f}" fill="{color}"/>'
+             '<text x="{cx:.1f}" y="{ty:.1f}" font-size="13" font-weight="700" text-anchor="middle" '
+             f'fill="{THEME["charcoal"]}">{{value:.1f}}%</text>'
+             f'<text x="{{cx:.1f}}" y="{_PROB_Y0 + _PROB_PH + 20}" font-size="12" text-anchor="middle" '
+             f'fill="{THEME["charcoal"]}">{{label}}</text>')
+
+def probability_svg(result, team_a, team_b):
+    values = [result.get("team_a_win", 0), result.get("draw", 0), result.get("team_b_win", 0)]
+    labels = [f"{escape(team_a)} Win", "Draw", f"{escape(team_b)} Win"]
+    top = max(values) + 12
+    scale = _PROB_PH / top
+    base = _PROB_Y0 + _PROB_PH
+    parts = [_PROB_GRID.format(y=base - t * scale, tick=t) for t in _nice_ticks(top)]
+    slot = _PROB_PW / 3
+    for k, (val, label, color) in enumerate(zip(values, labels, SVG_COLORS["outcomes"])):
+        h = val * scale
+        x = _PROB_X0 + slot * k + slot * 0.21
+        parts.append(_PROB_BAR.format(x=x, y=base - h, w=slot * 0.58, h=h, color=color,
+                                      cx=x + slot * 0.29, ty=base - h - 6, value=val, label=label))
+    return _PROB_SVG.format(body="".join(parts))
+
+# -- top scorelines --
+_TOP_N = 8
+_TOP_W, _TOP_H = 600, 340
+_TOP_X0, _TOP_Y0, _TOP_PW, _TOP_ROW = 60, 66, 480, 32
+_TOP_SVG = _svg_frame(_TOP_W, _TOP_H, "Most Likely Exact Scorelines", "Probability of each exact score (%)")
+_TOP_ROW_SVG = ('<text x="{lx}" y="{ty:.1f}" font-size="12" text-anchor="end" '
+                f'fill="{THEME["charcoal"]}">{{label}}</text>'
+                '<rect x="{x0}" y="{y:.1f}" width="{w:.1f}" height="{h:.1f}" fill="{color}"/>'
+                '<text x="{vx:.1f}" y="{ty:.1f}" font-size="12" font-weight="700" '
+                f'fill="{THEME["charcoal"]}">{{value:.1f}}</text>')
+
+def top_scores_svg(result, team_a, team_b):
+    rows = [(str(item[0]), float(item[1])) for item in result.get("top_scores", [])[:_TOP_N]
+            if isinstance(item, (list, tuple)) and len(item) >= 2]
+    top = max((v for _, v in rows), default=0) or 1.0
+    scale = _TOP_PW / (top * 1.05)
+    parts = []
+    for k, (label, val) in enumerate(rows):
+        y = _TOP_Y0 + k * _TOP_ROW
+        w = val * scale
+        parts.append(_TOP_ROW_SVG.format(
+            lx=_TOP_X0 - 10, x0=_TOP_X0, y=y + 5, w=w, h=_TOP_ROW * 0.62, ty=y + 5 + _TOP_ROW * 0.31 + 4,
+            vx=_TOP_X0 + w + 6, label=escape(label), value=val,
+            color=SVG_COLORS["top"] if k == 0 else SVG_COLORS["rest"]))
+    return _TOP_SVG.format(body="".join(parts))
+
+# -- score matrix heatmap --
+_MAT_N = 6
+_MAT_CELL = 56
+_MAT_X0, _MAT_Y0 = 70, 70
+_MAT_W, _MAT_H = _MAT_X0 + _MAT_N * _MAT_CELL + 20, _MAT_Y0 + _MAT_N * _MAT_CELL + 50
+_MAT_SVG = _svg_frame(_MAT_W, _MAT_H, "Exact Score Probability Matrix",
+                      "Darker cells indicate more likely scorelines")
+_MAT_AXES = "".join(
+    [f'<text x="{_MAT_X0 + j * _MAT_CELL + _MAT_CELL / 2:.0f}" y="{_MAT_Y0 + _MAT_N * _MAT_CELL + 16}" '
+     f'font-size="11" text-anchor="middle" fill="{THEME["charcoal"]}">{j}</text>' for j in range(_MAT_N)]
+    + [f'<text x="{_MAT_X0 - 8}" y="{_MAT_Y0 + i * _MAT_CELL + _MAT_CELL / 2 + 4:.0f}" '
+       f'font-size="11" text-anchor="end" fill="{THEME["charcoal"]}">{i}</text>' for i in range(_MAT_N)]
+)
+_MAT_LABELS = (f'<text x="{_MAT_X0 + _MAT_N * _MAT_CELL / 2:.0f}" y="{_MAT_H - 12}" font-size="12" '
+               f'text-anchor="middle" fill="{THEME["charcoal"]}">{{team_b}} goals</text>'
+               f'<text transform="translate(24 {_MAT_Y0 + _MAT_N * _MAT_CELL / 2:.0f}) rotate(-90)" '
+               f'font-size="12" text-anchor="middle" fill="{THEME["charcoal"]}">{{team_a}} goals</text>')
+_MAT_CELL_SVG = ('<rect x="{x}" y="{y}" width="' + str(_MAT_CELL) + '" height="' + str(_MAT_CELL)
+                 + '" fill="{fill}"/><text x="{cx}" y="{cy}" font-size="11" text-anchor="middle" '
+                 'fill="{ink}">{value:.1f}</text>')
+_MAT_MARK = (f'<rect x="{{x}}" y="{{y}}" width="{_MAT_CELL}" height="{_MAT_CELL}" fill="none" '
+             f'stroke="{THEME["gold"]}" stroke-width="2.5"/>')
+
+def matrix_svg(result, team_a, team_b):
+    matrix = result.get("score_matrix")
+    if matrix is None:
+        from prediction_engine import build_score_matrix
+        matrix = build_score_matrix(result.get("team_a_lambda", 0), result.get("team_b_lambda", 0))
+    matrix = np.asarray(matrix, dtype=float)[:_MAT_N, :_MAT_N]
+    lo, hi = float(matrix.min()), float(matrix.max())
+    span = (hi - lo) or 1.0
+    parts = [_MAT_AXES, _MAT_LABELS.format(team_a=escape(team_a), team_b=escape(team_b))]
+    for (i, j), val in np.ndenumerate(matrix):
+        x, y = _MAT_X0 + j * _MAT_CELL, _MAT_Y0 + i * _MAT_CELL
+        parts.append(_MAT_CELL_SVG.format(
+            x=x, y=y, cx=x + _MAT_CELL // 2, cy=y + _MAT_CELL // 2 + 4, value=val * 100,
+            fill=_heat_color((val - lo) / span),
+            ink="#FFFFFF" if val > hi * 0.55 else THEME["charcoal"]))
+    for flat in np.argsort(matrix.ravel())[::-1][:3]:
+        i, j = divmod(int(flat), matrix.shape[1])
+        parts.append(_MAT_MARK.format(x=_MAT_X0 + j * _MAT_CELL, y=_MAT_Y0 + i * _MAT_CELL))
+    return _MAT_SVG.format(body="".join(parts))
+
+# -- goal distribution --
+_GOALS_MAX = 6
+_GOALS_W, _GOALS_H = 600, 340
+_GOALS_X0, _GOALS_Y0, _GOALS_PW, _GOALS_PH = 60, 80, 510, 210
+_GOALS_SVG = _svg_frame(_GOALS_W, _GOALS_H, "Goal Distribution", "Independent Poisson goal likelihood by team")
+_GOALS_BAR = '<rect x="{x:.1f}" y="{y:.1f}" width="{w:.1f}" height="{h:.1f}" fill="{color}"/>'
+_GOALS_AXIS = "".join(
+    f'<text x="{_GOALS_X0 + (k + 0.5) * _GOALS_PW / (_GOALS_MAX + 1):.1f}" y="{_GOALS_Y0 + _GOALS_PH + 18}" '
+    f'font-size="11" text-anchor="middle" fill="{THEME["charcoal"]}">{k}</text>' for k in range(_GOALS_MAX + 1)
+)
+_GOALS_LEGEND = (f'<rect x="380" y="22" width="12" height="12" fill="{THEME["green"]}"/>'
+                 f'<text x="398" y="32" font-size="11" fill="{THEME["charcoal"]}">{{team_a}}</text>'
+                 f'<rect x="380" y="40" width="12" height="12" fill="{THEME["gold"]}"/>'
+                 f'<text x="398" y="50" font-size="11" fill="{THEME["charcoal"]}">{{team_b}}</text>')
+
+def goals_svg(result, team_a, team_b):
+    k = np.arange(_GOALS_MAX + 1)
+    log_fact = np.cumsum(np.log(np.maximum(k, 1)))
+    dists = []
+    for lam in (result.get("team_a_lambda", 0), result.get("team_b_lambda", 0)):
+        lam = max(float(lam), 1e-9)
+        dists.append(100 * np.exp(k * math.log(lam) - lam - log_fact))
+    scale = _GOALS_PH / (max(float(d.max()) for d in dists) * 1.05)
+    slot = _GOALS_PW / (_GOALS_MAX + 1)
+    base = _GOALS_Y0 + _GOALS_PH
+    parts = [_GOALS_AXIS, _GOALS_LEGEND.format(team_a=escape(team_a), team_b=escape(team_b))]
+    for side, (dist, color) in enumerate(zip(dists, (THEME["green"], THEME["gold"]))):
+        for g, val in enumerate(dist):
+            h = float(val) * scale
+            parts.append(_GOALS_BAR.format(x=_GOALS_X0 + g * slot + slot * (0.12 + 0.38 * side), y=base - h,
+                                           w=slot * 0.38, h=h, color=color))
+    return _GOALS_SVG.format(body="".join(parts))
+
+SVG_CHARTS = {
+    "probability": probability_svg,
+    "matrix": matrix_svg,
+    "top_scores": top_scores_svg,
+    "goals": goals_svg,
+}
+
+def svg_charts(result, team_a, team_b):
+    """Inline SVG markup for the four report charts."""
+    return {name: fn(result, team_a, team_b) for name, fn in SVG_CHARTS.items()}
+
+# -----------------------------
+# HTML report
+# -----------------------------
+def _chart_markup(name, alt, chart_paths, svgs):
+    if name in svgs:
+        return svgs[name]
+    return f'<img src="{os.path.basename(chart_paths[name])}" alt="{alt}">'
+
+def generate_html_report(result, team_a, team_b, chart_paths=None, out_dir=None):
+    """
+    Write the match report. With chart_paths (from generate_all_charts) the
+    charts are linked PNGs; without, they are inline SVG drawn from the
+    result directly, so the report needs no matplotlib and no image files.
+    """
+    out_dir = Path(out_dir) if out_dir is not None else OUTPUT_DIR
+    out_dir.mkdir(parents=True, exist_ok=True)
+    html_path = out_dir / f"{base_filename(team_a, team_b)}.html"
+
+    insight = build_insight(result, team_a, team_b)
+    svgs = svg_charts(result, team_a, team_b) if chart_paths is None else {}
+
+    score_items = ""
+    for item in result.get("top_scores", [])[:6]:
+        if isinstance(item, (list, tuple)) and len(item) >= 2:
+            score_items += f'<span class="score-pill">{item[0]}  -  {item[1]}</span>'
+        else:
+            score_items += f'<span class="score-pill">{item}</span>'
+
+    html = f'''
+<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>Mundialista AI Report — {team_a} vs {team_b}</title>
+<style>
+:root {{
+    --green: #0F5C4D;
+    --green2: #0B6B57;
+    --gold: #C9A227;
+    --ivory: #F8F7F2;
+    --white: #FFFFFF;
+    --text: #1E1E1E;
+    --muted: #6B7280;
+    --border: rgba(15, 92, 77, 0.12);
+    --shadow: 0 8px 24px rgba(0,0,0,0.05);
+    --radius: 20px;
+}}
+* {{
+    box-sizing: border-box;
+}}
+body {{
+    margin: 0;
+    background: var(--ivory);
+    color: var(--text);
+    font-family: "Segoe UI", Arial, sans-serif;
+}}
+.container {{
+    max-width: 1180px;
+    margin: 0 auto;
+    padding: 32px 20px 48px;
+}}
+.hero {{
+    background: linear-gradient(135deg, var(--green), var(--green2));
+    color: white;
+    border-radius: 28px;
+    padding: 32px;
+    box-shadow: var(--shadow);
+    margin-bottom: 24px;
+}}
+.hero h1 {{
+    margin: 0 0 6px 0;
+    font-size: 2.25rem;
+}}
+.hero p {{
+    margin: 6px 0;
+    color: rgba(255,255,255,0.88);
+}}
+.hero .tag {{
+    display: inline-block;
+    margin-top: 12px;
+    padding: 8px 12px;
+    border-radius: 999px;
+    background: rgba(201,162,39,0.18);
+    border: 1px solid rgba(201,162,39,0.3);
+    color: #F7E7B0;
+    font-weight: 700;
+    font-size: 0.85rem;
+}}
+.card {{
+    background: var(--white);
+    border: 1px solid var(--border);
+    border-radius: var(--radius);
+    padding: 22px;
+    box-shadow: var(--shadow);
+    margin-bottom: 18px;
+}}
+.section-title {{
+    color: var(--green);
+    margin: 0 0 14px 0;
+    font-size: 1.1rem;
+}}
+.vs {{
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    gap: 14px;
+}}
+.team {{
+    font-size: 1.45rem;
+    font-weight: 800;
+    color: var(--green);
+}}
+.rank {{
+    color: var(--muted);
+    margin-top: 4px;
+}}
+.vs-badge {{
+    padding: 10px 14px;
+    border-radius: 999px;
+    background: rgba(201,162,39,0.12);
+    border: 1px solid rgba(201,162,39,0.25);
+    color: #8A6B00;
+    font-weight: 800;
+}}
+.metrics {{
+    display: grid;
+    grid-template-columns: repeat(6, 1fr);
+    gap: 12px;
+    margin-top: 18px;
+}}
+.metric {{
+    background: #FCFCFA;
+    border: 1px solid var(--border);
+    border-radius: 16px;
+    padding: 14px;
+}}
+.metric .label {{
+    color: var(--muted);
+    font-size: 0.82rem;
+    margin-bottom: 6px;
+}}
+.metric .value {{
+    color: var(--green);
+    font-size: 1.45rem;
+    font-weight: 800;
+}}
+.badges {{
+    margin-top: 14px;
+}}
+.badge {{
+    display: inline-block;
+    padding: 7px 10px;
+    border-radius: 999px;
+    margin-right: 8px;
+    font-size: 0.8rem;
+    font-weight: 700;
+}}
+.badge-green {{
+    background: rgba(15,92,77,0.10);
+    color: var(--green);
+    border: 1px solid rgba(15,92,77,0.18);
+}}
+.badge-gold {{
+    background: rgba(201,162,39,0.14);
+    color: #8A6B00;
+    border: 1px solid rgba(201,162,39,0.25);
+}}
+.insight {{
+    border-left: 4px solid var(--gold);
+    background: #FFFDF6;
+    padding: 14px 16px;
+    border-radius: 12px;
+    line-height: 1.55;
+}}
+.grid {{
+    display: grid;
+    grid-template-columns: 1fr 1fr;
+    gap: 18px;
+}}
+.chart-card img {{
+    width: 100%;
+    border-radius: 14px;
+    border: 1px solid var(--border);
+}}
+.chart-card svg {{
+    display: block;
+    width: 100%;
+    height: auto;
+}}
+.score-pill {{
+    display: inline-block;
+    padding: 9px 12px;
+    border-radius: 12px;
+    background: #FAFAF7;
+    border: 1px solid var(--border);
+    margin: 6px 8px 0 0;
+    color: var(--green);
+    font-weight: 700;
+}}
+.footer {{
+    text-align: center;
+    color: var(--muted);
+    margin-top: 24px;
+    font-size: 0.9rem;
+}}
+@media (max-width: 900px) {{
+    .metrics {{
+        grid-template-columns: repeat(2, 1fr);
+    }}
+    .grid {{
+        grid-template-columns: 1fr;
+    }}
+    .vs {{
+        flex-direction: column;
+        align-items: flex-start;
+    }}
+}}
+</style>
+</head>
+<body>
+<div class="container">
+    <div class="hero">
+        <h1>Mundialista AI</h1>
+        <p>International Match Intelligence</p>
+        <p>{team_a} vs {team_b}</p>
+        <span class="tag">Refined match forecast report</span>
+    </div>
+
+    <div class="card">
+        <div class="vs">
+            <div>
+                <div class="team">{team_a}</div>
+                <div class="rank">FIFA Rank: {result.get("team_a_rank", "N/A")}</div>
+            </div>
+            <div class="vs-badge">VS</div>
+            <div style="text-align:right;">
+                <div class="team">{team_b}</div>
+                <div class="rank">FIFA Rank: {result.get("team_b_rank", "N/A")}</div>
+            </div>
+        </div>
+
+        <div class="badges">
+            <span class="badge badge-gold">{result.get("match_type", "Competitive")}</span>
+            <span class="badge badge-green">Monte Carlo Forecast</span>
+        </div>
+
+        <div class="metrics">
+            <div class="metric"><div class="label">{team_a} Win</div><div class="value">{result.get("team_a_win", 0):.1f}%</div></div>
+            <div class="metric"><div class="label">Draw</div><div class="value" style="color:#8A6B00;">{result.get("draw", 0):.1f}%</div></div>
+            <div class="metric"><div class="label">{team_b} Win</div><div class="value">{result.get("team_b_win", 0):.1f}%</div></div>
+            <div class="metric"><div class="label">{team_a} ?</div><div class="value">{result.get("team_a_lambda", 0):.2f}</div></div>
+            <div class="metric"><div class="label">{team_b} ?</div><div class="value">{result.get("team_b_lambda", 0):.2f}</div></div>
+            <div class="metric"><div class="label">Model</div><div class="value" style="font-size:1.1rem;">Poisson + Form</div></div>
+        </div>
+    </div>
+
+    <div class="card">
+        <h3 class="section-title">Model Insight</h3>
+        <div class="insight">{insight}</div>
+    </div>
+
+    <div class="card">
+        <h3 class="section-title">Most Likely Scorelines</h3>
+        <div>{score_items}</div>
+    </div>
+
+    <div class="grid">
+        <div class="card chart-card">
+            <h3 class="section-title">Probability Profile</h3>
+            {_chart_markup("probability", "Probability chart", chart_paths, svgs)}
+        </div>
+        <div class="card chart-card">
+            <h3 class="section-title">Score Matrix</h3>
+            {_chart_markup("matrix", "Score matrix chart", chart_paths, svgs)}
+        </div>
+        <div class="card chart-card">
+            <h3 class="section-title">Top Scorelines</h3>
+            {_chart_markup("top_scores", "Top scores chart", chart_paths, svgs)}
+        </div>
+        <div class="card chart-card">
+            <h3 class="section-title">Goal Distribution</h3>
+            {_chart_markup("goals", "Goal distribution chart", chart_paths, svgs)}
+        </div>
+    </div>
+
+    <div class="footer">
+        Mundialista AI • International football prediction system
+    </div>
+</div>
+</body>
+</html>
+'''
+    html_path.write_text(html, encoding="utf-8")
+    return str(html_path)
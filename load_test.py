@@ -0,0 +1,297 @@
+"""
+Mundialista AI - Load Test Harness
+Replays a realistic request mix against the engine (in-process) or against a
+running prediction_service, from N concurrent threads or processes, and
+reports throughput plus p50/p95/p99 latency per operation.
+
+Operations (weights set with --mix):
+    predict   predict() for a random WC 2026 pairing (neutral)
+    whatif    the same with home advantage for team A
+    group     predict_wc2026_group() for a random group (six predictions)
+    h2h       head_to_head() lookup (engine target only)
+
+The request sequence comes from --seed, so two runs replay the same mix.
+Results can be saved with --json and compared across versions.
+
+Usage:
+    python load_test.py --requests 200 --concurrency 4
+    python load_test.py --duration 30 --mode process --concurrency 2 --json runs/v8.json
+    python load_test.py --target http://127.0.0.1:8765 --concurrency 16
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import combinations
+from urllib.parse import urlencode
+from urllib.request import urlopen
+
+DEFAULT_MIX = {"predict": 6, "whatif": 2, "group": 1, "h2h": 3}
+HTTP_OPS = ("predict", "whatif", "group")
+READY_TIMEOUT = 600         # seconds for process workers to load the engine
+
+
+# ──────────────────────────────────────────────
+#  WORKLOAD
+# ──────────────────────────────────────────────
+
+def parse_mix(text: str) -> dict:
+    """'predict=6,group=1' -> {"predict": 6, "group": 1}"""
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in DEFAULT_MIX:
+            raise ValueError(f"Unknown operation in mix: {name}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def build_workload(n: int, mix: dict, seed: int = 2026) -> list:
+    """n (op, args) requests drawn from the mix with a fixed seed."""
+    from content_automation import WC2026_GROUPS, resolve_team_name
+
+    rng = random.Random(seed)
+    teams = [resolve_team_name(t) for g in sorted(WC2026_GROUPS) for t in WC2026_GROUPS[g]]
+    pairs = list(combinations(teams, 2))
+    letters = sorted(WC2026_GROUPS)
+    ops = [op for op, w in mix.items() if w > 0]
+    weights = [mix[op] for op in ops]
+
+    workload = []
+    for op in rng.choices(ops, weights=weights, k=n):
+        if op == "group":
+            workload.append((op, (rng.choice(letters),)))
+        else:
+            workload.append((op, rng.choice(pairs)))
+    return workload
+
+
+def _engine_call(op, args):
+    if op == "predict":
+        from prediction_engine import predict
+        return predict(args[0], args[1])
+    if op == "whatif":
+        from prediction_engine import predict
+        return predict(args[0], args[1], home=args[0])
+    if op == "group":
+        from content_automation import predict_wc2026_group
+        return predict_wc2026_group(args[0], verbose=False)
+    if op == "h2h":
+        from prediction_engine import head_to_head
+        return head_to_head(args[0], args[1])
+    raise ValueError(op)
+
+
+def _http_call(base, op, args):
+    if op == "group":
+        url = f"{base}/group/{args[0]}"
+    else:
+        query = {"team_a": args[0], "team_b": args[1]}
+        if op == "whatif":
+            query["home"] = args[0]
+        url = f"{base}/predict?{urlencode(query)}"
+    with urlopen(url, timeout=120) as resp:
+        return resp.read()
+
+
+def run_requests(workload: list, target: str = "engine") -> list:
+    """Execute requests in order; [(op, seconds, ok)] for each."""
+    samples = []
+    for op, args in workload:
+        t0 = time.perf_counter()
+        try:
+            if target == "engine":
+                _engine_call(op, args)
+            else:
+                _http_call(target, op, args)
+            ok = True
+        except Exception:
+            ok = False
+        samples.append((op, time.perf_counter() - t0, ok))
+    return samples
+
+
+# ──────────────────────────────────────────────
+#  DRIVERS
+# ──────────────────────────────────────────────
+
+def _split(workload, n):
+    """Round-robin shards; never more shards than requests (no empty shard)."""
+    n = max(1, min(n, len(workload)))
+    return [workload[i::n] for i in range(n)]
+
+
+def run_threads(workload, concurrency, target, deadline=None):
+    shards = _split(workload, concurrency)
+    results = [None] * len(shards)
+
+    def worker(k):
+        if deadline is None:
+            results[k] = run_requests(shards[k], target)
+            return
+        out, i = [], 0
+        while time.perf_counter() < deadline:
+            out.extend(run_requests([shards[k][i % len(shards[k])]], target))
+            i += 1
+        results[k] = out
+
+    threads = [threading.Thread(target=worker, args=(k,)) for k in range(len(shards))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return [s for r in results for s in r]
+
+
+def _init_process(ready, target, warmup):
+    # Load the engine (and warm up) before the clock starts, as a long-lived
+    # server would; the parent starts timing once every worker is at the barrier
+    if target == "engine":
+        from prediction_engine import _data
+        _ = _data.results, _data.rankings, _data.h2h
+    if warmup:
+        run_requests(warmup, target)
+    ready.wait(READY_TIMEOUT)
+
+
+def _process_worker(shard, target, duration):
+    if duration is None:
+        return run_requests(shard, target)
+    out, i, deadline = [], 0, time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        out.extend(run_requests([shard[i % len(shard)]], target))
+        i += 1
+    return out
+
+
+def run_processes(workload, concurrency, target, duration=None, warmup=()):
+    """(samples, wall seconds), timed from the moment every worker has loaded."""
+    shards = _split(workload, concurrency)
+    ctx = multiprocessing.get_context("spawn")
+    ready = ctx.Barrier(len(shards) + 1)
+    with ProcessPoolExecutor(max_workers=len(shards), mp_context=ctx, initializer=_init_process,
+                             initargs=(ready, target, list(warmup))) as pool:
+        # One task per worker: each submit starts one more process
+        futures = [pool.submit(_process_worker, shard, target, duration) for shard in shards]
+        ready.wait(READY_TIMEOUT)
+        t0 = time.perf_counter()
+        samples = [s for f in futures for s in f.result()]
+        return samples, time.perf_counter() - t0
+
+
+# ──────────────────────────────────────────────
+#  REPORT
+# ──────────────────────────────────────────────
+
+def summarize(samples: list, wall: float) -> dict:
+    import numpy as np
+
+    def stats(lat):
+        if not lat:
+            return {"count": 0}
+        ms = np.asarray(lat) * 1000
+        p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+        return {
+            "count": len(lat),
+            "mean_ms": round(float(ms.mean()), 2),
+            "p50_ms": round(float(p50), 2),
+            "p95_ms": round(float(p95), 2),
+            "p99_ms": round(float(p99), 2),
+            "max_ms": round(float(ms.max()), 2),
+        }
+
+    ok = [s for s in samples if s[2]]
+    by_op = {}
+    for op in sorted({s[0] for s in samples}):
+        by_op[op] = stats([s[1] for s in ok if s[0] == op])
+        by_op[op]["errors"] = sum(1 for s in samples if s[0] == op and not s[2])
+    return {
+        "requests": len(samples),
+        "errors": len(samples) - len(ok),
+        "wall_s": round(wall, 3),
+        "throughput_rps": round(len(ok) / wall, 2) if wall > 0 else 0.0,
+        "latency": stats([s[1] for s in ok]),
+        "by_op": by_op,
+    }
+
+
+def print_report(report: dict):
+    s = report["summary"]
+    cfg = report["config"]
+    print(f"\n  Target: {cfg['target']}  |  {cfg['mode']} x {cfg['concurrency']}  |  seed {cfg['seed']}")
+    print(f"  {s['requests']} requests in {s['wall_s']:.2f}s  ->  {s['throughput_rps']:.1f} req/s"
+          f"  ({s['errors']} errors)\n")
+    print(f"  {'op':<10}{'count':>7}{'mean':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}")
+    rows = list(s["by_op"].items()) + [("ALL", s["latency"])]
+    for op, st in rows:
+        if not st.get("count"):
+            continue
+        print(f"  {op:<10}{st['count']:>7}{st['mean_ms']:>10.1f}{st['p50_ms']:>10.1f}"
+              f"{st['p95_ms']:>10.1f}{st['p99_ms']:>10.1f}{st['max_ms']:>10.1f}")
+    print("  (latencies in ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the prediction engine or service")
+    parser.add_argument("--target", default="engine", help="'engine' (in-process) or a service URL")
+    parser.add_argument("--mode", choices=("thread", "process"), default="thread")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=200, help="Requests to replay")
+    parser.add_argument("--duration", type=float, default=None, help="Seconds to run instead of a fixed count")
+    parser.add_argument("--mix", default=None, help="e.g. predict=6,whatif=2,group=1,h2h=3")
+    parser.add_argument("--seed", type=int, default=2026)
+    parser.add_argument("--warmup", type=int, default=5, help="Untimed requests before the run")
+    parser.add_argument("--json", dest="json_path", help="Save the report as JSON")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix) if args.mix else dict(DEFAULT_MIX)
+    target = args.target.rstrip("/")
+    if target != "engine":
+        dropped = [op for op in mix if op not in HTTP_OPS]
+        if dropped:
+            print(f"[WARN] Not served over HTTP, dropped from mix: {', '.join(dropped)}")
+        mix = {op: w for op, w in mix.items() if op in HTTP_OPS}
+
+    workload = build_workload(args.requests, mix, args.seed)
+    if args.warmup and args.mode == "thread":
+        run_requests(workload[:args.warmup], target)
+
+    if args.mode == "thread":
+        t0 = time.perf_counter()
+        deadline = t0 + args.duration if args.duration else None
+        samples = run_threads(workload, args.concurrency, target, deadline)
+        wall = time.perf_counter() - t0
+    else:
+        samples, wall = run_processes(workload, args.concurrency, target, args.duration,
+                                      workload[:args.warmup])
+
+    report = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "config": {
+            "target": target, "mode": args.mode, "concurrency": args.concurrency,
+            "requests": args.requests, "duration": args.duration, "mix": mix, "seed": args.seed,
+        },
+        "machine": {"python": platform.python_version(), "platform": platform.platform(),
+                    "cpus": os.cpu_count()},
+        "summary": summarize(samples, wall),
+    }
+    print_report(report)
+    if args.json_path:
+        os.makedirs(os.path.dirname(os.path.abspath(args.json_path)), exist_ok=True)
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n  Saved {args.json_path}")
+    sys.exit(1 if report["summary"]["errors"] else 0)
+
+
+if __name__ == "__main__":
+    main()
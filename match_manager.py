@@ -106,6 +106,9 @@ def add_result():
     df = pd.read_csv(RECENT_RESULTS)
     df = pd.concat([df, pd.DataFrame([row])], ignore_index=True)
     df.to_csv(RECENT_RESULTS, index=False)
+    # Incremental H2H update; a full reload only if the engine could not take the row
+    if not append_engine_results([row]):
+        clear_engine_cache()
     print()
     print("  Added: " + home + " " + str(score_h) + "-" + str(score_a) + " " + away)
     print()
@@ -114,8 +117,6 @@ def add_result():
     if add_goals != "n":
         add_match_goals(date, home, away)
 
-    clear_engine_cache()
-
 
 def add_match_goals(date, home, away):
     ensure_files()
@@ -276,8 +277,6 @@ def estimate_cards(team_a, team_b):
         red_factor *= 1.3
     total_reds = base_red * red_factor * 2
 
-    import random
-    random.seed(hash(team_a + team_b + str(rank_a)))
     red_prob = min(total_reds * 4, 0.35)
 
     print()
@@ -310,13 +309,30 @@ def card_predict_cli():
     estimate_cards(team_a, team_b)
 
 
+def append_engine_results(rows):
+    """Add rows to the loaded engine data; False if they could not be applied."""
+    try:
+        from prediction_engine import append_results
+    except ImportError:
+        return False
+    try:
+        append_results(rows)
+    except Exception as e:
+        print("[WARN] Could not append results to the engine: " + repr(e), file=sys.stderr)
+        return False
+    return True
+
+
 def clear_engine_cache():
     try:
         from prediction_engine import clear_cache
+    except ImportError:
+        return
+    try:
         clear_cache()
         print("  Engine cache cleared.")
-    except (ImportError, Exception):
-        pass
+    except Exception as e:
+        print("[WARN] Could not clear the engine cache: " + repr(e), file=sys.stderr)
 
 
 def main():
@@ -0,0 +1,306 @@
+"""
+Mundialista AI - Memory Report
+Per-structure byte sizes for what a process keeps resident, plus
+tracemalloc snapshots on demand.
+
+    datastore   results / rankings / shootouts frames, stars, global averages,
+                the H2H index (DataStore.memory_usage())
+    engine      sampler cache, built-in coach table
+    warmup      pre-computed group fixtures and coach lookups (when given)
+    streamlit   st.cache_data / st.cache_resource / session_state bytes, as
+                reported by the Streamlit runtime (app process only)
+    process     current resident set size
+
+Sizes are deep (strings, arrays and nested containers count) and shared
+objects are counted once per structure.
+
+tracemalloc is off unless asked for, since tracing slows every allocation:
+
+    MUNDIALISTA_TRACEMALLOC=1          start tracing at import (N > 1: frames kept)
+    start_tracing() / take_snapshot()  in-process, e.g. around a batch
+
+Usage:
+    python memory_report.py                       # load the engine, print the report
+    python memory_report.py --full --predict Argentina France
+    python memory_report.py --tracemalloc --top 20 --json mem.json
+
+    from memory_report import report, format_report
+    print(format_report(report()))
+"""
+
+import argparse
+import json
+import os
+import sys
+import tracemalloc
+from datetime import datetime
+
+# ──────────────────────────────────────────────
+#  CONFIGURATION
+# ──────────────────────────────────────────────
+
+MEMORY_CONFIG = {
+    "TOP_N": 25,                  # allocation sites listed from a snapshot
+    "TRACE_FRAMES": 1,            # frames kept per traced allocation
+}
+
+_TRACE_ENV = os.environ.get("MUNDIALISTA_TRACEMALLOC", "").strip().lower()
+
+
+# ──────────────────────────────────────────────
+#  SIZING
+# ──────────────────────────────────────────────
+
+def deep_size(obj, _seen: set = None) -> int:
+    """
+    Approximate bytes reachable from obj: pandas objects via
+    memory_usage(deep=True), numpy arrays via nbytes, containers and plain
+    objects recursively. Objects already seen are not counted again.
+    """
+    seen = set() if _seen is None else _seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    module = type(obj).__module__
+    if module.startswith("pandas"):
+        if hasattr(obj, "memory_usage"):
+            usage = obj.memory_usage(deep=True)
+            return int(usage.sum() if hasattr(usage, "sum") else usage)
+        return sys.getsizeof(obj)
+    if module == "numpy":
+        if getattr(obj, "dtype", None) is not None and obj.dtype == object and obj.ndim:
+            return obj.nbytes + sum(deep_size(x, seen) for x in obj.ravel())
+        return getattr(obj, "nbytes", sys.getsizeof(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, int, float, bool, type(None))):
+        return size
+    if isinstance(obj, dict):
+        return size + sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return size + sum(deep_size(x, seen) for x in obj)
+    if hasattr(obj, "__dict__"):
+        size += deep_size(vars(obj), seen)
+    for slot in getattr(type(obj), "__slots__", ()):
+        if hasattr(obj, slot):
+            size += deep_size(getattr(obj, slot), seen)
+    return size
+
+
+def datastore_usage(store=None) -> dict:
+    """{structure: bytes} for every structure the DataStore has loaded."""
+    if store is None:
+        from prediction_engine import _data as store
+    structures = {
+        "results": store._results,
+        "rankings": store._rankings,
+        "stars": store._stars,
+        "global_avg": store._global_avg,
+        "shootouts": store._shootouts,
+        "h2h": store._h2h,
+    }
+    return {name: deep_size(value) for name, value in structures.items() if value is not None}
+
+
+def engine_usage() -> dict:
+    """Engine-level caches outside the DataStore."""
+    import coaches
+    import prediction_engine
+
+    return {
+        "sampler_cache": deep_size(prediction_engine._SAMPLER_CACHE),
+        "sampler_cache_entries": len(prediction_engine._SAMPLER_CACHE),
+        "coaches_builtin": deep_size(coaches._BUILTIN_COACHES),
+    }
+
+
+def warmup_usage(warm) -> dict:
+    """Warm-up results held for the app (finished futures only)."""
+    def done(futures):
+        return [f.result() for f in futures if f.done() and not f.cancelled() and f.exception() is None]
+
+    out = {"group_fixtures": deep_size(done(warm.fixtures.values()))}
+    coaches = warm.futures.get("coaches")
+    if coaches is not None:
+        out["coaches"] = deep_size(done([coaches]))
+    return out
+
+
+def streamlit_usage() -> dict:
+    """
+    {"<category>:<cache>": bytes} from the Streamlit runtime's cache stats
+    (st.cache_data, st.cache_resource and session_state across sessions).
+    Empty outside a running Streamlit app.
+    """
+    if "streamlit" not in sys.modules:
+        return {}
+    try:
+        from streamlit.runtime import Runtime
+        if not Runtime.exists():
+            return {}
+        stats = Runtime.instance().stats_mgr.get_stats()
+    except Exception:
+        return {}
+    # Newer runtimes group stats by metric family; older ones return a flat list
+    if isinstance(stats, dict):
+        stats = [s for family in stats.values() for s in family]
+    out = {}
+    for stat in stats:
+        if not hasattr(stat, "byte_length"):
+            continue
+        key = f"{stat.category_name}:{stat.cache_name}" if stat.cache_name else stat.category_name
+        out[key] = out.get(key, 0) + int(stat.byte_length)
+    return out
+
+
+def process_rss() -> int:
+    """Current resident set size in bytes (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    except ImportError:
+        return None
+
+
+def report(store=None, warmup=None) -> dict:
+    """Memory report for this process: per-structure bytes grouped by owner."""
+    rep = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "pid": os.getpid(),
+        "datastore": datastore_usage(store),
+        "engine": engine_usage(),
+    }
+    if warmup is not None:
+        rep["warmup"] = warmup_usage(warmup)
+    streamlit = streamlit_usage()
+    if streamlit:
+        rep["streamlit"] = streamlit
+    rep["process"] = {"rss_bytes": process_rss()}
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        rep["process"].update(traced_bytes=current, traced_peak_bytes=peak)
+    return rep
+
+
+def _mb(n) -> str:
+    return "-" if n is None else f"{n / 1_048_576:9.2f} MB"
+
+
+def format_report(rep: dict) -> str:
+    lines = [f"  Memory report  (pid {rep['pid']}, {rep['timestamp']})"]
+    for section in ("datastore", "engine", "warmup", "streamlit", "process"):
+        values = rep.get(section)
+        if not values:
+            continue
+        lines.append(f"\n  {section}")
+        for name, n in values.items():
+            shown = f"{n:>12,}" if name.endswith("entries") else _mb(n)
+            lines.append(f"    {name:<40}{shown}")
+        if section == "datastore":
+            lines.append(f"    {'total':<40}{_mb(sum(values.values()))}")
+    return "\n".join(lines)
+
+
+# ──────────────────────────────────────────────
+#  TRACEMALLOC
+# ──────────────────────────────────────────────
+
+def start_tracing(frames: int = None):
+    """Start tracemalloc (no-op if already tracing)."""
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames or MEMORY_CONFIG["TRACE_FRAMES"])
+
+
+def stop_tracing():
+    tracemalloc.stop()
+
+
+def take_snapshot(path: str = None) -> tracemalloc.Snapshot:
+    """Snapshot of traced allocations (starts tracing first if needed); dumped to path if given."""
+    start_tracing()
+    snap = tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    ))
+    if path:
+        snap.dump(path)
+    return snap
+
+
+def top_allocations(snapshot: tracemalloc.Snapshot, baseline: tracemalloc.Snapshot = None,
+                    n: int = None, key_type: str = "lineno") -> list:
+    """Largest allocation sites, or the largest growth since baseline."""
+    n = n or MEMORY_CONFIG["TOP_N"]
+    if baseline is not None:
+        stats = snapshot.compare_to(baseline, key_type)
+        return [{"site": str(s.traceback[0]), "bytes": s.size, "diff_bytes": s.size_diff,
+                 "count": s.count} for s in stats[:n]]
+    return [{"site": str(s.traceback[0]), "bytes": s.size, "count": s.count}
+            for s in snapshot.statistics(key_type)[:n]]
+
+
+def format_allocations(rows: list) -> str:
+    lines = [f"  {'size':>12}{'change':>12}{'blocks':>9}  site"]
+    for r in rows:
+        diff = f"{r['diff_bytes']:+,}" if "diff_bytes" in r else ""
+        lines.append(f"  {r['bytes']:>12,}{diff:>12}{r['count']:>9,}  {r['site']}")
+    return "\n".join(lines)
+
+
+if _TRACE_ENV not in ("", "0", "false", "off", "no"):
+    start_tracing(int(_TRACE_ENV) if _TRACE_ENV.isdigit() else None)
+
+
+# ──────────────────────────────────────────────
+#  CLI
+# ──────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory held by the engine's data and caches")
+    parser.add_argument("--full", action="store_true", help="Keep the full results frame (no slim projection)")
+    parser.add_argument("--predict", nargs=2, action="append", metavar=("TEAM_A", "TEAM_B"),
+                        help="Run predictions first so the caches fill (repeatable)")
+    parser.add_argument("--tracemalloc", action="store_true", help="Trace allocations made while loading")
+    parser.add_argument("--top", type=int, default=MEMORY_CONFIG["TOP_N"], help="Allocation sites to list")
+    parser.add_argument("--snapshot", help="Dump the tracemalloc snapshot to this file")
+    parser.add_argument("--json", dest="json_path", help="Save the report as JSON")
+    args = parser.parse_args()
+
+    if args.tracemalloc or args.snapshot:
+        start_tracing()
+    # Also set when MUNDIALISTA_TRACEMALLOC started tracing at import
+    baseline = take_snapshot() if tracemalloc.is_tracing() else None
+
+    import prediction_engine
+    store = prediction_engine._data
+    store.slim = not args.full
+    _ = store.results, store.rankings, store.global_avg, store.stars, store.shootouts, store.h2h
+    for team_a, team_b in args.predict or ():
+        prediction_engine.predict(team_a, team_b)
+
+    rep = report(store)
+    print(format_report(rep))
+    if tracemalloc.is_tracing():
+        snap = take_snapshot(args.snapshot)
+        rows = top_allocations(snap, baseline, args.top)
+        rep["allocations"] = rows
+        print(f"\n  Top {len(rows)} allocation sites since start-up")
+        print(format_allocations(rows))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(rep, f, indent=2)
+        print(f"\n  Saved {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
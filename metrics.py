@@ -0,0 +1,323 @@
+"""
+Mundialista AI - Metrics
+In-process counters and gauges for long-running processes (the app, the
+prediction service, batch CLIs), exported as Prometheus text or JSON.
+
+    predictions served, simulations run, cache hits/misses, data loads and
+    their duration, queue depth, memory held by DataStore, plus every
+    stage_timer histogram (when stage timing is on)
+
+Export:
+    prometheus_text() / snapshot()         in-process
+    serve(port)                            GET /metrics (Prometheus), /metrics.json
+    start_snapshots(path, interval)        one JSON line appended every interval
+
+start_from_env() does whichever the environment asks for, once per process:
+
+    MUNDIALISTA_METRICS_PORT=9108          local /metrics endpoint (127.0.0.1)
+    MUNDIALISTA_METRICS_FILE=metrics.jsonl periodic JSON snapshots
+    MUNDIALISTA_METRICS_INTERVAL=60        seconds between snapshots
+
+Usage:
+    from metrics import counter, gauge
+    PREDICTIONS = counter("mundialista_predictions_total", "Predictions computed")
+    PREDICTIONS.inc()
+    CACHE = counter("mundialista_cache_requests_total", "Cache lookups", ("cache", "result"))
+    CACHE.inc(cache="sampler", result="hit")
+"""
+
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+import stage_timer
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_INTERVAL = 60.0
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+# ──────────────────────────────────────────────
+#  METRIC TYPES
+# ──────────────────────────────────────────────
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name: str, help_text: str, labels: tuple = ()):
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        if set(labels) != set(self.labels):
+            raise ValueError(f"{self.name} expects labels {self.labels}, got {tuple(labels)}")
+        return tuple(str(labels[k]) for k in self.labels)
+
+    def samples(self) -> list:
+        """[(label dict, value)] at this moment."""
+        with self._lock:
+            items = list(self._values.items())
+        return [(dict(zip(self.labels, key)), value) for key, value in items]
+
+
+class Counter(_Metric):
+    """Monotonic total."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self) -> list:
+        samples = super().samples()
+        if not samples and not self.labels:
+            return [({}, 0)]
+        return samples
+
+
+class Gauge(_Metric):
+    """
+    Value that goes up and down. With fn, the value is read at export time:
+    fn returns a number, or {label value: number} for a single-label gauge.
+    """
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, labels: tuple = (), fn=None):
+        super().__init__(name, help_text, labels)
+        self.fn = fn
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+    def samples(self) -> list:
+        if self.fn is None:
+            return super().samples()
+        try:
+            value = self.fn()
+        except Exception:
+            return []
+        if isinstance(value, dict):
+            return [({self.labels[0]: str(k)}, v) for k, v in value.items()]
+        return [({}, value)]
+
+
+# ──────────────────────────────────────────────
+#  REGISTRY
+# ──────────────────────────────────────────────
+
+_LOCK = threading.Lock()
+_METRICS = {}
+
+
+def _get_or_create(cls, name, help_text, labels, **kwargs):
+    with _LOCK:
+        metric = _METRICS.get(name)
+        if metric is None:
+            metric = _METRICS[name] = cls(name, help_text, labels, **kwargs)
+        elif not isinstance(metric, cls):
+            raise ValueError(f"{name} is already registered as a {metric.kind}")
+        return metric
+
+
+def counter(name: str, help_text: str, labels: tuple = ()) -> Counter:
+    """Counter registered under name (the existing one if already registered)."""
+    return _get_or_create(Counter, name, help_text, labels)
+
+
+def gauge(name: str, help_text: str, labels: tuple = (), fn=None) -> Gauge:
+    """Gauge registered under name; fn makes it a read-at-export gauge."""
+    g = _get_or_create(Gauge, name, help_text, labels)
+    if fn is not None:
+        g.fn = fn
+    return g
+
+
+# Shared by the engine, warm-up, charts and the service
+CACHE_REQUESTS = counter("mundialista_cache_requests_total", "Cache lookups by cache and result",
+                         ("cache", "result"))
+
+
+def cache_lookup(cache: str, hit: bool):
+    CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
+
+
+def clear():
+    """Zero every counter and set gauge (registrations are kept)."""
+    with _LOCK:
+        metrics = list(_METRICS.values())
+    for m in metrics:
+        with m._lock:
+            m._values.clear()
+
+
+# ──────────────────────────────────────────────
+#  EXPORT
+# ──────────────────────────────────────────────
+
+def _fmt(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    body = ",".join('{}="{}"'.format(k, str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+                    for k, v in labels.items())
+    return "{" + body + "}"
+
+
+def prometheus_text() -> str:
+    """Every metric plus the stage_timer histograms, in Prometheus text format 0.0.4."""
+    with _LOCK:
+        metrics = sorted(_METRICS.values(), key=lambda m: m.name)
+    lines = []
+    for m in metrics:
+        lines.append(f"# HELP {m.name} {m.help}")
+        lines.append(f"# TYPE {m.name} {m.kind}")
+        for labels, value in m.samples():
+            lines.append(f"{m.name}{_labels(labels)} {_fmt(value)}")
+
+    stages = stage_timer.snapshot()
+    if stages:
+        name = "mundialista_stage_duration_seconds"
+        lines.append(f"# HELP {name} Wall time per instrumented stage (stage_timer)")
+        lines.append(f"# TYPE {name} histogram")
+        for stage, s in stages.items():
+            if not s.get("count"):
+                continue
+            cumulative = 0
+            for bound, n in s["buckets"].items():
+                cumulative += n
+                le = "+Inf" if bound == "+Inf" else _fmt(float(bound) / 1000)
+                lines.append(f"{name}_bucket{_labels({'stage': stage, 'le': le})} {cumulative}")
+            lines.append(f"{name}_sum{_labels({'stage': stage})} {_fmt(s['total_ms'] / 1000)}")
+            lines.append(f"{name}_count{_labels({'stage': stage})} {s['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def snapshot() -> dict:
+    """JSON-ready view of every metric and stage histogram."""
+    with _LOCK:
+        metrics = sorted(_METRICS.values(), key=lambda m: m.name)
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "pid": os.getpid(),
+        "metrics": {
+            m.name: {
+                "type": m.kind,
+                "help": m.help,
+                "values": [{"labels": labels, "value": value} for labels, value in m.samples()],
+            }
+            for m in metrics
+        },
+        "stages": stage_timer.snapshot(),
+    }
+
+
+def write_snapshot(path) -> dict:
+    """Append one snapshot as a JSON line to path."""
+    snap = snapshot()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(snap, default=str) + "\n")
+    return snap
+
+
+def start_snapshots(path, interval: float = DEFAULT_INTERVAL) -> threading.Thread:
+    """Background thread appending a snapshot to path every interval seconds."""
+    def loop():
+        while True:
+            time.sleep(interval)
+            try:
+                write_snapshot(path)
+            except OSError as e:
+                print(f"[WARN] Metrics snapshot to {path} failed: {e}", file=sys.stderr)
+
+    thread = threading.Thread(target=loop, name="metrics-snapshots", daemon=True)
+    thread.start()
+    return thread
+
+
+def render(path: str):
+    """(body, content type) for /metrics or /metrics.json, else None."""
+    path = path.split("?", 1)[0].rstrip("/")
+    if path == "/metrics":
+        return prometheus_text().encode("utf-8"), PROMETHEUS_CONTENT_TYPE
+    if path == "/metrics.json":
+        return json.dumps(snapshot(), default=str).encode("utf-8"), "application/json"
+    return None
+
+
+def serve(port: int, host: str = DEFAULT_HOST):
+    """Serve /metrics and /metrics.json from a daemon thread; returns the server."""
+    # http.server only loads when an endpoint is actually requested
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            page = render(self.path)
+            if page is None:
+                self.send_error(404)
+                return
+            body, ctype = page
+            self.send_response(200)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, fmt, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
+
+
+_STARTED = False
+
+
+def start_from_env():
+    """Start the endpoint and/or snapshot writer configured in the environment (once)."""
+    global _STARTED
+    with _LOCK:
+        if _STARTED:
+            return
+        _STARTED = True
+    port = os.environ.get("MUNDIALISTA_METRICS_PORT")
+    if port:
+        try:
+            serve(int(port))
+            print(f"[INFO] Metrics on http://{DEFAULT_HOST}:{port}/metrics", file=sys.stderr)
+        except (OSError, ValueError) as e:
+            print(f"[WARN] Metrics endpoint not started: {e}", file=sys.stderr)
+    path = os.environ.get("MUNDIALISTA_METRICS_FILE")
+    if path:
+        interval = float(os.environ.get("MUNDIALISTA_METRICS_INTERVAL", DEFAULT_INTERVAL))
+        start_snapshots(path, interval)
+        # Short CLI runs still leave one snapshot behind
+        atexit.register(write_snapshot, path)
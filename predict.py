@@ -1,11 +1,48 @@
 
+"""
+Mundialista AI - Prediction CLI
+
+Single match (prints a summary and writes charts + HTML report):
+    python predict.py Argentina Brazil [--home Argentina] [--open]
+
+Batch (JSON lines out, engine loaded once, no charts unless --charts):
+    python predict.py --batch fixtures.csv -o predictions.jsonl
+    python predict.py --batch fixtures.csv --workers 4
+    cat fixtures.jsonl | python predict.py --batch -
+
+Batch input is read lazily, either CSV with a team_a,team_b[,home] header
+or JSON lines ({"team_a": ..., "team_b": ..., "home": ...}). Fixtures are
+priced in chunks with predict_many() (team inputs shared within a chunk);
+with --workers > 1 chunks run on a process pool and results are still
+written in input order.
+
+--timings (or MUNDIALISTA_TIMINGS=1) prints a per-stage timing table to
+stderr at the end (see stage_timer.py; worker processes keep their own).
+MUNDIALISTA_METRICS_PORT / MUNDIALISTA_METRICS_FILE expose counters while
+it runs (see metrics.py). --profile writes collapsed stacks and a top-N
+summary to profiles/ (see profiling.py).
+"""
+
 import argparse
+import csv
+import itertools
+import json
+import multiprocessing
 import os
 import sys
 import webbrowser
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import metrics
+import profiling
+import stage_timer
+from prediction_engine import predict, predict_many, prediction_record, clean_match_type
 
-from prediction_engine import predict, clean_match_type
-from chart_generator import generate_all_charts
+BATCH_CHUNK_SIZE = 32
+
+BATCH_WRITTEN = metrics.counter("mundialista_batch_fixtures_written_total", "Batch predictions written")
+BATCH_IN_FLIGHT = metrics.gauge("mundialista_batch_chunks_in_flight", "Batch chunks queued or running")
 
 
 def print_divider():
@@ -46,23 +83,189 @@ def print_result(team_a, team_b, result):
         print()
 
 
+class FixtureError(dict):
+    """Input row that could not be read; written to the output as an error record, in order."""
+
+
+def _json_rows(lines):
+    for n, line in enumerate(lines, 1):
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield FixtureError(line=n, error=f"Invalid JSON: {e}")
+            continue
+        yield row if isinstance(row, dict) else FixtureError(line=n, error="Expected a JSON object")
+
+
+def _field(row, name) -> str:
+    value = row.get(name)
+    return "" if value is None else str(value).strip()
+
+
+def iter_fixtures(stream):
+    """
+    Lazily yield (team_a, team_b, home) from CSV (with header) or JSON lines;
+    unreadable JSON lines come through as FixtureError records.
+    """
+    lines = (line for line in stream if line.strip())
+    first = next(lines, None)
+    if first is None:
+        return
+    lines = itertools.chain([first], lines)
+    if first.lstrip().startswith("{"):
+        rows = _json_rows(lines)
+    else:
+        rows = csv.DictReader(lines)
+    for row in rows:
+        if isinstance(row, FixtureError):
+            yield row
+            continue
+        team_a, team_b = _field(row, "team_a"), _field(row, "team_b")
+        if team_a and team_b:
+            yield team_a, team_b, _field(row, "home") or None
+
+
+def _price(fixtures, mc_tolerance=None) -> list:
+    if not fixtures:
+        return []
+    try:
+        results = predict_many(fixtures, mc_tolerance=mc_tolerance)
+    except Exception:
+        # One bad fixture should not sink the chunk: fall back to one at a time
+        results = []
+        for team_a, team_b, home in fixtures:
+            try:
+                results.append(predict(team_a, team_b, home=home, mc_tolerance=mc_tolerance))
+            except Exception as e:
+                results.append({"team_a": team_a, "team_b": team_b, "home": home, "error": str(e)})
+    return results
+
+
+def price_chunk(fixtures, mc_tolerance=None, charts=False):
+    """JSON lines for one chunk of fixtures (runs in a worker when --workers > 1)."""
+    valid = [fx for fx in fixtures if not isinstance(fx, FixtureError)]
+    priced = iter(_price(valid, mc_tolerance))
+    results = [fx if isinstance(fx, FixtureError) else next(priced) for fx in fixtures]
+
+    lines = []
+    for result in results:
+        if "error" in result:
+            lines.append(json.dumps(result))
+            continue
+        record = prediction_record(result)
+        if charts:
+            from chart_generator import generate_all_charts
+            record["charts"] = generate_all_charts(result, result["team_a"], result["team_b"], parallel=False)
+        lines.append(json.dumps(record, ensure_ascii=False))
+    return lines
+
+
+def _chunks(iterable, size):
+    it = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_batch(fixtures, out, workers=1, chunk_size=BATCH_CHUNK_SIZE, mc_tolerance=None, charts=False):
+    """Price fixtures chunk by chunk and write one JSON line per fixture to out."""
+    count = 0
+    chunks = _chunks(fixtures, chunk_size)
+    if workers <= 1:
+        for chunk in chunks:
+            for line in price_chunk(chunk, mc_tolerance, charts):
+                out.write(line + "\n")
+                count += 1
+                BATCH_WRITTEN.inc()
+            out.flush()
+        return count
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        pending = deque()
+        for chunk in itertools.chain(chunks, [None]):
+            if chunk is not None:
+                pending.append(pool.submit(price_chunk, chunk, mc_tolerance, charts))
+            # Keep at most 2 chunks per worker in flight; write in input order
+            while pending and (chunk is None or len(pending) >= 2 * workers or pending[0].done()):
+                for line in pending.popleft().result():
+                    out.write(line + "\n")
+                    count += 1
+                    BATCH_WRITTEN.inc()
+                out.flush()
+            BATCH_IN_FLIGHT.set(len(pending))
+    return count
+
+
+def print_timings():
+    if stage_timer.enabled():
+        print("\nStage timings:\n" + stage_timer.format_table(), file=sys.stderr)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Mundialista AI match prediction CLI")
-    parser.add_argument("team_a", help="Home / Team A")
-    parser.add_argument("team_b", help="Away / Team B")
+    parser.add_argument("team_a", nargs="?", help="Home / Team A")
+    parser.add_argument("team_b", nargs="?", help="Away / Team B")
     parser.add_argument("--home", help="Team with home advantage", default=None)
     parser.add_argument("--open", action="store_true", help="Open HTML report in browser")
+    parser.add_argument("--batch", metavar="FILE", help="Fixture CSV / JSON lines ('-' for stdin)")
+    parser.add_argument("-o", "--output", help="Batch output file (default: stdout)")
+    parser.add_argument("--workers", type=int, default=1, help="Batch worker processes")
+    parser.add_argument("--chunk-size", type=int, default=BATCH_CHUNK_SIZE, help="Fixtures per batch chunk")
+    parser.add_argument("--mc-tolerance", type=float, default=None, help="Monte Carlo CI half-width")
+    parser.add_argument("--charts", action=argparse.BooleanOptionalAction, default=None,
+                        help="Render charts (default: on for one match, off for --batch)")
+    parser.add_argument("--timings", action="store_true", help="Print per-stage timings to stderr")
+    parser.add_argument("--profile", action="store_true",
+                        help="Profile the run into profiles/ (MUNDIALISTA_PROFILE=cprofile for cProfile)")
     args = parser.parse_args()
+    if args.timings:
+        stage_timer.enable()
+    metrics.start_from_env()
+
+    mode = profiling.requested_mode(args.profile)
+    if mode and args.batch and args.workers > 1:
+        print("[WARN] Profiling covers this process only; use --workers 1 to profile pricing.",
+              file=sys.stderr)
+    with profiling.profiled("predict", mode):
+        run(args, parser)
 
-    result = predict(args.team_a, args.team_b, home=args.home)
+
+def run(args, parser):
+    if args.batch:
+        stream = sys.stdin if args.batch == "-" else open(args.batch, newline="", encoding="utf-8-sig")
+        out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+        try:
+            count = run_batch(iter_fixtures(stream), out, args.workers, args.chunk_size,
+                              args.mc_tolerance, bool(args.charts))
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+            if out is not sys.stdout:
+                out.close()
+        print(f"[INFO] {count} predictions written", file=sys.stderr)
+        print_timings()
+        return
+
+    if not (args.team_a and args.team_b):
+        parser.error("team_a and team_b are required unless --batch is given")
+
+    result = predict(args.team_a, args.team_b, home=args.home, mc_tolerance=args.mc_tolerance)
     print_result(args.team_a, args.team_b, result)
+    if args.charts is False:
+        print_timings()
+        return
 
     print("Generating charts...")
+    from chart_generator import generate_all_charts  # matplotlib only loads when charts are drawn
+
     charts = generate_all_charts(result, args.team_a, args.team_b)
     print()
     print("Generated Files:")
     for k, v in charts.items():
         print(f"  {k:<12} {v}")
+    print_timings()
 
     if args.open and "html" in charts and os.path.exists(charts["html"]):
         webbrowser.open("file://" + os.path.abspath(charts["html"]))
@@ -0,0 +1,267 @@
+"""
+Mundialista AI - Prediction Cube
+Precomputed pairwise predictions for the 48 World Cup 2026 teams.
+
+For every ordered pair and venue mode (neutral / home A / home B) the cube
+stores the lambdas, W/D/L and the full DC score matrix as memory-mapped
+.npy files. Any process can open it zero-copy and answer pairwise queries
+without running the model. The bundle carries a fingerprint of the data
+files and model config and is rebuilt automatically when either changes.
+
+Usage:
+    python prediction_cube.py            # build if stale
+    python prediction_cube.py --force    # always rebuild
+
+    from prediction_cube import load_cube
+    cube = load_cube()
+    cube.query("Brazil", "Morocco")
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from coaches import COACH_CONFIG, get_coach_data
+from prediction_engine import (
+    CONFIG,
+    DATA_DIR,
+    build_score_matrix,
+    choose_grid_size,
+    compute_lambdas,
+    data_fingerprint,
+    get_team_ranking,
+    get_team_star_impact,
+    get_team_stats,
+)
+
+CUBE_DIR = Path(__file__).parent / "cache" / "prediction_cube"
+
+VENUES = ("neutral", "home_a", "home_b")
+
+_ARRAYS = ("lambdas", "wdl", "matrices", "grid", "truncated")
+
+
+# ──────────────────────────────────────────────
+#  FINGERPRINT / TEAMS
+# ──────────────────────────────────────────────
+
+def wc2026_teams() -> list:
+    """Dataset names of the 48 group-stage teams, in group order."""
+    from content_automation import WC2026_GROUPS, resolve_team_name
+
+    teams = []
+    for group in sorted(WC2026_GROUPS):
+        teams.extend(resolve_team_name(t) for t in WC2026_GROUPS[group])
+    return teams
+
+
+def cube_fingerprint(teams: list) -> str:
+    """Data version + coach config + team list; any change forces a rebuild."""
+    h = hashlib.sha1()
+    h.update(data_fingerprint().encode())
+    h.update(json.dumps(COACH_CONFIG, sort_keys=True, default=str).encode())
+    h.update("\x1f".join(teams).encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def grid_width() -> int:
+    """Fixed matrix width used to pad every fixture's adaptive grid."""
+    max_g = CONFIG["MAX_GRID_GOALS"] if CONFIG["ADAPTIVE_GRID"] else CONFIG["MAX_GOALS"]
+    return max_g + 1
+
+
+# ──────────────────────────────────────────────
+#  BUILD
+# ──────────────────────────────────────────────
+
+def build_cube(teams: list = None, out_dir: Path = CUBE_DIR, verbose: bool = True) -> Path:
+    """Compute every ordered pair x venue and write the .npy bundle."""
+    if teams is None:
+        teams = wc2026_teams()
+    n = len(teams)
+    width = grid_width()
+    t0 = time.perf_counter()
+
+    # Team-level inputs are computed once, not once per fixture
+    inputs = [
+        {
+            "stats": get_team_stats(t),
+            "rank": get_team_ranking(t),
+            "star": get_team_star_impact(t),
+            "coach": get_coach_data(t, DATA_DIR),
+        }
+        for t in teams
+    ]
+
+    lambdas = np.zeros((n, n, len(VENUES), 2), dtype=np.float64)
+    wdl = np.zeros((n, n, len(VENUES), 3), dtype=np.float64)
+    matrices = np.zeros((n, n, len(VENUES), width, width), dtype=np.float32)
+    grid = np.zeros((n, n, len(VENUES)), dtype=np.int8)
+    truncated = np.zeros((n, n, len(VENUES)), dtype=np.float64)
+
+    for i, team_a in enumerate(teams):
+        ia = inputs[i]
+        for j, team_b in enumerate(teams):
+            if i == j:
+                continue
+            ib = inputs[j]
+            for v, home in enumerate((None, team_a, team_b)):
+                lam_a, lam_b = compute_lambdas(
+                    team_a, team_b, ia["stats"], ib["stats"],
+                    ia["rank"], ib["rank"], ia["star"], ib["star"],
+                    ia["coach"], ib["coach"], home,
+                )
+                max_g, trunc = choose_grid_size(lam_a, lam_b)
+                matrix = build_score_matrix(lam_a, lam_b, max_g)
+
+                lambdas[i, j, v] = (lam_a, lam_b)
+                wdl[i, j, v] = (np.tril(matrix, -1).sum(), np.trace(matrix), np.triu(matrix, 1).sum())
+                matrices[i, j, v, :max_g + 1, :max_g + 1] = matrix
+                grid[i, j, v] = max_g
+                truncated[i, j, v] = trunc
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    arrays = {"lambdas": lambdas, "wdl": wdl, "matrices": matrices,
+              "grid": grid, "truncated": truncated}
+    for name, arr in arrays.items():
+        tmp = out_dir / f"{name}.tmp.npy"
+        np.save(tmp, arr)
+        os.replace(tmp, out_dir / f"{name}.npy")
+
+    # Metadata goes last: a bundle without a matching meta.json is stale
+    meta = {
+        "teams": teams,
+        "venues": list(VENUES),
+        "fingerprint": cube_fingerprint(teams),
+        "grid_width": width,
+        "created": datetime.now().isoformat(timespec="seconds"),
+    }
+    tmp = out_dir / "meta.tmp.json"
+    tmp.write_text(json.dumps(meta, indent=2, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, out_dir / "meta.json")
+
+    if verbose:
+        print(f"[INFO] Prediction cube: {n} teams x {n - 1} opponents x {len(VENUES)} venues"
+              f" in {time.perf_counter() - t0:.1f}s -> {out_dir}")
+    return out_dir
+
+
+# ──────────────────────────────────────────────
+#  ZERO-COPY ACCESS
+# ──────────────────────────────────────────────
+
+class PredictionCube:
+    """Read-only, memory-mapped view of a built cube."""
+
+    def __init__(self, path: Path = CUBE_DIR):
+        self.path = Path(path)
+        self.meta = json.loads((self.path / "meta.json").read_text(encoding="utf-8"))
+        self.teams = self.meta["teams"]
+        self.index = {t: i for i, t in enumerate(self.teams)}
+        for name in _ARRAYS:
+            setattr(self, name, np.load(self.path / f"{name}.npy", mmap_mode="r"))
+
+    @property
+    def fingerprint(self) -> str:
+        return self.meta["fingerprint"]
+
+    def __contains__(self, team: str) -> bool:
+        return team in self.index
+
+    def venue_index(self, team_a: str, team_b: str, home: str = None) -> int:
+        if home == team_a:
+            return 1
+        if home == team_b:
+            return 2
+        return 0
+
+    def query(self, team_a: str, team_b: str, home: str = None) -> dict:
+        """Pairwise prediction in predict()'s key/units convention."""
+        i, j = self.index[team_a], self.index[team_b]
+        v = self.venue_index(team_a, team_b, home)
+        max_g = int(self.grid[i, j, v])
+        win_a, draw, win_b = self.wdl[i, j, v]
+        lam_a, lam_b = self.lambdas[i, j, v]
+        matrix = self.matrices[i, j, v, :max_g + 1, :max_g + 1]
+        order = np.argsort(matrix, axis=None)[::-1][:10]
+        top_scores = [
+            (f"{k // (max_g + 1)}-{k % (max_g + 1)}", round(100 * float(matrix.flat[k]), 2))
+            for k in order
+        ]
+        return {
+            "team_a": team_a,
+            "team_b": team_b,
+            "home": home,
+            "team_a_win": round(100 * float(win_a), 1),
+            "draw": round(100 * float(draw), 1),
+            "team_b_win": round(100 * float(win_b), 1),
+            "team_a_lambda": float(lam_a),
+            "team_b_lambda": float(lam_b),
+            "top_scores": top_scores,
+            "score_matrix": matrix,
+            "grid_max_goals": max_g,
+            "truncated_mass": float(self.truncated[i, j, v]),
+        }
+
+    def batch(self, idx_a, idx_b, venue: int = 0) -> dict:
+        """
+        Vectorized lookup for many fixtures at once (fractions, not %).
+
+        idx_a/idx_b are arrays of team indices; the most likely scoreline
+        of every fixture comes from one argmax over the stacked matrices.
+        """
+        idx_a = np.asarray(idx_a, dtype=np.intp)
+        idx_b = np.asarray(idx_b, dtype=np.intp)
+        width = self.matrices.shape[-1]
+        flat = np.asarray(self.matrices[idx_a, idx_b, venue]).reshape(len(idx_a), -1)
+        best = flat.argmax(axis=1)
+        return {
+            "wdl": np.asarray(self.wdl[idx_a, idx_b, venue]),
+            "lambdas": np.asarray(self.lambdas[idx_a, idx_b, venue]),
+            "top_score": [f"{k // width}-{k % width}" for k in best],
+            "top_score_prob": flat[np.arange(len(best)), best].astype(np.float64),
+        }
+
+
+def cube_is_fresh(path: Path = CUBE_DIR, teams: list = None) -> bool:
+    meta_path = Path(path) / "meta.json"
+    if not meta_path.exists():
+        return False
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        return False
+    if teams is None:
+        teams = meta.get("teams", [])
+    return meta.get("fingerprint") == cube_fingerprint(teams)
+
+
+def load_cube(path: Path = CUBE_DIR, teams: list = None, rebuild: bool = True) -> PredictionCube:
+    """Open the cube, rebuilding it first if the data or config changed."""
+    if teams is None:
+        teams = wc2026_teams()
+    if not cube_is_fresh(path, teams):
+        if not rebuild:
+            raise FileNotFoundError(f"Prediction cube at {path} is missing or stale")
+        build_cube(teams, path)
+    return PredictionCube(path)
+
+
+if __name__ == "__main__":
+    force = "--force" in sys.argv
+    all_teams = wc2026_teams()
+    if force or not cube_is_fresh(CUBE_DIR, all_teams):
+        build_cube(all_teams)
+    else:
+        print(f"[INFO] Prediction cube is up to date ({CUBE_DIR})")
+    cube = PredictionCube(CUBE_DIR)
+    sample = cube.query(all_teams[0], all_teams[1])
+    print(f"  {sample['team_a']} vs {sample['team_b']}: "
+          f"{sample['team_a_win']}% / {sample['draw']}% / {sample['team_b_win']}%")
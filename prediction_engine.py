@@ -3,14 +3,17 @@ Mundialista AI - Prediction Engine v7
 Dixon-Coles Poisson model with ELO blending, star impacts, and Monte Carlo simulation.
 """
 
+import hashlib
 import json
 import math
+import os
+import sys
+import time
 from datetime import datetime
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
-from scipy.stats import poisson
 
 # -- NEW: Coaches module --
 from coaches import (
@@ -18,6 +21,9 @@ from coaches import (
     compute_coach_matchup_edge,
     COACH_CONFIG,
 )
+from metrics import cache_lookup, counter, gauge
+from rng_streams import get_generator
+from stage_timer import stage, timed_call
 # â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
 #  CONFIGURATION
 # â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
@@ -27,10 +33,32 @@ CONFIG = {
     "LAST_N_MATCHES": 12,
     "DECAY_RATE": 0.003,
     "SHRINK_K": 9.4,
-    "MAX_GOALS": 8,
+    "MAX_GOALS": 8,               # fixed grid size when ADAPTIVE_GRID is off
     "N_SIMULATIONS": 10_200,
+    "SIM_CHUNK": 65_536,          # draws per vectorized sampling batch
+    "SAMPLER_CACHE_SIZE": 4_096,  # cached CDF tables (one per fixture)
     "DIXON_COLES_RHO": -0.04,
 
+    # Monte Carlo precision (MC_TOLERANCE=None keeps the fixed N_SIMULATIONS run)
+    "MC_TOLERANCE": None,         # target CI half-width per probability, e.g. 0.005
+    "MC_Z": 1.96,                 # CI multiplier for the half-width
+    "MC_BATCH": 2_000,            # draws between stopping checks
+    "MC_MIN_SIMULATIONS": 2_000,
+    "MC_MAX_SIMULATIONS": 500_000,
+    "MC_VARIANCE_REDUCTION": "none",  # "none" | "antithetic" | "stratified"
+
+    # Adaptive score grid (sized per match from the Poisson tail mass)
+    "ADAPTIVE_GRID": True,
+    "GRID_TAIL_TOL": 1e-4,        # max probability mass allowed outside the grid
+    "MIN_GRID_GOALS": 5,
+    "MAX_GRID_GOALS": 15,
+
+    # Knockout ties
+    "ET_SCALE": 0.28,             # extra-time lambda as a share of 90'
+    "ET_MAX_GOALS": 10,
+    "SHOOTOUT_PRIOR_K": 8.0,      # pseudo-shootouts shrinking each team to 50%
+    "SHOOTOUT_HALF_LIFE_YEARS": 16.0,
+    "SHOOTOUT_MIN_PROB": 0.25,    # safety clamp on P(team A wins shootout)
 
     # Home advantage
     "HOME_ATTACK_BOOST": 1.06,
@@ -89,54 +117,251 @@ def clean_match_type(match_type):
 
 DATA_DIR = Path(__file__).parent / "data"
 
+# Results columns the engine reads; the rest (city, country) stay on disk.
+# MUNDIALISTA_SLIM_RESULTS=0 keeps the full frame as read from the CSVs.
+ENGINE_RESULT_COLUMNS = ("date", "home_team", "away_team", "home_score", "away_score",
+                         "tournament", "neutral")
+SLIM_RESULTS = os.environ.get("MUNDIALISTA_SLIM_RESULTS", "1").strip().lower() not in ("0", "false", "off", "no")
+
+
+def slim_results(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Engine-only projection of the results frame: unused columns dropped,
+    team names as one shared categorical, tournament as a categorical.
+    Scores stay float64 so every computed rating is unchanged.
+    """
+    df = df[[c for c in ENGINE_RESULT_COLUMNS if c in df.columns]].copy()
+    if "home_team" in df.columns and "away_team" in df.columns:
+        teams = pd.Index(pd.concat([df["home_team"], df["away_team"]]).dropna().unique())
+        df["home_team"] = pd.Categorical(df["home_team"], categories=teams)
+        df["away_team"] = pd.Categorical(df["away_team"], categories=teams)
+    if "tournament" in df.columns:
+        df["tournament"] = df["tournament"].astype("category")
+    return df
+
 # â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
 #  CACHED DATA LOADING
 # â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
 
+class H2HIndex:
+    """
+    Head-to-head index over the results frame.
+
+    Unordered team pair -> row positions (date order) plus cumulative
+    [wins_lo, draws, wins_hi, goals_lo, goals_hi] counts, where "lo" is the
+    alphabetically first team. Totals over the last n meetings are a single
+    subtraction of two cumulative rows.
+    """
+
+    _EMPTY_ROWS = np.zeros(0, dtype=np.intp)
+
+    def __init__(self):
+        self._pairs = {}
+
+    @staticmethod
+    def _outcomes(df: pd.DataFrame) -> tuple:
+        """Pair keys and per-row counts for a block of results."""
+        home = df["home_team"].to_numpy(dtype=object)
+        away = df["away_team"].to_numpy(dtype=object)
+        hs = pd.to_numeric(df["home_score"], errors="coerce").to_numpy(dtype=np.float64)
+        aws = pd.to_numeric(df["away_score"], errors="coerce").to_numpy(dtype=np.float64)
+        valid = ~(np.isnan(hs) | np.isnan(aws))
+
+        swap = (home > away).astype(bool)
+        lo = np.where(swap, away, home)
+        hi = np.where(swap, home, away)
+        g_lo = np.where(swap, aws, hs)
+        g_hi = np.where(swap, hs, aws)
+        counts = np.column_stack([g_lo > g_hi, g_lo == g_hi, g_lo < g_hi, g_lo, g_hi])
+        return lo, hi, np.nan_to_num(counts).astype(np.int32), valid
+
+    @classmethod
+    def build(cls, df: pd.DataFrame) -> "H2HIndex":
+        index = cls()
+        if not df.empty:
+            index.append(df, offset=0)
+        return index
+
+    def append(self, df: pd.DataFrame, offset: int):
+        """Add rows that sit at positions offset.. of the results frame."""
+        lo, hi, counts, valid = self._outcomes(df)
+        positions = np.flatnonzero(valid)
+        if len(positions) == 0:
+            return
+        codes, uniques = pd.MultiIndex.from_arrays([lo[positions], hi[positions]]).factorize()
+        order = np.argsort(codes, kind="stable")       # group by pair, keep date order
+        positions = positions[order]
+        starts = np.flatnonzero(np.r_[True, np.diff(codes[order]) != 0])
+        bounds = np.r_[starts, len(positions)]
+
+        # One running sum over all pairs; each pair subtracts its own start
+        running = np.cumsum(counts[positions], axis=0, dtype=np.int32)
+        base = np.vstack([np.zeros((1, counts.shape[1]), dtype=np.int32), running])[starts]
+
+        for g, start in enumerate(starts):
+            stop = bounds[g + 1]
+            key = uniques[codes[order[start]]]
+            rows = positions[start:stop]
+            cum = running[start:stop] - base[g]
+            entry = self._pairs.get(key)
+            if entry is not None:
+                cum += entry[1][-1]
+                rows = np.concatenate([entry[0], rows + offset])
+                cum = np.concatenate([entry[1], cum])
+            else:
+                rows = rows + offset
+            self._pairs[key] = (rows, cum)
+
+    def __len__(self) -> int:
+        return len(self._pairs)
+
+    def lookup(self, team_a: str, team_b: str, last_n: int = None) -> dict:
+        """W/D/L and goals from team_a's side, plus row positions (oldest first)."""
+        flipped = team_a > team_b
+        key = (team_b, team_a) if flipped else (team_a, team_b)
+        rows, cum = self._pairs.get(key, (self._EMPTY_ROWS, None))
+        n = len(rows)
+        k = n if last_n is None else min(int(last_n), n)
+        if k == 0:
+            return {"matches": 0, "wins_a": 0, "draws": 0, "wins_b": 0,
+                    "goals_a": 0, "goals_b": 0, "rows": self._EMPTY_ROWS}
+
+        tot = cum[-1] - cum[n - k - 1] if k < n else cum[-1]
+        wins_lo, draws, wins_hi, g_lo, g_hi = (int(x) for x in tot)
+        if flipped:
+            wins_lo, wins_hi, g_lo, g_hi = wins_hi, wins_lo, g_hi, g_lo
+        return {
+            "matches": k,
+            "wins_a": wins_lo,
+            "draws": draws,
+            "wins_b": wins_hi,
+            "goals_a": g_lo,
+            "goals_b": g_hi,
+            "rows": rows[n - k:],
+        }
+
+
 class DataStore:
     """Lazy-loading cache for all data files."""
 
-    def __init__(self):
+    def __init__(self, slim: bool = None):
+        self.slim = SLIM_RESULTS if slim is None else slim
+        self._version = None
+        self._appends = 0
         self._results = None
         self._rankings = None
         self._stars = None
         self._global_avg = None
+        self._shootouts = None
+        self._h2h = None
 
     def clear_cache(self):
         """Force reload on next access."""
+        DATA_RELOADS.inc()
+        self._version = None
+        self._appends = 0
         self._results = None
         self._rankings = None
         self._stars = None
         self._global_avg = None
+        self._shootouts = None
+        self._h2h = None
 
     @property
     def results(self) -> pd.DataFrame:
         if self._results is None:
-            self._results = self._load_results()
+            self._version = data_fingerprint()
+            self._results = self._timed_load("results", self._load_results)
         return self._results
 
+    @property
+    def version(self) -> str:
+        """
+        Data version of what is loaded: data_fingerprint() taken when the
+        results were read, plus a suffix per append_results() call. Stored,
+        so hot paths never re-stat the data files; CONFIG edits made at run
+        time need a clear_cache() to show up here.
+        """
+        if self._version is None:
+            self._version = data_fingerprint()
+        return f"{self._version}+{self._appends}" if self._appends else self._version
+
     @property
     def rankings(self) -> pd.DataFrame:
         if self._rankings is None:
-            self._rankings = self._load_rankings()
+            self._rankings = self._timed_load("rankings", self._load_rankings)
         return self._rankings
 
     @property
     def stars(self) -> dict:
         if self._stars is None:
-            self._stars = self._load_stars()
+            self._stars = self._timed_load("stars", self._load_stars)
         return self._stars
 
+    @property
+    def h2h(self) -> H2HIndex:
+        if self._h2h is None:
+            results = self.results
+            self._h2h = self._timed_load("h2h", H2HIndex.build, results)
+        return self._h2h
+
+    def append_results(self, rows: pd.DataFrame):
+        """
+        Add newly recorded results without reloading the CSVs.
+
+        The H2H index is extended in place; if the new rows are older than
+        the latest loaded match, the frame is re-sorted and the index rebuilt.
+        """
+        if self._results is None or rows.empty:
+            return
+        rows = rows.copy()
+        rows["date"] = pd.to_datetime(rows["date"], errors="coerce")
+        rows = rows.sort_values("date").reset_index(drop=True)
+        offset = len(self._results)
+        in_order = self._results.empty or rows["date"].min() >= self._results["date"].max()
+        self._appends += 1
+        df = pd.concat([self._results, rows], ignore_index=True)
+        if self.slim:
+            df = slim_results(df)
+        if in_order:
+            self._results = df
+            if self._h2h is not None:
+                self._h2h.append(rows, offset)
+        else:
+            self._results = df.sort_values("date").reset_index(drop=True)
+            self._h2h = None
+        self._global_avg = None
+
+    @property
+    def shootouts(self) -> dict:
+        if self._shootouts is None:
+            self._shootouts = self._timed_load(
+                "shootouts", lambda: build_shootout_table(self._load_shootouts()))
+        return self._shootouts
+
     @property
     def global_avg(self) -> dict:
         if self._global_avg is None:
             self._global_avg = self._calculate_global_average()
         return self._global_avg
 
+    @staticmethod
+    def _timed_load(source: str, loader, *args):
+        t0 = time.perf_counter()
+        value = loader(*args)
+        DATA_LOADS.inc(source=source)
+        DATA_LOAD_SECONDS.inc(time.perf_counter() - t0, source=source)
+        return value
+
+    def memory_usage(self) -> dict:
+        """Bytes held by each loaded structure (memory_report.datastore_usage)."""
+        from memory_report import datastore_usage
+        return datastore_usage(self)
+
     def _load_results(self) -> pd.DataFrame:
         path = DATA_DIR / "results.csv"
         if not path.exists():
-            print(f"[WARN] {path} not found. Using empty DataFrame.")
+            print(f"[WARN] {path} not found. Using empty DataFrame.", file=sys.stderr)
             return pd.DataFrame()
         df = pd.read_csv(path)
         # Merge recent manually-added results from match_manager
@@ -145,27 +370,36 @@ class DataStore:
             recent = pd.read_csv(recent_path)
             if not recent.empty:
                 df = pd.concat([df, recent], ignore_index=True)
-                print(f"[INFO] Merged {len(recent)} recent results")
+                print(f"[INFO] Merged {len(recent)} recent results", file=sys.stderr)
         if "date" in df.columns:
             df["date"] = pd.to_datetime(df["date"], errors="coerce")
             df = df.sort_values("date").reset_index(drop=True)
-        return df
+        return slim_results(df) if self.slim else df
 
     def _load_rankings(self) -> pd.DataFrame:
         path = DATA_DIR / "rankings.csv"
         if not path.exists():
-            print(f"[WARN] {path} not found.")
+            print(f"[WARN] {path} not found.", file=sys.stderr)
             return pd.DataFrame()
         return pd.read_csv(path)
 
     def _load_stars(self) -> dict:
         path = DATA_DIR / "star_players.json"
         if not path.exists():
-            print(f"[INFO] {path} not found. Using built-in star data.")
+            print(f"[INFO] {path} not found. Using built-in star data.", file=sys.stderr)
             return _BUILTIN_STARS
         with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
 
+    def _load_shootouts(self) -> pd.DataFrame:
+        path = DATA_DIR / "shootouts.csv"
+        if not path.exists():
+            print(f"[INFO] {path} not found. Shootouts default to 50/50.", file=sys.stderr)
+            return pd.DataFrame(columns=["date", "home_team", "away_team", "winner", "first_shooter"])
+        df = pd.read_csv(path)
+        df["date"] = pd.to_datetime(df["date"], errors="coerce")
+        return df
+
     def _calculate_global_average(self) -> dict:
         """Calculate actual global goals-per-game from the dataset."""
         df = self.results
@@ -191,6 +425,70 @@ class DataStore:
 # Singleton
 _data = DataStore()
 
+# â”€â”€ Metrics (metrics.py; exported by the app, service and CLIs) â”€â”€
+PREDICTIONS = counter("mundialista_predictions_total", "Predictions computed by the engine")
+SIMULATIONS = counter("mundialista_simulations_total", "Monte Carlo match draws")
+DATA_LOADS = counter("mundialista_data_loads_total", "Data structures loaded from disk", ("source",))
+DATA_LOAD_SECONDS = counter("mundialista_data_load_seconds_total", "Time spent loading data",
+                            ("source",))
+DATA_RELOADS = counter("mundialista_data_reloads_total", "DataStore cache clears")
+gauge("mundialista_datastore_bytes", "Memory held by loaded DataStore structures", ("structure",),
+      fn=lambda: _data.memory_usage())
+
+# Files whose contents feed predictions (data version for caches)
+_FINGERPRINT_FILES = (
+    "results.csv", "recent_results.csv", "rankings.csv",
+    "star_players.json", "coaches.json", "shootouts.csv",
+)
+
+
+def data_fingerprint() -> str:
+    """
+    Short hash of the data files (mtime + size) and CONFIG.
+    Changes whenever anything that can move a prediction changes.
+    """
+    h = hashlib.sha1()
+    for name in _FINGERPRINT_FILES:
+        path = DATA_DIR / name
+        if path.exists():
+            st = path.stat()
+            h.update(f"{name}:{st.st_mtime_ns}:{st.st_size};".encode())
+    h.update(json.dumps(CONFIG, sort_keys=True, default=str).encode())
+    return h.hexdigest()[:16]
+
+
+def clear_cache():
+    """Drop all loaded data; the next access re-reads the files."""
+    _data.clear_cache()
+
+
+def reload_data() -> DataStore:
+    """
+    Load a fresh DataStore from the files and swap it in with one assignment.
+    Unlike clear_cache(), a predict() running on another thread never sees a
+    half-cleared store; callers must read prediction_engine._data, not a copy
+    bound at import.
+    """
+    global _data
+    store = DataStore(slim=_data.slim)
+    _ = store.results, store.rankings, store.global_avg
+    _ = store.stars, store.shootouts, store.h2h
+    DATA_RELOADS.inc()
+    _data = store
+    return store
+
+
+def append_results(rows) -> None:
+    """Feed newly recorded results (list of dicts or DataFrame) to the loaded data."""
+    if not isinstance(rows, pd.DataFrame):
+        rows = pd.DataFrame(list(rows))
+    _data.append_results(rows)
+
+
+def head_to_head(team_a: str, team_b: str, last_n: int = None) -> dict:
+    """H2H record from team_a's side, over all meetings or the last n."""
+    return _data.h2h.lookup(team_a, team_b, last_n)
+
 
 # â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
 #  BUILT-IN STAR PLAYERS (fallback)
@@ -524,6 +822,14 @@ def get_team_stats(team: str) -> dict:
 #  DIXON-COLES SCORE MATRIX
 # â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
 
+def _poisson_pmf_table(lam: np.ndarray, max_goals: int) -> np.ndarray:
+    """P(k) for k = 0..max_goals, one row per lambda (numpy-only, no scipy)."""
+    lam = np.maximum(np.asarray(lam, dtype=np.float64), 0.0)
+    k = np.arange(max_goals + 1)
+    factorials = np.cumprod(np.concatenate(([1.0], np.arange(1, max_goals + 1, dtype=np.float64))))
+    return np.exp(-lam)[..., None] * np.power(lam[..., None], k) / factorials
+
+
 def dixon_coles_adjust(prob: float, i: int, j: int,
                        lam_a: float, lam_b: float, rho: float) -> float:
     """Low-score correlation adjustment (Dixon & Coles, 1997)."""
@@ -538,16 +844,48 @@ def dixon_coles_adjust(prob: float, i: int, j: int,
     return prob
 
 
-def build_score_matrix(lam_a: float, lam_b: float) -> np.ndarray:
-    """Build normalized score probability matrix with DC correction."""
-    max_g = CONFIG["MAX_GOALS"]
+def choose_grid_size(lam_a: float, lam_b: float, tol: float = None) -> tuple:
+    """
+    Pick the smallest max-goals value whose Poisson tail mass fits the tolerance.
+
+    The DC correction only redistributes mass between the 0/1 cells, so the
+    mass lost by truncating at n goals is exactly 1 - F_a(n) * F_b(n).
+
+    Returns:
+        (max_goals, truncated_mass)
+    """
+    if not CONFIG["ADAPTIVE_GRID"]:
+        max_g = CONFIG["MAX_GOALS"]
+        inside = _poisson_pmf_table(lam_a, max_g).sum() * _poisson_pmf_table(lam_b, max_g).sum()
+        return max_g, float(max(0.0, 1.0 - inside))
+
+    if tol is None:
+        tol = CONFIG["GRID_TAIL_TOL"]
+    lo = CONFIG["MIN_GRID_GOALS"]
+    hi = CONFIG["MAX_GRID_GOALS"]
+
+    goals = np.arange(lo, hi + 1)
+    cdf_a = np.cumsum(_poisson_pmf_table(lam_a, hi))[lo:]
+    cdf_b = np.cumsum(_poisson_pmf_table(lam_b, hi))[lo:]
+    truncated = 1.0 - cdf_a * cdf_b
+    fits = np.nonzero(truncated <= tol)[0]
+    idx = int(fits[0]) if len(fits) else len(goals) - 1
+    return int(goals[idx]), float(max(0.0, truncated[idx]))
+
+
+def build_score_matrix(lam_a: float, lam_b: float, max_goals: int = None) -> np.ndarray:
+    """
+    Build normalized score probability matrix with DC correction.
+    Grid size comes from choose_grid_size() unless max_goals is given.
+    """
+    if max_goals is None:
+        max_goals, _ = choose_grid_size(lam_a, lam_b)
     rho = CONFIG["DIXON_COLES_RHO"]
 
-    matrix = np.zeros((max_g + 1, max_g + 1))
-    for i in range(max_g + 1):
-        for j in range(max_g + 1):
-            base = poisson.pmf(i, lam_a) * poisson.pmf(j, lam_b)
-            matrix[i, j] = dixon_coles_adjust(base, i, j, lam_a, lam_b, rho)
+    matrix = np.outer(_poisson_pmf_table(lam_a, max_goals), _poisson_pmf_table(lam_b, max_goals))
+    for i in (0, 1):
+        for j in (0, 1):
+            matrix[i, j] = dixon_coles_adjust(matrix[i, j], i, j, lam_a, lam_b, rho)
 
     total = matrix.sum()
     if total > 0:
@@ -560,25 +898,203 @@ def build_score_matrix(lam_a: float, lam_b: float) -> np.ndarray:
 #  MONTE CARLO SIMULATION (DC-consistent)
 # â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
 
-def simulate_matches(matrix: np.ndarray, n_sims: int) -> dict:
+def draw_uniforms(rng: np.random.Generator, n: int, method: str = "none") -> np.ndarray:
+    """
+    Uniform variates for inverse-CDF sampling.
+
+    "antithetic" returns adjacent (u, 1-u) pairs; "stratified" places one
+    draw in each of n equal strata of [0, 1) in random order.
+    """
+    if method == "antithetic":
+        half = rng.random((n + 1) // 2)
+        u = np.empty(2 * len(half))
+        u[0::2] = half
+        u[1::2] = 1.0 - half
+        return u[:n]
+    if method == "stratified":
+        return (rng.permutation(n) + rng.random(n)) / n
+    return rng.random(n)
+
+
+class OutcomeTally:
+    """
+    Running outcome counts with Monte Carlo standard errors.
+
+    Plain and stratified runs use the binomial SE, which is an upper bound
+    for stratified sampling. Antithetic runs use the variance of the pair
+    means, so the reported error reflects the reduction actually achieved.
+    """
+
+    def __init__(self, n_outcomes: int, antithetic: bool = False):
+        self.counts = np.zeros(n_outcomes, dtype=np.int64)
+        self.pair_sq = np.zeros(n_outcomes)
+        self.antithetic = antithetic
+        self.n = 0
+
+    def add(self, outcomes: np.ndarray):
+        """Record a batch of outcome codes (0..n_outcomes-1)."""
+        k = len(self.counts)
+        self.counts += np.bincount(outcomes, minlength=k)[:k]
+        if self.antithetic:
+            pairs = outcomes[: len(outcomes) // 2 * 2].reshape(-1, 2)
+            for code in range(k):
+                hits = (pairs == code).sum(axis=1)
+                self.pair_sq[code] += (hits * hits).sum() / 4.0
+        self.n += len(outcomes)
+
+    @property
+    def probs(self) -> np.ndarray:
+        return self.counts / max(self.n, 1)
+
+    def std_errors(self) -> np.ndarray:
+        p = self.probs
+        if self.n == 0:
+            return np.full(len(p), np.inf)
+        if self.antithetic and self.n >= 4:
+            n_pairs = self.n // 2
+            var = np.maximum(self.pair_sq / n_pairs - p * p, 0.0)
+            return np.sqrt(var / n_pairs)
+        return np.sqrt(p * (1.0 - p) / self.n)
+
+    def half_width(self, z: float = None) -> float:
+        """Largest CI half-width across all tracked outcomes."""
+        if z is None:
+            z = CONFIG["MC_Z"]
+        return float(z * self.std_errors().max())
+
+
+def adaptive_simulation(draw_batch, n_outcomes: int, max_sims: int,
+                        tol: float = None, method: str = "none") -> OutcomeTally:
+    """
+    Call draw_batch(k) -> outcome codes until every outcome's CI half-width
+    is within tol, or max_sims draws have been made.
+    Without a tolerance, max_sims draws are made in one pass.
+    """
+    antithetic = method == "antithetic"
+    tally = OutcomeTally(n_outcomes, antithetic=antithetic)
+    if tol is None:
+        tally.add(draw_batch(max_sims))
+        return tally
+
+    batch = CONFIG["MC_BATCH"]
+    if antithetic:
+        batch += batch % 2  # keep (u, 1-u) pairs inside one batch
+    while tally.n < max_sims:
+        tally.add(draw_batch(min(batch, max_sims - tally.n)))
+        if tally.n >= CONFIG["MC_MIN_SIMULATIONS"] and tally.half_width() <= tol:
+            break
+    return tally
+
+
+class ScorelineSampler:
+    """
+    CDF table over the flattened score matrix, built once per fixture.
+
+    Draws are uniform variates pushed through searchsorted in fixed-size
+    chunks, written straight into int8 goal buffers. For the same generator
+    this yields exactly the draws np.random.Generator.choice(p=...) would,
+    without re-validating the probability vector on every call.
+    """
+
+    __slots__ = ("cdf", "width")
+
+    def __init__(self, matrix: np.ndarray):
+        cdf = np.cumsum(matrix, dtype=np.float64).ravel()
+        cdf /= cdf[-1]  # ensure normalized
+        self.cdf = cdf
+        self.width = matrix.shape[1]
+
+    def sample(self, n: int, rng: np.random.Generator,
+               goals_a: np.ndarray = None, goals_b: np.ndarray = None,
+               method: str = "none") -> tuple:
+        """Fill (or allocate) int8 goal buffers with n scoreline draws."""
+        if goals_a is None:
+            goals_a = np.empty(n, dtype=np.int8)
+        if goals_b is None:
+            goals_b = np.empty(n, dtype=np.int8)
+
+        chunk = CONFIG["SIM_CHUNK"]
+        last = len(self.cdf) - 1
+        for start in range(0, n, chunk):
+            stop = min(start + chunk, n)
+            u = draw_uniforms(rng, stop - start, method)
+            idx = np.searchsorted(self.cdf, u, side="right")
+            np.minimum(idx, last, out=idx)
+            goals_a[start:stop] = idx // self.width
+            goals_b[start:stop] = idx % self.width
+        return goals_a, goals_b
+
+
+_SAMPLER_CACHE = {}
+
+
+def get_sampler(matrix: np.ndarray, key: tuple = None) -> ScorelineSampler:
+    """
+    Cached sampler for a fixture key, tied to the loaded data version
+    (DataStore.version). Without a key the table is built fresh (ad-hoc matrices).
+    """
+    if key is None:
+        return ScorelineSampler(matrix)
+
+    cache_key = (key, _data.version)
+    sampler = _SAMPLER_CACHE.get(cache_key)
+    cache_lookup("sampler", sampler is not None)
+    if sampler is None:
+        if len(_SAMPLER_CACHE) >= CONFIG["SAMPLER_CACHE_SIZE"]:
+            _SAMPLER_CACHE.clear()
+        sampler = ScorelineSampler(matrix)
+        _SAMPLER_CACHE[cache_key] = sampler
+    return sampler
+
+
+def simulate_matches(matrix: np.ndarray, n_sims: int,
+                     rng: np.random.Generator = None,
+                     sampler: ScorelineSampler = None,
+                     tol: float = None, method: str = None) -> dict:
     """
     Sample from the actual DC-corrected score matrix,
     NOT from plain Poisson. This keeps MC and analytical consistent.
-    """
-    max_g = matrix.shape[0]
-    flat_probs = matrix.flatten()
-    flat_probs = flat_probs / flat_probs.sum()  # ensure normalized
+    Pass a keyed generator from rng_streams for reproducible fixtures,
+    and a cached sampler from get_sampler() to skip the table build.
 
-    indices = np.random.choice(len(flat_probs), size=n_sims, p=flat_probs)
-    goals_a = indices // max_g
-    goals_b = indices % max_g
+    With tol set, n_sims is the upper bound: batches stop as soon as the
+    W/D/L CI half-widths are all within tol. Standard errors are returned
+    as probabilities alongside the achieved half-width.
+    """
+    if rng is None:
+        rng = get_generator("simulate_matches")
+    if sampler is None:
+        sampler = ScorelineSampler(matrix)
+    if method is None:
+        method = CONFIG["MC_VARIANCE_REDUCTION"]
+
+    goals_a = np.empty(n_sims, dtype=np.int8)
+    goals_b = np.empty(n_sims, dtype=np.int8)
+    filled = 0
+
+    def draw_batch(k):
+        nonlocal filled
+        ga, gb = sampler.sample(k, rng, goals_a[filled:filled + k],
+                                goals_b[filled:filled + k], method=method)
+        filled += k
+        # 0 = team A win, 1 = draw, 2 = team B win
+        return (np.sign(gb.astype(np.int16) - ga) + 1).astype(np.intp)
+
+    tally = adaptive_simulation(draw_batch, 3, n_sims, tol=tol, method=method)
+    SIMULATIONS.inc(tally.n)
+    se = tally.std_errors()
+    wins_a, draws, wins_b = (int(c) for c in tally.counts)
 
     return {
-        "goals_a": goals_a,
-        "goals_b": goals_b,
-        "wins_a": int((goals_a > goals_b).sum()),
-        "draws": int((goals_a == goals_b).sum()),
-        "wins_b": int((goals_a < goals_b).sum()),
+        "goals_a": goals_a[:tally.n],
+        "goals_b": goals_b[:tally.n],
+        "wins_a": wins_a,
+        "draws": draws,
+        "wins_b": wins_b,
+        "n_sims": tally.n,
+        "std_errors": {"wins_a": float(se[0]), "draws": float(se[1]), "wins_b": float(se[2])},
+        "half_width": tally.half_width(),
+        "method": method,
     }
 
 
@@ -696,7 +1212,21 @@ def classify_match(rank_a: int, rank_b: int) -> str:
 #  MAIN PREDICTION FUNCTION
 # â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
 
-def predict(team_a: str, team_b: str, home: str = None) -> dict:
+def team_inputs(team: str) -> dict:
+    """Everything predict() needs about one team, independent of the opponent."""
+    with stage("predict.team_stats"):
+        stats = get_team_stats(team)
+    with stage("predict.ranking"):
+        rank, points = get_team_ranking(team), get_team_points(team)
+    with stage("predict.stars"):
+        star = get_team_star_impact(team)
+    with stage("predict.coach"):
+        coach = get_coach_data(team, DATA_DIR)
+    return {"stats": stats, "rank": rank, "points": points, "star": star, "coach": coach}
+
+
+def predict(team_a: str, team_b: str, home: str = None,
+            mc_tolerance: float = None) -> dict:
     """
     Generate a full match prediction for team_a vs team_b.
 
@@ -704,52 +1234,120 @@ def predict(team_a: str, team_b: str, home: str = None) -> dict:
         team_a: First team name (must match dataset)
         team_b: Second team name
         home: Name of the home team (or None for neutral)
+        mc_tolerance: Target CI half-width for the simulated W/D/L
+            (probability units); defaults to CONFIG["MC_TOLERANCE"]
 
     Returns:
         Dictionary with probabilities, lambdas, top scores,
-        simulation data, and metadata.
+        simulation data, and metadata (plus per-stage "timings" in ms
+        when stage_timer is enabled with attach).
     """
+    with timed_call("predict") as timings:
+        result = _predict(team_a, team_b, home, mc_tolerance, team_inputs(team_a), team_inputs(team_b))
+    if timings is not None:
+        result["timings"] = timings
+    return result
+
+
+def predict_many(fixtures, mc_tolerance: float = None) -> list:
+    """
+    predict() for a list of (team_a, team_b[, home]) fixtures in one pass.
+
+    Team inputs (form stats, ranking, stars, coach) are computed once per
+    team rather than once per fixture, which is most of predict()'s cost;
+    results are identical to calling predict() per fixture.
+    """
+    fixtures = [tuple(f) + (None,) * (3 - len(f)) for f in fixtures]
+    inputs = {}
+    for team_a, team_b, _ in fixtures:
+        for team in (team_a, team_b):
+            if team not in inputs:
+                inputs[team] = team_inputs(team)
+    results = []
+    for a, b, home in fixtures:
+        with timed_call("predict") as timings:
+            result = _predict(a, b, home, mc_tolerance, inputs[a], inputs[b])
+        if timings is not None:
+            result["timings"] = timings
+        results.append(result)
+    return results
+
+
+# Per-simulation arrays and the full grid: large and not JSON-friendly
+RECORD_DROP_KEYS = ("score_matrix", "goals_a", "goals_b")
+
+
+def prediction_record(result: dict) -> dict:
+    """
+    JSON-safe view of a predict() result for CLIs and services: drops
+    RECORD_DROP_KEYS, converts numpy scalars to Python numbers and cleans
+    the match type label.
+    """
+    record = {}
+    for key, value in result.items():
+        if key in RECORD_DROP_KEYS:
+            continue
+        if isinstance(value, np.generic):
+            value = value.item()
+        elif key == "top_scores":
+            value = [[score, float(p)] for score, p in value]
+        record[key] = value
+    record["match_type"] = clean_match_type(result.get("match_type"))
+    return record
+
+
+def _predict(team_a: str, team_b: str, home: str, mc_tolerance: float,
+             inputs_a: dict, inputs_b: dict) -> dict:
+    PREDICTIONS.inc()
     # â”€â”€ Gather data â”€â”€
-    stats_a = get_team_stats(team_a)
-    stats_b = get_team_stats(team_b)
-    rank_a = get_team_ranking(team_a)
-    rank_b = get_team_ranking(team_b)
-    points_a = get_team_points(team_a)
-    points_b = get_team_points(team_b)
-    star_a = get_team_star_impact(team_a)
-    star_b = get_team_star_impact(team_b)
-    coach_a = get_coach_data(team_a, DATA_DIR)
-    coach_b = get_coach_data(team_b, DATA_DIR)
+    stats_a, stats_b = inputs_a["stats"], inputs_b["stats"]
+    rank_a, rank_b = inputs_a["rank"], inputs_b["rank"]
+    points_a, points_b = inputs_a["points"], inputs_b["points"]
+    star_a, star_b = inputs_a["star"], inputs_b["star"]
+    coach_a, coach_b = inputs_a["coach"], inputs_b["coach"]
+    with stage("predict.h2h"):
+        h2h = head_to_head(team_a, team_b)
 
     # â”€â”€ Compute expected goals â”€â”€
-    lam_a, lam_b = compute_lambdas(
-        team_a, team_b, stats_a, stats_b,
-        rank_a, rank_b, star_a, star_b,
-        coach_a, coach_b,
-        home
-    )
+    with stage("predict.lambdas"):
+        lam_a, lam_b = compute_lambdas(
+            team_a, team_b, stats_a, stats_b,
+            rank_a, rank_b, star_a, star_b,
+            coach_a, coach_b,
+            home
+        )
 
     # â”€â”€ Build score matrix (analytical) â”€â”€
-    matrix = build_score_matrix(lam_a, lam_b)
-    max_g = CONFIG["MAX_GOALS"]
+    with stage("predict.matrix"):
+        max_g, truncated_mass = choose_grid_size(lam_a, lam_b)
+        matrix = build_score_matrix(lam_a, lam_b, max_g)
 
-    # â”€â”€ Extract probabilities â”€â”€
-    win_a = sum(matrix[i, j] for i in range(max_g+1) for j in range(max_g+1) if i > j)
-    draw  = sum(matrix[i, j] for i in range(max_g+1) for j in range(max_g+1) if i == j)
-    win_b = sum(matrix[i, j] for i in range(max_g+1) for j in range(max_g+1) if i < j)
+    with stage("predict.scorelines"):
+        # â”€â”€ Extract probabilities â”€â”€
+        win_a = float(np.tril(matrix, -1).sum())
+        draw  = float(np.trace(matrix))
+        win_b = float(np.triu(matrix, 1).sum())
 
-    # â”€â”€ Top predicted scorelines â”€â”€
-    score_probs = {}
-    for i in range(max_g + 1):
-        for j in range(max_g + 1):
-            score_probs[f"{i}-{j}"] = float(matrix[i, j])
+        # â”€â”€ Top predicted scorelines â”€â”€
+        score_probs = {}
+        for i in range(max_g + 1):
+            for j in range(max_g + 1):
+                score_probs[f"{i}-{j}"] = float(matrix[i, j])
 
-    top_scores = sorted(score_probs.items(), key=lambda x: -x[1])[:10]
-    top_scores_display = [(s, round(p * 100, 2)) for s, p in top_scores]  # actual %
+        top_scores = sorted(score_probs.items(), key=lambda x: -x[1])[:10]
+        top_scores_display = [(s, round(p * 100, 2)) for s, p in top_scores]  # actual %
 
     # â”€â”€ Monte Carlo (DC-consistent) â”€â”€
-    n_sims = CONFIG["N_SIMULATIONS"]
-    sim = simulate_matches(matrix, n_sims)
+    if mc_tolerance is None:
+        mc_tolerance = CONFIG["MC_TOLERANCE"]
+    n_max = CONFIG["MC_MAX_SIMULATIONS"] if mc_tolerance else CONFIG["N_SIMULATIONS"]
+    fixture_key = ("predict", team_a, team_b, home)
+    with stage("predict.monte_carlo"):
+        sim = simulate_matches(matrix, n_max,
+                               rng=get_generator(*fixture_key),
+                               sampler=get_sampler(matrix, fixture_key),
+                               tol=mc_tolerance)
+    n_sims = sim["n_sims"]
 
     # â”€â”€ Confidence check: analytical vs simulation â”€â”€
     sim_win_a_pct = round(100 * sim["wins_a"] / n_sims, 1)
@@ -770,6 +1368,13 @@ def predict(team_a: str, team_b: str, home: str = None) -> dict:
         "sim_team_a_win": sim_win_a_pct,
         "sim_draw": sim_draw_pct,
         "sim_team_b_win": sim_win_b_pct,
+        "sim_std_error": {
+            "team_a_win": round(100 * sim["std_errors"]["wins_a"], 2),
+            "draw": round(100 * sim["std_errors"]["draws"], 2),
+            "team_b_win": round(100 * sim["std_errors"]["wins_b"], 2),
+        },
+        "sim_precision": round(100 * sim["half_width"], 2),  # CI half-width, % points
+        "sim_method": sim["method"],
 
         # Expected goals
         "team_a_lambda": lam_a,
@@ -814,6 +1419,14 @@ def predict(team_a: str, team_b: str, home: str = None) -> dict:
         "team_b_attack": stats_b["attack"],
         "team_b_defense": stats_b["defense"],
 
+        # Head-to-head (all meetings, from team A's side)
+        "h2h_matches": h2h["matches"],
+        "h2h_wins_a": h2h["wins_a"],
+        "h2h_draws": h2h["draws"],
+        "h2h_wins_b": h2h["wins_b"],
+        "h2h_goals_a": h2h["goals_a"],
+        "h2h_goals_b": h2h["goals_b"],
+
         # Match metadata
         "match_type": classify_match(rank_a, rank_b),
         "rank_gap": abs(rank_a - rank_b),
@@ -822,6 +1435,8 @@ def predict(team_a: str, team_b: str, home: str = None) -> dict:
         # Scorelines (% not fake simulation counts)
         "top_scores": top_scores_display,
         "score_matrix": matrix,
+        "grid_max_goals": max_g,
+        "truncated_mass": truncated_mass,
 
         # Simulation arrays (for histograms in charts)
         "goals_a": sim["goals_a"],
@@ -830,6 +1445,234 @@ def predict(team_a: str, team_b: str, home: str = None) -> dict:
     }
 
 
+# â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
+#  KNOCKOUT RESOLUTION (extra time + penalties)
+# â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
+
+def et_outcome_probs(lam_a, lam_b, et_scale: float = None, max_goals: int = None) -> dict:
+    """
+    Conditional extra-time outcome for one or many fixtures.
+
+    lam_a/lam_b are 90-minute lambdas (scalars or arrays). The 30-minute
+    grids for every fixture are built as one (n, G, G) array; the returned
+    probabilities are normalised over the truncated grid.
+    """
+    if et_scale is None:
+        et_scale = CONFIG["ET_SCALE"]
+    if max_goals is None:
+        max_goals = CONFIG["ET_MAX_GOALS"]
+    la = np.maximum(np.asarray(lam_a, dtype=np.float64) * et_scale, 0.0)
+    lb = np.maximum(np.asarray(lam_b, dtype=np.float64) * et_scale, 0.0)
+    la, lb = np.broadcast_arrays(la, lb)
+
+    grid = _poisson_pmf_table(la, max_goals)[..., :, None] * _poisson_pmf_table(lb, max_goals)[..., None, :]
+    a_win = np.tril(grid, -1).sum(axis=(-2, -1))
+    draw = np.trace(grid, axis1=-2, axis2=-1)
+    b_win = np.triu(grid, 1).sum(axis=(-2, -1))
+    total = a_win + draw + b_win
+    total = np.where(total > 0, total, 1.0)
+    return {
+        "a_win_et_cond": a_win / total,
+        "draw_et_cond": draw / total,
+        "b_win_et_cond": b_win / total,
+        "lambda_a_et": la,
+        "lambda_b_et": lb,
+    }
+
+
+def _logit(p):
+    return np.log(p / (1.0 - p))
+
+
+def build_shootout_table(df: pd.DataFrame) -> dict:
+    """
+    Per-team shootout strength from historical shootouts.
+
+    Each team's (time-weighted) win rate is shrunk toward 50% with
+    SHOOTOUT_PRIOR_K pseudo-shootouts and stored as a log-odds. The
+    first-shooter edge is estimated the same way from the rows that record
+    who kicked first. The strength array has one extra trailing 0.0 entry,
+    so index -1 is the prior for teams without any shootouts.
+    """
+    k = CONFIG["SHOOTOUT_PRIOR_K"]
+    if df.empty:
+        return {"index": {}, "strength": np.zeros(1), "first_shooter": 0.0, "n_shootouts": 0}
+
+    years_ago = (pd.Timestamp(datetime.now()) - df["date"]).dt.days.fillna(0).clip(lower=0) / 365.25
+    w = np.power(0.5, years_ago.to_numpy() / CONFIG["SHOOTOUT_HALF_LIFE_YEARS"])
+
+    teams = pd.concat([df["home_team"], df["away_team"]], ignore_index=True)
+    weights = np.concatenate([w, w])
+    won = np.concatenate([(df["winner"] == df["home_team"]).to_numpy(),
+                          (df["winner"] == df["away_team"]).to_numpy()])
+    played = pd.Series(weights).groupby(teams.to_numpy()).sum()
+    wins = pd.Series(weights * won).groupby(teams.to_numpy()).sum()
+
+    rate = (wins + 0.5 * k) / (played + k)
+    index = {team: i for i, team in enumerate(rate.index)}
+    strength = np.append(_logit(rate.to_numpy()), 0.0)
+
+    known = df["first_shooter"].notna()
+    fw = w[known.to_numpy()]
+    first_won = (df.loc[known, "first_shooter"] == df.loc[known, "winner"]).to_numpy()
+    first_rate = (float((fw * first_won).sum()) + 0.5 * k) / (float(fw.sum()) + k)
+
+    return {
+        "index": index,
+        "strength": strength,
+        "first_shooter": float(_logit(first_rate)),
+        "n_shootouts": len(df),
+    }
+
+
+def shootout_team_index(teams) -> np.ndarray:
+    """Row of each team in the shootout table (-1 = no shootout history)."""
+    index = _data.shootouts["index"]
+    if isinstance(teams, str):
+        return np.intp(index.get(teams, -1))
+    return np.array([index.get(t, -1) for t in teams], dtype=np.intp)
+
+
+def shootout_win_prob(idx_a, idx_b, first_a=0) -> np.ndarray:
+    """
+    P(team A wins the shootout) for arrays of table rows (vectorized).
+
+    first_a is +1 when A kicks first, -1 when B does and 0 when unknown
+    (the coin toss is averaged over both orders).
+    """
+    table = _data.shootouts
+    strength = table["strength"]
+    edge = strength[idx_a] - strength[idx_b]
+    fs = table["first_shooter"]
+    first_a = np.asarray(first_a)
+    p_first = 1.0 / (1.0 + np.exp(-(edge + fs)))
+    p_second = 1.0 / (1.0 + np.exp(-(edge - fs)))
+    p_a = np.where(first_a > 0, p_first,
+                   np.where(first_a < 0, p_second, 0.5 * (p_first + p_second)))
+    return np.clip(p_a, CONFIG["SHOOTOUT_MIN_PROB"], 1.0 - CONFIG["SHOOTOUT_MIN_PROB"])
+
+
+def penalty_shootout_probs(team_a: str, team_b: str, first_shooter: str = None) -> dict:
+    """Shootout win probabilities for a fixture (first_shooter if known)."""
+    first_a = 0
+    if first_shooter == team_a:
+        first_a = 1
+    elif first_shooter == team_b:
+        first_a = -1
+    p_a = float(shootout_win_prob(shootout_team_index(team_a), shootout_team_index(team_b), first_a))
+    return {"a_pen_win_cond": p_a, "b_pen_win_cond": 1.0 - p_a}
+
+
+def knockout_probs(win_a, draw, win_b, lam_a, lam_b, pen_a) -> dict:
+    """
+    Advancement probabilities for a batch of knockout fixtures.
+
+    All inputs are fractions (not %) and broadcast together: 90-minute
+    W/D/L, 90-minute lambdas and P(team A wins the shootout). Returns
+    arrays split by how the tie is decided.
+    """
+    win_a = np.asarray(win_a, dtype=np.float64)
+    draw = np.asarray(draw, dtype=np.float64)
+    win_b = np.asarray(win_b, dtype=np.float64)
+    pen_a = np.asarray(pen_a, dtype=np.float64)
+    et = et_outcome_probs(lam_a, lam_b)
+
+    a_win_et = draw * et["a_win_et_cond"]
+    b_win_et = draw * et["b_win_et_cond"]
+    a_win_pens = draw * et["draw_et_cond"] * pen_a
+    b_win_pens = draw * et["draw_et_cond"] * (1.0 - pen_a)
+    return {
+        "team_a_advance": win_a + a_win_et + a_win_pens,
+        "team_b_advance": win_b + b_win_et + b_win_pens,
+        "team_a_win_90": win_a,
+        "team_b_win_90": win_b,
+        "team_a_win_et": a_win_et,
+        "team_b_win_et": b_win_et,
+        "team_a_win_pens": a_win_pens,
+        "team_b_win_pens": b_win_pens,
+        "draw_after_90": draw,
+        "team_a_et_lambda": et["lambda_a_et"],
+        "team_b_et_lambda": et["lambda_b_et"],
+    }
+
+
+def simulate_knockout_mc(team_a: str, team_b: str, result: dict,
+                         pen_a: float, mc_tolerance: float = None) -> dict:
+    """Monte Carlo cross-check of the analytic knockout split."""
+    sampler = get_sampler(result["score_matrix"], key=("predict", team_a, team_b, result.get("home")))
+    rng = get_generator("knockout", team_a, team_b, result.get("home"))
+    method = CONFIG["MC_VARIANCE_REDUCTION"]
+    la_et = float(result["team_a_lambda"]) * CONFIG["ET_SCALE"]
+    lb_et = float(result["team_b_lambda"]) * CONFIG["ET_SCALE"]
+
+    def draw_batch(k):
+        ga, gb = sampler.sample(k, rng, method=method)
+        ea = rng.poisson(la_et, k)
+        eb = rng.poisson(lb_et, k)
+        pens = rng.random(k) < pen_a
+        level = ga == gb
+        a_adv = (ga > gb) | (level & (ea > eb)) | (level & (ea == eb) & pens)
+        # 0 = team A advances, 1 = team B advances
+        return (~a_adv).astype(np.intp)
+
+    tally = adaptive_simulation(draw_batch, 2, CONFIG["MC_MAX_SIMULATIONS"],
+                                tol=mc_tolerance, method=method)
+    se = tally.std_errors()
+    return {
+        "sim_team_a_advance": round(100 * float(tally.probs[0]), 1),
+        "sim_team_b_advance": round(100 * float(tally.probs[1]), 1),
+        "sim_advance_se": round(100 * float(se[0]), 2),
+        "sim_precision": round(100 * tally.half_width(), 2),
+        "sim_n": tally.n,
+    }
+
+
+def simulate_knockout(team_a: str, team_b: str, result: dict, mc_tolerance: float = None) -> dict:
+    """
+    Resolve a predict() result as a knockout tie (90' -> ET -> penalties).
+
+    Percentages are rounded like predict(). With mc_tolerance set, a Monte
+    Carlo run to that precision is added under the sim_* keys.
+    """
+    pen_a = penalty_shootout_probs(team_a, team_b)["a_pen_win_cond"]
+    ko = knockout_probs(
+        float(result.get("team_a_win", 0.0)) / 100.0,
+        float(result.get("draw", 0.0)) / 100.0,
+        float(result.get("team_b_win", 0.0)) / 100.0,
+        float(result.get("team_a_lambda", 0.0)),
+        float(result.get("team_b_lambda", 0.0)),
+        pen_a,
+    )
+    out = {k: round(float(v) * 100, 1) for k, v in ko.items() if not k.endswith("_et_lambda")}
+    out["team_a_et_lambda"] = round(float(ko["team_a_et_lambda"]), 3)
+    out["team_b_et_lambda"] = round(float(ko["team_b_et_lambda"]), 3)
+    if mc_tolerance is not None and "score_matrix" in result:
+        out.update(simulate_knockout_mc(team_a, team_b, result, pen_a, mc_tolerance))
+    return out
+
+
+def knockout_batch(results: list) -> list:
+    """simulate_knockout() for many predict() results with one set of array ops."""
+    if not results:
+        return []
+
+    def col(key, default):
+        return np.array([float(r.get(key, default)) for r in results])
+
+    pen_a = shootout_win_prob(shootout_team_index([r["team_a"] for r in results]),
+                              shootout_team_index([r["team_b"] for r in results]))
+    ko = knockout_probs(col("team_a_win", 0.0) / 100.0, col("draw", 0.0) / 100.0,
+                        col("team_b_win", 0.0) / 100.0, col("team_a_lambda", 0.0),
+                        col("team_b_lambda", 0.0), pen_a)
+    rows = []
+    for i in range(len(results)):
+        row = {k: round(float(v[i]) * 100, 1) for k, v in ko.items() if not k.endswith("_et_lambda")}
+        row["team_a_et_lambda"] = round(float(ko["team_a_et_lambda"][i]), 3)
+        row["team_b_et_lambda"] = round(float(ko["team_b_et_lambda"][i]), 3)
+        rows.append(row)
+    return rows
+
+
 # â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
 #  ENTRY POINT
 # â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
@@ -879,7 +1722,10 @@ if __name__ == "__main__":
     print(f"  ¦")
     print(f"  +---------------------------------------------+")
     print(f"\n  Simulation cross-check ({result['n_simulations']:,} runs):")
-    print(f"  Win: {result['sim_team_a_win']}% | Draw: {result['sim_draw']}% | Win: {result['sim_team_b_win']}%")
+    print(f"  Win: {result['sim_team_a_win']}% | Draw: {result['sim_draw']}% | Win: {result['sim_team_b_win']}%"
+          f"  (±{result['sim_precision']:.2f} pts)")
+    print(f"  Score grid: 0-{result['grid_max_goals']} goals"
+          f" (truncated mass {result['truncated_mass']:.2e})")
     print(f"\n  Top Predicted Scorelines:")
     for score, pct in result["top_scores"][:5]:
         print(f"    {score:>5s}  â†’  {pct:.1f}%")
@@ -0,0 +1,430 @@
+"""
+Mundialista AI - Local Prediction Service
+A small HTTP/JSON wrapper around the engine for other local tools
+(stdlib http.server, no extra dependencies; binds to 127.0.0.1).
+
+Endpoints:
+    GET  /health
+    GET  /predict?team_a=Argentina&team_b=Brazil[&home=Argentina][&mc_tolerance=0.005]
+    POST /predict          {"team_a": ..., "team_b": ..., "home": ..., "mc_tolerance": ...}
+    POST /predict/batch    {"fixtures": [{"team_a": ..., "team_b": ..., "home": ...}, ...]}
+    GET  /group/{letter}   expected standings + fixture odds (prediction cube)
+    GET  /groups           all 12 groups
+    GET  /metrics          Prometheus text (metrics.py); /metrics.json for JSON
+    GET  /memory           per-structure bytes (memory_report.py); ?top=N adds the
+                           largest allocation sites when tracemalloc is on
+
+One engine is loaded and warmed at start-up (warmup.py: data, coaches and
+the 72 group fixtures). Predictions run on a CPU worker pool: a process
+pool when --workers > 0 (each process loads the data when it starts),
+otherwise threads in this process. When the data files change, the data
+is reloaded, the warm-up restarted and the process pool replaced. Identical
+requests that arrive while one is already in flight share its result
+instead of simulating again. Group endpoints read the prediction cube and
+answer in milliseconds.
+
+Usage:
+    python prediction_service.py [--port 8765] [--workers 2] [--access-log]
+    curl "http://127.0.0.1:8765/predict?team_a=Spain&team_b=Japan"
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import memory_report
+import metrics
+import prediction_engine
+from content_automation import WC2026_GROUPS, resolve_team_name
+from prediction_engine import data_fingerprint, predict, predict_many, prediction_record
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_BATCH = 2000
+BATCH_CHUNK_SIZE = 32
+
+REQUESTS = metrics.counter("mundialista_http_requests_total", "HTTP requests by route and status",
+                           ("route", "status"))
+REQUEST_SECONDS = metrics.counter("mundialista_http_request_seconds_total", "Time spent answering requests",
+                                  ("route",))
+
+
+class ServiceError(Exception):
+    """Client error with an HTTP status."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+# ──────────────────────────────────────────────
+#  WORKER TASKS (run in the pool)
+# ──────────────────────────────────────────────
+
+def _init_worker():
+    """Load the engine data once per pool process, before its first request."""
+    from warmup import Warmup
+
+    Warmup._load_data()
+
+
+def _predict_task(team_a: str, team_b: str, home: str, mc_tolerance: float) -> dict:
+    return prediction_record(predict(team_a, team_b, home=home, mc_tolerance=mc_tolerance))
+
+
+def _batch_task(fixtures: list, mc_tolerance: float) -> list:
+    return [prediction_record(r) for r in predict_many(fixtures, mc_tolerance=mc_tolerance)]
+
+
+# ──────────────────────────────────────────────
+#  REQUEST COALESCING
+# ──────────────────────────────────────────────
+
+class Coalescer:
+    """Share one pool future between identical in-flight requests."""
+
+    def __init__(self, executor):
+        self.executor = executor
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self.hits = 0
+
+    def submit(self, key, fn, *args):
+        with self._lock:
+            fut = self._inflight.get(key)
+            metrics.cache_lookup("coalesce", fut is not None)
+            if fut is not None:
+                self.hits += 1
+                return fut
+            fut = self.executor.submit(fn, *args)
+            self._inflight[key] = fut
+        fut.add_done_callback(lambda _f, k=key: self._forget(k))
+        return fut
+
+    def _forget(self, key):
+        with self._lock:
+            self._inflight.pop(key, None)
+
+
+# ──────────────────────────────────────────────
+#  SERVICE
+# ──────────────────────────────────────────────
+
+class PredictionService:
+    """Engine state shared by every request handler thread."""
+
+    def __init__(self, workers: int = 0, mc_tolerance: float = None):
+        self.workers = workers
+        self.mc_tolerance = mc_tolerance
+        self.started = time.time()
+        self.warm = None
+        self.data_version = data_fingerprint()
+        self._sync_lock = threading.Lock()
+        self._cube = None
+        self._cube_version = None
+        self._cube_lock = threading.Lock()
+        self._teams = None
+        self.executor = self._make_executor()
+        self.coalescer = Coalescer(self.executor)
+        metrics.gauge("mundialista_service_inflight", "Distinct predictions queued or running",
+                      fn=lambda: len(self.coalescer._inflight))
+
+    def start(self) -> "PredictionService":
+        from warmup import start_warmup
+
+        self.warm = start_warmup(mc_tolerance=self.mc_tolerance)
+        self.data_version = self.warm.data_version
+        self.warm.wait("data")
+        return self
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _make_executor(self):
+        if self.workers > 0:
+            # Each process loads the data at spawn, not on its first request
+            pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                       mp_context=multiprocessing.get_context("spawn"))
+            for _ in range(self.workers):
+                pool.submit(int)        # processes start on demand; start them all now
+            return pool
+        return ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="predict")
+
+    def _recycle_pool(self):
+        """New worker processes for new data; running tasks finish on the old pool."""
+        old = self.executor
+        self.executor = self._make_executor()
+        with self.coalescer._lock:
+            self.coalescer.executor = self.executor
+        old.shutdown(wait=False)
+
+    # ── helpers ──
+
+    def _sync_data(self):
+        """Follow the data files: on a new data version reload the store and restart the warm-up."""
+        version = data_fingerprint()
+        if version == self.data_version:
+            return
+        with self._sync_lock:
+            if version == self.data_version:
+                return
+            prediction_engine.reload_data()
+            self._teams = None
+            if self.workers > 0:
+                self._recycle_pool()
+            if self.warm is not None:
+                from warmup import start_warmup
+
+                self.warm.cancel()
+                self.warm = start_warmup(mc_tolerance=self.mc_tolerance)
+            self.data_version = version
+
+    @property
+    def teams(self) -> set:
+        if self._teams is None:
+            df = prediction_engine._data.results
+            self._teams = set(df["home_team"]) | set(df["away_team"])
+        return self._teams
+
+    @property
+    def cube(self):
+        """Prediction cube for the current data version (rebuilt after the data files change)."""
+        self._sync_data()
+        with self._cube_lock:
+            version = self.data_version
+            if self._cube is None or version != self._cube_version:
+                from prediction_cube import load_cube
+                self._cube = load_cube()
+                self._cube_version = version
+            return self._cube
+
+    def _team(self, name) -> str:
+        if not name or not isinstance(name, str):
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "team_a and team_b are required")
+        team = resolve_team_name(name.strip())
+        if team not in self.teams:
+            raise ServiceError(HTTPStatus.NOT_FOUND, f"Unknown team: {name}")
+        return team
+
+    def _fixture(self, spec: dict) -> tuple:
+        team_a, team_b = self._team(spec.get("team_a")), self._team(spec.get("team_b"))
+        home = spec.get("home")
+        if home is not None and not isinstance(home, str):
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "home must be a team name")
+        if home:
+            home = resolve_team_name(home.strip())
+            if home not in (team_a, team_b):
+                raise ServiceError(HTTPStatus.BAD_REQUEST, "home must be team_a or team_b")
+        return team_a, team_b, home or None
+
+    def _tolerance(self, value):
+        if value is None:
+            return self.mc_tolerance
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "mc_tolerance must be a number")
+
+    # ── endpoints ──
+
+    def health(self) -> dict:
+        return {
+            "status": "ok",
+            "data_version": self.data_version,
+            "uptime_s": round(time.time() - self.started, 1),
+            "warm": bool(self.warm and self.warm.ready),
+            "workers": self.workers,
+            "coalesced": self.coalescer.hits,
+        }
+
+    def memory(self, top: int = 0) -> dict:
+        rep = memory_report.report(prediction_engine._data, self.warm)
+        if top and memory_report.tracemalloc.is_tracing():
+            rep["allocations"] = memory_report.top_allocations(memory_report.take_snapshot(), n=top)
+        return rep
+
+    def predict(self, spec: dict) -> dict:
+        self._sync_data()
+        team_a, team_b, home = self._fixture(spec)
+        mc_tolerance = self._tolerance(spec.get("mc_tolerance"))
+        warm = self.warm
+        # A warm-up started before the last data change holds stale fixtures
+        if warm is not None and warm.data_version == self.data_version:
+            warmed = warm.prediction(team_a, team_b, home, mc_tolerance)
+            if warmed is not None:
+                return prediction_record(warmed)
+        key = ("predict", team_a, team_b, home, mc_tolerance)
+        return self.coalescer.submit(key, _predict_task, team_a, team_b, home, mc_tolerance).result()
+
+    def predict_batch(self, body: dict) -> dict:
+        self._sync_data()
+        specs = body.get("fixtures")
+        if not isinstance(specs, list) or not specs:
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "fixtures must be a non-empty list")
+        if len(specs) > MAX_BATCH:
+            raise ServiceError(HTTPStatus.BAD_REQUEST, f"at most {MAX_BATCH} fixtures per batch")
+        fixtures = [self._fixture(s if isinstance(s, dict) else {}) for s in specs]
+        mc_tolerance = self._tolerance(body.get("mc_tolerance"))
+
+        futures = []
+        for start in range(0, len(fixtures), BATCH_CHUNK_SIZE):
+            chunk = fixtures[start:start + BATCH_CHUNK_SIZE]
+            key = ("batch", tuple(chunk), mc_tolerance)
+            futures.append(self.coalescer.submit(key, _batch_task, chunk, mc_tolerance))
+        predictions = [record for fut in futures for record in fut.result()]
+        return {"count": len(predictions), "predictions": predictions}
+
+    def group(self, letter: str) -> dict:
+        from tournament import price_group
+
+        letter = letter.upper()
+        if letter not in WC2026_GROUPS:
+            raise ServiceError(HTTPStatus.NOT_FOUND, f"Unknown group: {letter}")
+        return price_group(self.cube, letter)
+
+    def groups(self) -> dict:
+        return {"groups": {letter: self.group(letter) for letter in sorted(WC2026_GROUPS)}}
+
+
+# ──────────────────────────────────────────────
+#  HTTP
+# ──────────────────────────────────────────────
+
+_ROUTES = ("/health", "/predict/batch", "/predict", "/groups", "/group/", "/metrics", "/memory")
+
+
+def _route_label(path: str) -> str:
+    """Bounded route label for metrics (no team names or group letters)."""
+    path = urlparse(path).path
+    return next((r.rstrip("/") for r in _ROUTES if path.startswith(r)), "other")
+
+
+class Handler(BaseHTTPRequestHandler):
+    service: PredictionService = None
+    access_log = False
+    server_version = "MundialistaAI/1.0"
+
+    def _send(self, status, payload, content_type="application/json; charset=utf-8"):
+        if isinstance(payload, bytes):
+            body = payload
+        else:
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _body(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            body = json.loads(self.rfile.read(length))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "Body must be JSON")
+        if not isinstance(body, dict):
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "Body must be a JSON object")
+        return body
+
+    def _route(self, method):
+        url = urlparse(self.path)
+        path = url.path.rstrip("/") or "/"
+        svc = self.service
+        if method == "GET" and path == "/health":
+            return svc.health()
+        if path == "/predict":
+            if method == "GET":
+                spec = {k: v[-1] for k, v in parse_qs(url.query).items()}
+            else:
+                spec = self._body()
+            return svc.predict(spec)
+        if method == "POST" and path == "/predict/batch":
+            return svc.predict_batch(self._body())
+        if method == "GET" and path == "/groups":
+            return svc.groups()
+        if method == "GET" and path.startswith("/group/"):
+            return svc.group(path[len("/group/"):])
+        if method == "GET" and path == "/memory":
+            top = parse_qs(url.query).get("top", ["0"])[-1]
+            if not top.isdigit():
+                raise ServiceError(HTTPStatus.BAD_REQUEST, "top must be a whole number")
+            return svc.memory(int(top))
+        raise ServiceError(HTTPStatus.NOT_FOUND, f"No route for {method} {url.path}")
+
+    def _handle(self, method):
+        t0 = time.perf_counter()
+        route = _route_label(self.path)
+        status = HTTPStatus.OK
+        try:
+            page = metrics.render(self.path) if method == "GET" else None
+            if page is not None:
+                self._send(status, *page)
+            else:
+                self._send(status, self._route(method))
+        except ServiceError as e:
+            status = e.status
+            self._send(status, {"error": str(e)})
+        except Exception as e:
+            status = HTTPStatus.INTERNAL_SERVER_ERROR
+            self._send(status, {"error": f"{type(e).__name__}: {e}"})
+        REQUESTS.inc(route=route, status=int(status))
+        REQUEST_SECONDS.inc(time.perf_counter() - t0, route=route)
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def log_message(self, fmt, *args):
+        # Request counts and latency are in /metrics; per-request lines only on demand
+        if self.access_log:
+            print(f"[INFO] {self.address_string()} {fmt % args}", file=sys.stderr)
+
+
+def make_server(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, service: PredictionService = None,
+                access_log: bool = False):
+    """Build (but do not start) the HTTP server around a started service."""
+    service = service or PredictionService().start()
+    handler = type("BoundHandler", (Handler,), {"service": service, "access_log": access_log})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local HTTP prediction service")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="Bind address (default: localhost only)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=max(0, (os.cpu_count() or 1) - 1),
+                        help="Prediction processes (0 = threads in this process)")
+    parser.add_argument("--mc-tolerance", type=float, default=None, help="Default Monte Carlo CI half-width")
+    parser.add_argument("--access-log", action="store_true", help="Log every request to stderr")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    metrics.start_from_env()
+    service = PredictionService(args.workers, args.mc_tolerance).start()
+    server = make_server(args.host, args.port, service, args.access_log)
+    print(f"[INFO] Serving on http://{args.host}:{args.port} "
+          f"(engine ready in {time.perf_counter() - t0:.1f}s, workers={args.workers})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
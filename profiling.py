@@ -0,0 +1,255 @@
+"""
+Mundialista AI - Profiling Hooks
+Opt-in profiling for a whole CLI run, written as flamegraph-ready collapsed
+stacks plus a top-N summary.
+
+Modes:
+    sample    stdlib sampling profiler: a background thread records the
+              stacks of the profiled threads every PROFILE_CONFIG["INTERVAL"]
+              seconds. Low overhead, exact stacks. (default)
+    cprofile  deterministic cProfile; also writes a .prof for snakeviz or
+              pstats. Collapsed stacks are rebuilt from the caller graph,
+              so shared callees are split in proportion to their callers.
+
+Enable with --profile on predict.py / content_batch.py / content_automation.py
+/ update_rankings.py / star_player_builder.py, or for any of them with
+
+    MUNDIALISTA_PROFILE=1 | sample | cprofile
+    MUNDIALISTA_PROFILE_DIR=profiles     (default)
+
+Output, per run, in the profiles directory:
+    <name>_<timestamp>.collapsed   "a;b;c 42" lines (flamegraph.pl, speedscope, inferno)
+    <name>_<timestamp>.txt         top-N functions by self and total time
+    <name>_<timestamp>.prof        cProfile mode only
+
+Process pools are not followed: profile batch jobs with --workers 1.
+
+Usage:
+    python predict.py --batch fixtures.csv --profile -o out.jsonl
+    MUNDIALISTA_PROFILE=cprofile python update_rankings.py --elo
+    flamegraph.pl profiles/predict_*.collapsed > flame.svg
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+# ──────────────────────────────────────────────
+#  CONFIGURATION
+# ──────────────────────────────────────────────
+
+PROFILE_CONFIG = {
+    "DIR": os.environ.get("MUNDIALISTA_PROFILE_DIR", "profiles"),
+    "INTERVAL": 0.005,        # seconds between samples
+    "TOP_N": 30,
+    "MAX_DEPTH": 200,         # frames kept per sampled / rebuilt stack
+    "MIN_SHARE": 1e-4,        # cProfile paths under this share of the run are dropped
+}
+
+MODES = ("sample", "cprofile")
+
+
+def requested_mode(flag: bool = False) -> str:
+    """Mode asked for by a --profile flag or MUNDIALISTA_PROFILE, else None."""
+    env = os.environ.get("MUNDIALISTA_PROFILE", "").strip().lower()
+    if env in MODES:
+        return env
+    if flag or "--profile" in sys.argv or env not in ("", "0", "false", "off", "no"):
+        return "sample"
+    return None
+
+
+def _frame_label(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+# ──────────────────────────────────────────────
+#  SAMPLING PROFILER
+# ──────────────────────────────────────────────
+
+class Sampler:
+    """Collect collapsed stacks of the given threads (all threads when None)."""
+
+    def __init__(self, thread_ids=None, interval: float = None):
+        self.thread_ids = thread_ids
+        self.interval = interval or PROFILE_CONFIG["INTERVAL"]
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        own = threading.get_ident()
+        max_depth = PROFILE_CONFIG["MAX_DEPTH"]
+        for tid, frame in sys._current_frames().items():
+            if tid == own or (self.thread_ids is not None and tid not in self.thread_ids):
+                continue
+            stack = []
+            while frame is not None and len(stack) < max_depth:
+                stack.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+        self.samples += 1
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="profiler-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def collapsed(self) -> Counter:
+        return self.stacks
+
+
+# ──────────────────────────────────────────────
+#  cPROFILE -> COLLAPSED STACKS
+# ──────────────────────────────────────────────
+
+def _pstats_label(func) -> str:
+    filename, line, name = func
+    return f"{name} ({os.path.basename(filename)}:{line})" if line else name
+
+
+def collapse_pstats(stats, unit: float = 1e-6) -> Counter:
+    """
+    Collapsed stacks (weights in microseconds) rebuilt from a pstats call
+    graph: each caller -> callee edge passes down its share of the callee's
+    time, self time is kept at every node, recursion is cut at the first repeat
+    and paths below MIN_SHARE of the total are dropped (the number of paths
+    through a call graph grows exponentially otherwise).
+    """
+    raw = stats.stats
+    children = {}
+    for callee, (_, _, _, ct, callers) in raw.items():
+        for caller, edge in callers.items():
+            children.setdefault(caller, []).append((callee, edge[3]))
+    roots = [f for f, v in raw.items() if not v[4]]
+    out = Counter()
+    max_depth = PROFILE_CONFIG["MAX_DEPTH"]
+    min_share = PROFILE_CONFIG["MIN_SHARE"] * sum(raw[r][3] for r in roots)
+
+    def walk(func, share, path, on_path):
+        _, _, tt, ct, _ = raw[func]
+        label = path + [_pstats_label(func)]
+        if ct <= 0 or share < min_share:
+            return
+        scale = share / ct
+        weight = int(round(tt * scale / unit))
+        if weight > 0:
+            out[";".join(label)] += weight
+        if len(label) >= max_depth:
+            return
+        for callee, edge_ct in children.get(func, ()):
+            if callee in on_path or callee not in raw:
+                continue
+            walk(callee, edge_ct * scale, label, on_path | {callee})
+
+    for root in roots:
+        walk(root, raw[root][3], [], {root})
+    return out
+
+
+# ──────────────────────────────────────────────
+#  REPORTS
+# ──────────────────────────────────────────────
+
+def top_functions(collapsed: Counter, n: int = None) -> tuple:
+    """([(func, self weight)], [(func, total weight)]) from collapsed stacks, top n each."""
+    n = n or PROFILE_CONFIG["TOP_N"]
+    self_w, total_w = Counter(), Counter()
+    for stack, weight in collapsed.items():
+        frames = stack.split(";")
+        self_w[frames[-1]] += weight
+        for func in set(frames):
+            total_w[func] += weight
+    return self_w.most_common(n), total_w.most_common(n)
+
+
+def write_collapsed(collapsed: Counter, path: Path):
+    with open(path, "w", encoding="utf-8") as f:
+        for stack, weight in sorted(collapsed.items()):
+            f.write(f"{stack} {weight}\n")
+
+
+def format_top(collapsed: Counter, unit: str, header: str, n: int = None) -> str:
+    by_self, by_total = top_functions(collapsed, n)
+    grand = sum(collapsed.values()) or 1
+    lines = [header, ""]
+    for title, rows in (("Top functions by self time", by_self), ("Top functions by total time", by_total)):
+        lines.append(f"{title} ({unit}):")
+        for func, w in rows:
+            lines.append(f"  {w:>12,}  {100 * w / grand:5.1f}%  {func}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+# ──────────────────────────────────────────────
+#  ENTRY POINT
+# ──────────────────────────────────────────────
+
+@contextmanager
+def profiled(name: str, mode: str = None, all_threads: bool = False, out_dir=None):
+    """
+    Profile the enclosed block when mode is set (see requested_mode()).
+    all_threads samples worker threads too (sample mode; cProfile only
+    sees the calling thread). Yields the output path stem, or None when off.
+    """
+    if mode is None:
+        yield None
+        return
+    if mode not in MODES:
+        raise ValueError(f"Unknown profile mode {mode!r}; use one of {MODES}")
+
+    out_dir = Path(out_dir or PROFILE_CONFIG["DIR"])
+    out_dir.mkdir(parents=True, exist_ok=True)
+    stem = out_dir / f"{name}_{datetime.now():%Y%m%d_%H%M%S}"
+    t0 = time.perf_counter()
+
+    if mode == "cprofile":
+        import cProfile
+        import pstats
+
+        prof = cProfile.Profile()
+        prof.enable()
+        try:
+            yield stem
+        finally:
+            prof.disable()
+            wall = time.perf_counter() - t0
+            prof.dump_stats(f"{stem}.prof")
+            stats = pstats.Stats(prof)
+            collapsed = collapse_pstats(stats)
+            header = f"{name}: cProfile, {wall:.2f}s wall, {stats.total_calls:,} calls"
+            _write_outputs(stem, collapsed, "us", header)
+    else:
+        sampler = Sampler(None if all_threads else {threading.get_ident()})
+        sampler.start()
+        try:
+            yield stem
+        finally:
+            sampler.stop()
+            wall = time.perf_counter() - t0
+            header = (f"{name}: sampled every {sampler.interval * 1000:.0f} ms, "
+                      f"{sampler.samples:,} samples, {wall:.2f}s wall")
+            _write_outputs(stem, sampler.collapsed(), "samples", header)
+
+
+def _write_outputs(stem: Path, collapsed: Counter, unit: str, header: str):
+    write_collapsed(collapsed, Path(f"{stem}.collapsed"))
+    report = format_top(collapsed, unit, header)
+    Path(f"{stem}.txt").write_text(report, encoding="utf-8")
+    print(f"[INFO] Profile written: {stem}.collapsed, {stem}.txt", file=sys.stderr)
+    print("\n".join(report.splitlines()[:14]), file=sys.stderr)
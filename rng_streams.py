@@ -0,0 +1,85 @@
+"""
+Mundialista AI - RNG Streams
+Deterministic, parallel-safe random streams for every simulation.
+
+Each stream is derived from (seed, key) through numpy's SeedSequence, so a
+fixture always receives the same draws no matter which process, thread or
+worker handles it, and no matter how the work is split across cores.
+
+Usage:
+    from rng_streams import get_generator, shard_generator
+
+    rng = get_generator("predict", "Argentina", "Brazil", None)
+    for shard in range(n_shards):          # any subset, any order, any worker
+        rng = shard_generator(shard, "tournament", run_id)
+"""
+
+import hashlib
+import os
+
+import numpy as np
+
+# ──────────────────────────────────────────────
+#  CONFIGURATION
+# ──────────────────────────────────────────────
+
+RNG_CONFIG = {
+    "SEED": int(os.environ.get("MUNDIALISTA_SEED", 20260611)),
+    "SHARD_SIZE": 10_000,      # draws per shard for split simulations
+}
+
+
+def set_seed(seed: int):
+    """Change the root seed (call in worker initializers for spawn-based pools)."""
+    RNG_CONFIG["SEED"] = int(seed)
+
+
+# ──────────────────────────────────────────────
+#  STREAM DERIVATION
+# ──────────────────────────────────────────────
+
+def _key_words(key: tuple) -> tuple:
+    """Hash a key of strings/ints/None into stable 32-bit words (unlike hash())."""
+    text = "\x1f".join("" if k is None else str(k) for k in key)
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+    return tuple(int.from_bytes(digest[i:i + 4], "little") for i in range(0, 16, 4))
+
+
+def seed_sequence(*key, seed: int = None) -> np.random.SeedSequence:
+    """SeedSequence for a key such as ("predict", team_a, team_b, home)."""
+    if seed is None:
+        seed = RNG_CONFIG["SEED"]
+    return np.random.SeedSequence(seed, spawn_key=_key_words(key))
+
+
+def get_generator(*key, seed: int = None) -> np.random.Generator:
+    """Independent Generator for a fixture or job key."""
+    return np.random.Generator(np.random.PCG64(seed_sequence(*key, seed=seed)))
+
+
+def spawn_generators(n: int, *key, seed: int = None) -> list:
+    """n independent child streams of a key, via SeedSequence.spawn."""
+    children = seed_sequence(*key, seed=seed).spawn(n)
+    return [np.random.Generator(np.random.PCG64(ss)) for ss in children]
+
+
+def shard_generator(shard: int, *key, seed: int = None) -> np.random.Generator:
+    """
+    Stream for one shard of a split simulation.
+
+    Identical to spawn_generators(n, *key)[shard] for any n > shard, so a
+    worker can build its shards without knowing how the rest were assigned.
+    """
+    parent = seed_sequence(*key, seed=seed)
+    child = np.random.SeedSequence(parent.entropy, spawn_key=parent.spawn_key + (int(shard),))
+    return np.random.Generator(np.random.PCG64(child))
+
+
+def shard_ranges(n_total: int, shard_size: int = None) -> list:
+    """Split n_total draws into fixed-size (shard, start, stop) ranges."""
+    if shard_size is None:
+        shard_size = RNG_CONFIG["SHARD_SIZE"]
+    return [
+        (i, start, min(start + shard_size, n_total))
+        for i, start in enumerate(range(0, n_total, shard_size))
+    ]
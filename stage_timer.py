@@ -0,0 +1,209 @@
+"""
+Mundialista AI - Stage Timers
+Per-stage wall-clock timing for predict(), analyze_match, group simulation
+and chart generation, aggregated into in-process histograms.
+
+Off by default. When off, stage() and timed_call() hand back one shared no-op
+context manager, so an instrumented call costs a flag check and nothing else.
+
+Enable with the environment variable
+
+    MUNDIALISTA_TIMINGS=1        histograms only
+    MUNDIALISTA_TIMINGS=attach   histograms + a "timings" dict on each result
+
+or at run time with stage_timer.enable(attach=...).
+
+Usage:
+    import stage_timer
+    stage_timer.enable(attach=True)
+    result = predict("Argentina", "France")
+    result["timings"]                  # {"predict.team_stats": 81.2, ...} in ms
+    stage_timer.snapshot()             # {stage: {count, mean_ms, p50_ms, p95_ms, ...}}
+    print(stage_timer.format_table())
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager, nullcontext
+
+# ──────────────────────────────────────────────
+#  CONFIGURATION
+# ──────────────────────────────────────────────
+
+_ENV = os.environ.get("MUNDIALISTA_TIMINGS", "").strip().lower()
+
+TIMING_CONFIG = {
+    "ENABLED": _ENV not in ("", "0", "false", "off", "no"),
+    "ATTACH": _ENV == "attach",       # add result["timings"] to instrumented results
+    # Histogram bucket upper bounds (ms); the last bucket is +Inf
+    "BUCKETS_MS": (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50,
+                   100, 250, 500, 1000, 2500, 5000, 10000),
+}
+
+_NOOP = nullcontext()
+
+
+def enable(on: bool = True, attach: bool = None):
+    """Turn timing on or off; attach=True also adds "timings" to results."""
+    TIMING_CONFIG["ENABLED"] = bool(on)
+    if attach is not None:
+        TIMING_CONFIG["ATTACH"] = bool(attach)
+
+
+def enabled() -> bool:
+    return TIMING_CONFIG["ENABLED"]
+
+
+# ──────────────────────────────────────────────
+#  HISTOGRAMS
+# ──────────────────────────────────────────────
+
+class Histogram:
+    """Fixed-bucket latency histogram (ms) with count, sum, min and max."""
+
+    def __init__(self, bounds=None):
+        self.bounds = tuple(bounds or TIMING_CONFIG["BUCKETS_MS"])
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def observe(self, ms: float):
+        self.counts[bisect_left(self.bounds, ms)] += 1
+        self.count += 1
+        self.total += ms
+        if ms < self.min:
+            self.min = ms
+        if ms > self.max:
+            self.max = ms
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th observation (capped at max)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(self.bounds, self.counts):
+            seen += n
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def summary(self) -> dict:
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "total_ms": round(self.total, 3),
+            "mean_ms": round(self.total / self.count, 3),
+            "min_ms": round(self.min, 3),
+            "max_ms": round(self.max, 3),
+            "p50_ms": round(self.quantile(0.50), 3),
+            "p95_ms": round(self.quantile(0.95), 3),
+            "p99_ms": round(self.quantile(0.99), 3),
+            "buckets": {("+Inf" if i == len(self.bounds) else str(self.bounds[i])): n
+                        for i, n in enumerate(self.counts)},
+        }
+
+
+_LOCK = threading.Lock()
+_HISTOGRAMS = {}
+_LOCAL = threading.local()
+
+
+def observe(name: str, ms: float):
+    """Add one timing to the named histogram and to the innermost open timed_call()."""
+    with _LOCK:
+        hist = _HISTOGRAMS.get(name)
+        if hist is None:
+            hist = _HISTOGRAMS[name] = Histogram()
+        hist.observe(ms)
+    stack = getattr(_LOCAL, "records", None)
+    if stack:
+        current = stack[-1]
+        current[name] = current.get(name, 0.0) + ms
+
+
+def histogram(name: str) -> Histogram:
+    return _HISTOGRAMS.get(name)
+
+
+def snapshot() -> dict:
+    """{stage: summary} for every stage seen since start-up or reset()."""
+    with _LOCK:
+        return {name: hist.summary() for name, hist in sorted(_HISTOGRAMS.items())}
+
+
+def reset():
+    with _LOCK:
+        _HISTOGRAMS.clear()
+
+
+def format_table(stats: dict = None) -> str:
+    stats = snapshot() if stats is None else stats
+    lines = [f"  {'stage':<28}{'count':>7}{'mean':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}"]
+    for name, s in stats.items():
+        if s.get("count"):
+            lines.append(f"  {name:<28}{s['count']:>7}{s['mean_ms']:>10.2f}{s['p50_ms']:>10.2f}"
+                         f"{s['p95_ms']:>10.2f}{s['p99_ms']:>10.2f}{s['max_ms']:>10.2f}")
+    lines.append("  (ms; percentiles are histogram bucket bounds)")
+    return "\n".join(lines)
+
+
+# ──────────────────────────────────────────────
+#  TIMERS
+# ──────────────────────────────────────────────
+
+@contextmanager
+def _timed(name: str):
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, (time.perf_counter() - t0) * 1000)
+
+
+def stage(name: str):
+    """Context manager timing one stage; a shared no-op when timing is off."""
+    if not TIMING_CONFIG["ENABLED"]:
+        return _NOOP
+    return _timed(name)
+
+
+@contextmanager
+def _collecting(name: str):
+    stack = getattr(_LOCAL, "records", None)
+    if stack is None:
+        stack = _LOCAL.records = []
+    timings = {}
+    stack.append(timings)
+    t0 = time.perf_counter()
+    try:
+        yield timings
+    finally:
+        total = (time.perf_counter() - t0) * 1000
+        stack.pop()
+        observe(name, total)
+        if stack:
+            outer = stack[-1]
+            for key, ms in timings.items():
+                outer[key] = outer.get(key, 0.0) + ms
+        for key in timings:
+            timings[key] = round(timings[key], 3)
+        timings[name] = round(total, 3)
+
+
+def timed_call(name: str):
+    """
+    Time a whole call as `name`. Yields the dict that collects this thread's
+    stage timings when ATTACH is on (for result["timings"]), otherwise None.
+    A nested timed_call adds its total and its stages to the call around it.
+    """
+    if not TIMING_CONFIG["ENABLED"]:
+        return _NOOP
+    if not TIMING_CONFIG["ATTACH"]:
+        return _timed(name)
+    return _collecting(name)
@@ -343,26 +343,29 @@ def print_team_report(star_dict, team):
 
 
 if __name__ == "__main__":
-    print("=" * 60)
-    print("  MUNDIALISTA AI — Star Player Builder")
-    print("=" * 60)
-    print()
+    from profiling import profiled, requested_mode
 
-    star_dict = build_star_players(verbose=True)
+    with profiled("star_player_builder", requested_mode()):
+        print("=" * 60)
+        print("  MUNDIALISTA AI — Star Player Builder")
+        print("=" * 60)
+        print()
+
+        star_dict = build_star_players(verbose=True)
 
-    save_star_players(star_dict)
+        save_star_players(star_dict)
 
-    print_top_stars(star_dict, top_n=30)
+        print_top_stars(star_dict, top_n=30)
 
-    print()
-    print("=" * 60)
-    print("  KEY TEAM REPORTS")
-    print("=" * 60)
-    for team in ["Argentina", "France", "Brazil", "England", "Spain",
-                 "Germany", "Portugal", "Netherlands", "Norway", "Sweden",
-                 "United States", "Mexico", "Morocco", "Japan"]:
-        print_team_report(star_dict, team)
+        print()
+        print("=" * 60)
+        print("  KEY TEAM REPORTS")
+        print("=" * 60)
+        for team in ["Argentina", "France", "Brazil", "England", "Spain",
+                     "Germany", "Portugal", "Netherlands", "Norway", "Sweden",
+                     "United States", "Mexico", "Morocco", "Japan"]:
+            print_team_report(star_dict, team)
 
-    print()
-    print("Done! prediction_engine.py v7 will auto-load data/star_players.json")
-    print("   Re-run anytime to update ratings with latest match data.")
+        print()
+        print("Done! prediction_engine.py v7 will auto-load data/star_players.json")
+        print("   Re-run anytime to update ratings with latest match data.")
@@ -0,0 +1,162 @@
+"""
+Mundialista AI - Engine tests
+Checks the fast paths against the straightforward code they replaced:
+the scoreline sampler, the H2H index, the sampler cache and the
+prediction cube's rebuild-on-stale.
+
+    python -m pytest -q tests
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import prediction_cube
+import prediction_engine as pe
+
+
+@pytest.fixture(scope="module")
+def store():
+    data = pe.DataStore()
+    _ = data.results, data.h2h
+    return data
+
+
+# ──────────────────────────────────────────────
+#  SCORELINE SAMPLER
+# ──────────────────────────────────────────────
+
+def test_sampler_frequencies_converge_to_grid():
+    matrix = pe.build_score_matrix(1.4, 0.9)
+    n = 400_000
+    goals_a, goals_b = pe.ScorelineSampler(matrix).sample(n, np.random.default_rng(11))
+
+    freq = np.zeros_like(matrix)
+    np.add.at(freq, (goals_a, goals_b), 1)
+    freq /= n
+    probs = matrix / matrix.sum()
+    # ~4 standard errors of the largest cell
+    assert np.abs(freq - probs).max() < 4 * np.sqrt(probs.max() / n)
+
+
+def test_sampler_matches_generator_choice():
+    matrix = pe.build_score_matrix(2.1, 0.6)
+    goals_a, goals_b = pe.ScorelineSampler(matrix).sample(50_000, np.random.default_rng(3))
+    idx = np.random.default_rng(3).choice(matrix.size, size=50_000, p=(matrix / matrix.sum()).ravel())
+    assert np.array_equal(goals_a, idx // matrix.shape[1])
+    assert np.array_equal(goals_b, idx % matrix.shape[1])
+
+
+# ──────────────────────────────────────────────
+#  H2H INDEX
+# ──────────────────────────────────────────────
+
+def _h2h_filter(df: pd.DataFrame, team_a: str, team_b: str, last_n: int = None) -> dict:
+    """The DataFrame filter the index replaced."""
+    home, away = df["home_team"].astype(object), df["away_team"].astype(object)
+    mask = ((home == team_a) & (away == team_b)) | ((home == team_b) & (away == team_a))
+    games = df[mask].dropna(subset=["home_score", "away_score"])
+    if last_n is not None:
+        games = games.tail(last_n)
+    a_home = games["home_team"].astype(object) == team_a
+    goals_a = np.where(a_home, games["home_score"], games["away_score"])
+    goals_b = np.where(a_home, games["away_score"], games["home_score"])
+    return {
+        "matches": len(games),
+        "wins_a": int((goals_a > goals_b).sum()),
+        "draws": int((goals_a == goals_b).sum()),
+        "wins_b": int((goals_a < goals_b).sum()),
+        "goals_a": int(goals_a.sum()),
+        "goals_b": int(goals_b.sum()),
+        "rows": list(df.index.get_indexer(games.index)),
+    }
+
+
+@pytest.mark.parametrize("team_a, team_b", [
+    ("Argentina", "Brazil"),
+    ("Brazil", "Argentina"),
+    ("England", "Scotland"),
+    ("Germany", "Netherlands"),
+    ("Brazil", "Tahiti"),
+    ("Brazil", "Nowhere United"),
+])
+@pytest.mark.parametrize("last_n", [None, 1, 5, 10_000])
+def test_h2h_lookup_matches_dataframe_filter(store, team_a, team_b, last_n):
+    got = store.h2h.lookup(team_a, team_b, last_n)
+    got["rows"] = list(got["rows"])
+    assert got == _h2h_filter(store.results, team_a, team_b, last_n)
+
+
+def test_h2h_index_follows_appended_results():
+    data = pe.DataStore()
+    _ = data.h2h
+    latest = data.results["date"].max()
+    data.append_results(pd.DataFrame([
+        {"date": latest + pd.Timedelta(days=1), "home_team": "Brazil", "away_team": "Argentina",
+         "home_score": 2, "away_score": 1, "tournament": "Friendly", "neutral": True},
+        # older than the loaded data: forces the re-sort + rebuild path
+        {"date": pd.Timestamp("1990-01-01"), "home_team": "Argentina", "away_team": "Brazil",
+         "home_score": 0, "away_score": 0, "tournament": "Friendly", "neutral": False},
+    ]))
+    for last_n in (None, 3):
+        got = data.h2h.lookup("Argentina", "Brazil", last_n)
+        got["rows"] = list(got["rows"])
+        assert got == _h2h_filter(data.results, "Argentina", "Brazil", last_n)
+
+
+# ──────────────────────────────────────────────
+#  SAMPLER CACHE
+# ──────────────────────────────────────────────
+
+def test_sampler_cache_invalidated_by_data_version(monkeypatch):
+    data = pe.DataStore()
+    _ = data.results
+    monkeypatch.setattr(pe, "_data", data)
+    monkeypatch.setattr(pe, "_SAMPLER_CACHE", {})
+
+    matrix = pe.build_score_matrix(1.2, 1.1)
+    key = ("Argentina", "Brazil", None)
+    first = pe.get_sampler(matrix, key)
+    assert pe.get_sampler(matrix, key) is first
+
+    version = data.version
+    data.append_results(pd.DataFrame([{
+        "date": data.results["date"].max() + pd.Timedelta(days=1),
+        "home_team": "Argentina", "away_team": "Brazil",
+        "home_score": 1, "away_score": 1, "tournament": "Friendly", "neutral": True,
+    }]))
+    assert data.version != version
+    assert pe.get_sampler(matrix, key) is not first
+
+
+# ──────────────────────────────────────────────
+#  PREDICTION CUBE
+# ──────────────────────────────────────────────
+
+TEAMS = ["Argentina", "Brazil", "France"]
+
+
+def test_cube_rebuilds_on_fingerprint_mismatch(tmp_path, monkeypatch):
+    cube = prediction_cube.load_cube(tmp_path, TEAMS)
+    assert prediction_cube.cube_is_fresh(tmp_path, TEAMS)
+    built = cube.fingerprint
+
+    # New data: the stored fingerprint no longer matches
+    monkeypatch.setattr(prediction_cube, "data_fingerprint", lambda: "changed-data")
+    assert not prediction_cube.cube_is_fresh(tmp_path, TEAMS)
+    with pytest.raises(FileNotFoundError):
+        prediction_cube.load_cube(tmp_path, TEAMS, rebuild=False)
+
+    rebuilt = prediction_cube.load_cube(tmp_path, TEAMS)
+    assert rebuilt.fingerprint != built
+    assert rebuilt.fingerprint == prediction_cube.cube_fingerprint(TEAMS)
+    assert json.loads((tmp_path / "meta.json").read_text(encoding="utf-8"))["fingerprint"] == rebuilt.fingerprint
+
+
+def test_cube_rebuilds_on_team_list_change(tmp_path):
+    prediction_cube.load_cube(tmp_path, TEAMS)
+    assert not prediction_cube.cube_is_fresh(tmp_path, TEAMS[:2])
+    cube = prediction_cube.load_cube(tmp_path, TEAMS[:2])
+    assert cube.teams == TEAMS[:2]
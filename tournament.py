@@ -0,0 +1,206 @@
+"""
+Mundialista AI - Tournament Simulator
+Group pricing and the most likely knockout bracket for World Cup 2026.
+
+Every fixture is read from the prediction cube, so a group (six fixtures)
+is priced with one vectorized lookup and a whole knockout round with one
+call to the engine's knockout_probs(). Groups run on a thread pool and
+run_tournament() yields results as they finish: the 12 groups first, then
+each knockout round.
+
+The bracket is seeded, not the official FIFA draw path: the 12 winners,
+12 runners-up and 8 best third-placed teams are ranked by position and
+expected points, then paired 1 v 32, 2 v 31, ... so top seeds meet late.
+
+Usage:
+    from prediction_cube import load_cube
+    from tournament import price_group, run_tournament
+
+    cube = load_cube()
+    price_group(cube, "A")
+    for round_name, name, payload in run_tournament(cube):
+        ...
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import combinations
+
+from coaches import get_coach_data
+from content_automation import WC2026_GROUPS, resolve_team_name
+from prediction_engine import DATA_DIR, knockout_probs, shootout_team_index, shootout_win_prob
+from stage_timer import stage
+
+ROUNDS = ("Round of 32", "Round of 16", "Quarter-finals", "Semi-finals", "Final")
+
+N_BEST_THIRDS = 8
+
+
+# ──────────────────────────────────────────────
+#  GROUP STAGE
+# ──────────────────────────────────────────────
+
+def price_group(cube, group_letter: str) -> dict:
+    """Expected standings and per-fixture odds for one group (neutral venue)."""
+    group_letter = group_letter.upper()
+    display_teams = WC2026_GROUPS[group_letter]
+    data_teams = [resolve_team_name(t) for t in display_teams]
+    pairs = list(combinations(range(len(display_teams)), 2))
+
+    with stage("price_group.lookup"):
+        idx = [cube.index[t] for t in data_teams]
+        fx = cube.batch([idx[i] for i, _ in pairs], [idx[j] for _, j in pairs])
+        coaches = [get_coach_data(t, DATA_DIR) for t in data_teams]
+
+    points = {t: 0.0 for t in display_teams}
+    gd = {t: 0.0 for t in display_teams}
+    gf_tot = {t: 0.0 for t in display_teams}
+    ga_tot = {t: 0.0 for t in display_teams}
+    matches = []
+
+    for k, (i, j) in enumerate(pairs):
+        h, a = display_teams[i], display_teams[j]
+        hw, dr, aw = (float(x) for x in fx["wdl"][k])
+        hxg, axg = (float(x) for x in fx["lambdas"][k])
+
+        points[h] += hw * 3 + dr
+        points[a] += aw * 3 + dr
+        gd[h] += hxg - axg
+        gd[a] += axg - hxg
+        gf_tot[h] += hxg
+        gf_tot[a] += axg
+        ga_tot[h] += axg
+        ga_tot[a] += hxg
+
+        matches.append({
+            "home": h,
+            "away": a,
+            "home_win": round(100 * hw, 1),
+            "draw": round(100 * dr, 1),
+            "away_win": round(100 * aw, 1),
+            "home_xg": hxg,
+            "away_xg": axg,
+            "top_score": fx["top_score"][k],
+            "top_score_pct": round(100 * float(fx["top_score_prob"][k]), 1),
+            "home_coach": coaches[i]["name"],
+            "away_coach": coaches[j]["name"],
+            "home_coach_tier": coaches[i]["tier"],
+            "away_coach_tier": coaches[j]["tier"],
+        })
+
+    standings = sorted(display_teams, key=lambda t: (points[t], gd[t], gf_tot[t]), reverse=True)
+    return {
+        "group": group_letter,
+        "standings": standings,
+        "points": points,
+        "gd": gd,
+        "gf": gf_tot,
+        "ga": ga_tot,
+        "matches": matches,
+    }
+
+
+def price_all_groups(cube, executor: ThreadPoolExecutor = None):
+    """Yield (group_letter, result) as each group finishes on the pool."""
+    own_pool = executor is None
+    if own_pool:
+        executor = ThreadPoolExecutor(max_workers=4)
+    try:
+        futures = {executor.submit(price_group, cube, g): g for g in sorted(WC2026_GROUPS)}
+        for fut in as_completed(futures):
+            yield futures[fut], fut.result()
+    finally:
+        if own_pool:
+            executor.shutdown(wait=False)
+
+
+# ──────────────────────────────────────────────
+#  KNOCKOUT BRACKET
+# ──────────────────────────────────────────────
+
+def _bracket_order(n: int) -> list:
+    """Seed positions so seed 1 and seed 2 can only meet in the final."""
+    order = [1]
+    while len(order) < n:
+        size = 2 * len(order)
+        order = [s for seed in order for s in (seed, size + 1 - seed)]
+    return order
+
+
+def seed_qualifiers(groups: dict) -> list:
+    """32 qualifiers ordered by seed (winners, runners-up, best thirds)."""
+    def strength(res, team):
+        return (res["points"][team], res["gd"][team], res["gf"][team])
+
+    tiers = []
+    for pos in range(3):
+        tier = sorted(
+            ((strength(res, res["standings"][pos]), res["standings"][pos]) for res in groups.values()),
+            reverse=True,
+        )
+        tiers.append([team for _, team in tier])
+    tiers[2] = tiers[2][:N_BEST_THIRDS]
+    return tiers[0] + tiers[1] + tiers[2]
+
+
+def play_round(cube, teams: list) -> list:
+    """Resolve one knockout round (adjacent pairs) with one set of array ops."""
+    data_teams = [resolve_team_name(t) for t in teams]
+    team_a, team_b = data_teams[0::2], data_teams[1::2]
+    fx = cube.batch([cube.index[t] for t in team_a], [cube.index[t] for t in team_b])
+    pen_a = shootout_win_prob(shootout_team_index(team_a), shootout_team_index(team_b))
+    ko = knockout_probs(fx["wdl"][:, 0], fx["wdl"][:, 1], fx["wdl"][:, 2],
+                        fx["lambdas"][:, 0], fx["lambdas"][:, 1], pen_a)
+
+    ties = []
+    for k in range(len(team_a)):
+        a, b = teams[2 * k], teams[2 * k + 1]
+        p_a = float(ko["team_a_advance"][k])
+        ties.append({
+            "team_a": a,
+            "team_b": b,
+            "team_a_advance": round(100 * p_a, 1),
+            "team_b_advance": round(100 * float(ko["team_b_advance"][k]), 1),
+            "penalties": round(100 * float(ko["team_a_win_pens"][k] + ko["team_b_win_pens"][k]), 1),
+            "top_score": fx["top_score"][k],
+            "winner": a if p_a >= 0.5 else b,
+        })
+    return ties
+
+
+def run_tournament(cube, executor: ThreadPoolExecutor = None):
+    """
+    Stream the whole tournament.
+
+    Yields ("group", letter, group_result) for each group as it completes,
+    then ("knockout", round_name, ties) for each round down to the final.
+    """
+    groups = {}
+    for letter, result in price_all_groups(cube, executor):
+        groups[letter] = result
+        yield "group", letter, result
+
+    seeded = seed_qualifiers(groups)
+    order = _bracket_order(len(seeded))
+    teams = [seeded[s - 1] for s in order]
+    for name in ROUNDS:
+        ties = play_round(cube, teams)
+        yield "knockout", name, ties
+        teams = [t["winner"] for t in ties]
+
+
+if __name__ == "__main__":
+    import time
+
+    from prediction_cube import load_cube
+
+    t0 = time.perf_counter()
+    wc_cube = load_cube()
+    for round_name, name, payload in run_tournament(wc_cube):
+        if round_name == "group":
+            print(f"  Group {name}: {', '.join(payload['standings'][:2])}")
+        else:
+            print(f"\n  {name}")
+            for tie in payload:
+                print(f"    {tie['team_a']:<22s} {tie['team_a_advance']:5.1f}%  v  "
+                      f"{tie['team_b_advance']:5.1f}%  {tie['team_b']:<22s} -> {tie['winner']}")
+    print(f"\n  Done in {time.perf_counter() - t0:.2f}s")
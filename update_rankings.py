@@ -1,5 +1,4 @@
-﻿import kagglehub
-import pandas as pd
+﻿import pandas as pd
 import numpy as np
 from pathlib import Path
 from datetime import datetime
@@ -190,8 +189,11 @@ def update_rankings(force_elo=False):
 
 
 if __name__ == "__main__":
+    from profiling import profiled, requested_mode
+
     force = "--elo" in sys.argv
-    r = update_rankings(force_elo=force)
+    with profiled("update_rankings", requested_mode()):
+        r = update_rankings(force_elo=force)
     if not r.empty:
         print("")
         print("=" * 60)
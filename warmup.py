@@ -0,0 +1,168 @@
+"""
+Mundialista AI - Background Warm-up
+Loads data and pre-predicts the World Cup group fixtures off the request path.
+
+start_warmup() returns immediately; the work runs on a thread pool:
+
+    data       results/rankings CSVs, global averages, stars, shootouts, H2H
+    coaches    coach records for every WC 2026 team
+    fixtures   predict() for each group fixture (72), once data is ready
+
+Callers that need something early wait on the matching future instead of
+loading it a second time. Stage timings and time-to-first-prediction are
+printed as [INFO] lines.
+
+Usage:
+    from warmup import start_warmup
+
+    warm = start_warmup(mc_tolerance=0.005)
+    warm.wait("data")
+    result = warm.prediction("Mexico", "South Africa") or predict(...)
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import combinations
+
+from coaches import get_coach_data
+from metrics import cache_lookup
+import prediction_engine
+from prediction_engine import DATA_DIR, data_fingerprint, predict
+
+
+def group_fixtures() -> list:
+    """The 72 group-stage fixtures as dataset-name pairs."""
+    from content_automation import WC2026_GROUPS, resolve_team_name
+
+    fixtures = []
+    for group in sorted(WC2026_GROUPS):
+        teams = [resolve_team_name(t) for t in WC2026_GROUPS[group]]
+        fixtures.extend(combinations(teams, 2))
+    return fixtures
+
+
+class Warmup:
+    """Futures for each warm-up stage plus pre-computed group predictions."""
+
+    def __init__(self, executor: ThreadPoolExecutor = None, mc_tolerance: float = None):
+        self.t0 = time.perf_counter()
+        self.data_version = data_fingerprint()
+        self.mc_tolerance = mc_tolerance
+        self.futures = {}
+        self.fixtures = {}
+        self.timings = {}
+        self._own_pool = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=2, thread_name_prefix="warmup")
+        self._first_lock = threading.Lock()
+        self._first_served = False
+        self._pending_lock = threading.Lock()
+        self._pending = 0
+
+    # ── stages ──
+
+    def _timed(self, name, fn, *args):
+        start = time.perf_counter()
+        out = fn(*args)
+        self.timings[name] = time.perf_counter() - start
+        return out
+
+    @staticmethod
+    def _load_data():
+        # Read through the module: prediction_engine.reload_data() swaps the store
+        data = prediction_engine._data
+        _ = data.results, data.rankings, data.global_avg
+        _ = data.stars, data.shootouts, data.h2h
+        return data
+
+    @staticmethod
+    def _load_coaches(teams):
+        return {t: get_coach_data(t, DATA_DIR) for t in teams}
+
+    def _predict_fixture(self, team_a, team_b):
+        self.futures["data"].result()
+        return predict(team_a, team_b, home=None, mc_tolerance=self.mc_tolerance)
+
+    def _fixture_done(self, _future=None):
+        # Count down under a lock so exactly one callback sees the last fixture finish
+        with self._pending_lock:
+            self._pending -= 1
+            if self._pending != 0:
+                return
+        self.timings["fixtures"] = time.perf_counter() - self.t0
+        print(f"[INFO] Warm-up complete: data {self.timings.get('data', 0):.2f}s, "
+              f"{len(self.fixtures)} group fixtures ready after {self.timings['fixtures']:.2f}s")
+        if self._own_pool:
+            self._executor.shutdown(wait=False)
+
+    def start(self) -> "Warmup":
+        fixtures = group_fixtures()
+        teams = sorted({t for pair in fixtures for t in pair})
+        self.futures["data"] = self._executor.submit(self._timed, "data", self._load_data)
+        self.futures["coaches"] = self._executor.submit(self._timed, "coaches", self._load_coaches, teams)
+        for team_a, team_b in fixtures:
+            self.fixtures[(team_a, team_b)] = self._executor.submit(self._predict_fixture, team_a, team_b)
+        self._pending = len(self.fixtures)
+        for fut in self.fixtures.values():
+            fut.add_done_callback(self._fixture_done)
+        return self
+
+    def cancel(self):
+        """Drop fixtures not started yet (this warm-up was superseded by newer data)."""
+        for fut in self.fixtures.values():
+            fut.cancel()
+
+    # ── access ──
+
+    def wait(self, name: str, timeout: float = None):
+        """Block until a stage ("data", "coaches") has finished; return its result."""
+        return self.futures[name].result(timeout)
+
+    @property
+    def ready(self) -> bool:
+        return all(f.done() for f in self.futures.values()) and all(f.done() for f in self.fixtures.values())
+
+    def prediction(self, team_a: str, team_b: str, home: str = None, mc_tolerance: float = None):
+        """Warmed result for a neutral group fixture (waits if in flight), else None."""
+        if home is not None or mc_tolerance != self.mc_tolerance:
+            return None
+        fut = self.fixtures.get((team_a, team_b))
+        if fut is None or fut.cancelled():
+            cache_lookup("warmup", False)
+            return None
+        try:
+            result = fut.result()
+        except Exception:
+            cache_lookup("warmup", False)
+            return None
+        cache_lookup("warmup", True)
+        return result
+
+    def record_first_prediction(self, source: str = "request"):
+        """Log time-to-first-prediction once per process."""
+        with self._first_lock:
+            if self._first_served:
+                return
+            self._first_served = True
+        elapsed = time.perf_counter() - self.t0
+        self.timings["first_prediction"] = elapsed
+        print(f"[INFO] Time to first prediction: {elapsed:.2f}s after start "
+              f"({source}, warm-up {'done' if self.ready else 'in progress'})")
+
+
+def start_warmup(executor: ThreadPoolExecutor = None, mc_tolerance: float = None) -> Warmup:
+    """Kick off the warm-up in the background and return its handle."""
+    return Warmup(executor, mc_tolerance).start()
+
+
+if __name__ == "__main__":
+    warm = start_warmup()
+    warm.wait("data")
+    print(f"[INFO] Data ready after {time.perf_counter() - warm.t0:.2f}s")
+    res = warm.prediction(*group_fixtures()[0])
+    warm.record_first_prediction("warm-up")
+    print(f"  {res['team_a']} vs {res['team_b']}: {res['team_a_win']}% / {res['draw']}% / {res['team_b_win']}%")
+    for f in warm.fixtures.values():
+        f.result()
+    time.sleep(0.1)
+    print(f"  Stage timings: { {k: round(v, 2) for k, v in warm.timings.items()} }")